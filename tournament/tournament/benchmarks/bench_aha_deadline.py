@@ -0,0 +1,50 @@
+"""Aha under a per-move time budget: latency and depth reached by game phase.
+
+Positions are grouped by phase (opening, middlegame, endgame). For each
+phase the run first reports the latency of the fixed-depth search
+(``Aha(depth=4)``), then, for each budget, the latency of the iterative
+deepening search (``tiempo_por_jugada``) and the depth it completed.
+
+Run from the project root with ``python -m benchmarks.bench_aha_deadline``.
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.positions import random_positions
+from groups.GroupA.policy import Aha
+
+PHASES = {"opening": (0, 8), "middlegame": (14, 22), "endgame": (28, 34)}
+BUDGETS = (0.05, 0.1, 0.25, 0.5)
+
+
+def timed_acts(agent: Aha, boards) -> tuple[np.ndarray, np.ndarray]:
+    """Milliseconds and depth reached of each ``act``."""
+    ms, depths = [], []
+    for board in boards:
+        agent.reset()
+        start = time.perf_counter()
+        agent.act(board)
+        ms.append((time.perf_counter() - start) * 1e3)
+        depths.append(agent.search_stats()["depth"])
+    return np.asarray(ms), np.asarray(depths)
+
+
+def main(n_positions: int = 8) -> None:
+    print(f"{'phase':<12}{'search':<22}{'mean ms':>9}{'max ms':>9}{'depth min':>11}{'mean':>7}{'max':>6}")
+    for phase, (low, high) in PHASES.items():
+        boards = [s.board for s in random_positions(n_positions, min_moves=low, max_moves=high)]
+        searches = {"depth=4": Aha(depth=4, poda_alfa_beta=True, tabla_mb=16)}
+        for budget in BUDGETS:
+            searches[f"budget {budget * 1e3:.0f} ms"] = Aha(poda_alfa_beta=True, tabla_mb=16, tiempo_por_jugada=budget)
+        for name, agent in searches.items():
+            ms, depths = timed_acts(agent, boards)
+            print(
+                f"{phase:<12}{name:<22}{ms.mean():>9.1f}{ms.max():>9.1f}"
+                f"{depths.min():>11}{depths.mean():>7.1f}{depths.max():>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
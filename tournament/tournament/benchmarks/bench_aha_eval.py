@@ -0,0 +1,126 @@
+"""Aha's static evaluation: per-leaf cost of the three implementations.
+
+- ``two scans``: the evaluation before, one ``count_open_threes`` per player;
+- ``one pass``: ``lines.open_three_counts``, both players from one sum per line;
+- ``incremental``: ``EvaluadorIncremental``, updated on every push and pop.
+
+The three are first checked to give identical scores on every position of
+random games and on each of its children, reached by push and undone by pop
+(the run exits with status 1 otherwise). The incremental
+evaluator is timed per push/pop pair plus the score, the price paid for each
+leaf of a push/pop search. The last table gives whole ``act`` calls of the
+push/pop searches with the incremental evaluator off and on.
+
+Run from the project root with ``python -m benchmarks.bench_aha_eval``.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.positions import random_positions
+from connect4 import lines
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha, EvaluadorIncremental
+
+
+def two_scans(state: ConnectState) -> int:
+    """The evaluation before, kept as reference."""
+    score = lines.count_open_threes(state.board, state.player) * 10
+    score -= lines.count_open_threes(state.board, -state.player) * 10
+    return score + int(np.sum(state.board[:, 3] == state.player)) * 3
+
+
+def check(n_games: int = 200, seed: int = 911) -> int:
+    """Mismatches between the three evaluations on every child of every position of random games."""
+    rng = np.random.default_rng(seed)
+    agent = Aha()
+    mismatches = 0
+
+    def compare(state: ConnectState, evaluator: EvaluadorIncremental) -> int:
+        if state.is_final():
+            return 0
+        reference = two_scans(state)
+        agent.evaluador = None
+        return int(agent.evaluate(state) != reference) + int(evaluator.puntaje(state.player) != reference)
+
+    for _ in range(n_games):
+        state = ConnectState()
+        evaluator = EvaluadorIncremental(state)
+        while not state.is_final():
+            for col in state.get_free_cols():
+                state.push(col)
+                r, c = state.last_move
+                evaluator.poner(r * 7 + c, -state.player)
+                mismatches += compare(state, evaluator)
+                evaluator.quitar(r * 7 + c, -state.player)
+                state.pop()
+            mismatches += compare(state, evaluator)
+            state.push(int(rng.choice(state.get_free_cols())))
+            r, c = state.last_move
+            evaluator.poner(r * 7 + c, -state.player)
+    return mismatches
+
+
+def per_leaf_us(fn, items, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main(n_positions: int = 500) -> int:
+    mismatches = check()
+    print(f"score mismatches over random games: {mismatches}")
+
+    positions = random_positions(n_positions, max_moves=30)
+    agent = Aha()
+    agent.evaluador = None
+    moves = [(s, col) for s in positions for col in s.get_free_cols()]
+    evaluators = {id(s): EvaluadorIncremental(s) for s in positions}
+
+    def incremental(move):
+        state, col = move
+        evaluator = evaluators[id(state)]
+        state.push(col)
+        r, c = state.last_move
+        evaluator.poner(r * 7 + c, -state.player)
+        evaluator.puntaje(state.player)
+        evaluator.quitar(r * 7 + c, -state.player)
+        state.pop()
+
+    def push_pop(move):
+        state, col = move
+        state.push(col)
+        state.pop()
+
+    print(f"{'evaluation':<14}{'us/leaf':>9}")
+    print(f"{'two scans':<14}{per_leaf_us(two_scans, positions):>9.2f}")
+    print(f"{'one pass':<14}{per_leaf_us(agent.evaluate, positions):>9.2f}")
+    # The push/pop itself is paid by the search either way
+    overhead = per_leaf_us(incremental, moves) - per_leaf_us(push_pop, moves)
+    print(f"{'incremental':<14}{overhead:>9.2f}")
+
+    boards = [s.board for s in random_positions(12, seed=2024)]
+    print(f"{'search':<28}{'ms/act off':>12}{'ms/act on':>11}")
+    for name, kwargs in {
+        "minimax depth 4, push/pop": dict(depth=4, busqueda_en_sitio=True),
+        "alpha-beta depth 6": dict(depth=6, poda_alfa_beta=True),
+    }.items():
+        ms = []
+        for incremental_on in (False, True):
+            search = Aha(evaluacion_incremental=incremental_on, **kwargs)
+            start = time.perf_counter()
+            for board in boards:
+                search.act(board)
+            ms.append((time.perf_counter() - start) / len(boards) * 1e3)
+        print(f"{name:<28}{ms[0]:>12.1f}{ms[1]:>11.1f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
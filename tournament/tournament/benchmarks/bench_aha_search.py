@@ -0,0 +1,75 @@
+"""Aha's search: plain minimax versus alpha-beta pruning with move ordering,
+without and with a transposition table.
+
+For each depth, every search plays every position of a fixed corpus; the
+chosen columns must match minimax's (any mismatch is listed and the run exits
+with status 1). The table gives the mean nodes and milliseconds per ``act``,
+and the last lines the deepest depth each search completes within a per-move
+budget on every position.
+
+Run from the project root with ``python -m benchmarks.bench_aha_search``.
+"""
+
+import sys
+import time
+
+from benchmarks.positions import random_positions
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha
+
+BUDGETS = (0.1, 0.5, 1.0)
+
+
+def search(agent: Aha, boards) -> tuple[list[int], float, float]:
+    """Columns chosen, mean nodes and worst milliseconds per ``act``."""
+    moves, nodes, worst = [], 0, 0.0
+    for board in boards:
+        start = time.perf_counter()
+        moves.append(agent.act(board))
+        worst = max(worst, time.perf_counter() - start)
+        nodes += agent.nodos
+    return moves, nodes / len(boards), worst * 1e3
+
+
+def main(n_positions: int = 12, minimax_depths: range = range(1, 6), pruned_depths: range = range(1, 9)) -> int:
+    boards = [ConnectState().board] + [s.board for s in random_positions(n_positions - 1, max_moves=20)]
+    searches = {
+        "minimax": lambda depth: Aha(depth=depth, busqueda_en_sitio=True),
+        "alpha-beta": lambda depth: Aha(depth=depth, poda_alfa_beta=True),
+        "alpha-beta+TT": lambda depth: Aha(depth=depth, poda_alfa_beta=True, tabla_mb=16),
+    }
+    depths = {"minimax": minimax_depths, "alpha-beta": pruned_depths, "alpha-beta+TT": pruned_depths}
+
+    print(f"{'depth':>5}{'search':>15}{'nodes/act':>12}{'worst ms':>10}{'same move':>11}")
+    worst_ms: dict[str, dict[int, float]] = {name: {} for name in searches}
+    reference: dict[int, list[int]] = {}
+    mismatches = 0
+    for depth in pruned_depths:
+        for name, make in searches.items():
+            if depth not in depths[name]:
+                continue
+            moves, nodes, worst = search(make(depth), boards)
+            worst_ms[name][depth] = worst
+            same = "-"
+            if name == "minimax":
+                reference[depth] = moves
+            elif depth in reference:
+                diff = [i for i, (a, b) in enumerate(zip(reference[depth], moves)) if a != b]
+                mismatches += len(diff)
+                same = "yes" if not diff else f"no {diff}"
+            print(f"{depth:>5}{name:>15}{nodes:>12.0f}{worst:>10.1f}{same:>11}")
+
+    for budget in BUDGETS:
+        reached = {
+            name: max((d for d, ms in times.items() if ms <= budget * 1e3), default=0)
+            for name, times in worst_ms.items()
+        }
+        print(f"depth within {budget:.1f}s/move: " + ", ".join(f"{n} {d}" for n, d in reached.items()))
+    if mismatches:
+        print(f"{mismatches} position(s) where a pruned search chose another column than minimax")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
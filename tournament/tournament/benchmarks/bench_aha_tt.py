@@ -0,0 +1,60 @@
+"""Aha's alpha-beta search over whole games, with transposition tables of several sizes.
+
+For each table size and depth, Aha plays one game against itself (the table
+persists from move to move, as in a tournament game) and the run reports
+nodes and milliseconds per move, nodes per second and the table's hit rate.
+The last lines give the effective depth: the deepest search whose slowest
+move of the game fits in a per-move budget.
+
+Run from the project root with ``python -m benchmarks.bench_aha_tt``.
+"""
+
+import time
+
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha
+
+SIZES_MB = (0, 1, 16)
+BUDGETS = (0.1, 0.5, 1.0)
+
+
+def self_play(depth: int, megabytes: float) -> tuple[float, float, float, float]:
+    """Mean nodes per move, mean and worst ms per move, and mean hit rate of one game."""
+    players = {p: Aha(depth=depth, poda_alfa_beta=True, tabla_mb=megabytes) for p in (-1, 1)}
+    state = ConnectState()
+    nodes, times, hit_rates = [], [], []
+    while not state.is_final():
+        agent = players[state.player]
+        start = time.perf_counter()
+        column = agent.act(state.board)
+        times.append(time.perf_counter() - start)
+        stats = agent.search_stats()
+        nodes.append(stats["nodes"])
+        hit_rates.append(stats.get("tt_hit_rate", 0.0))
+        state = state.transition(column)
+    n = len(times)
+    return sum(nodes) / n, sum(times) / n * 1e3, max(times) * 1e3, sum(hit_rates) / n
+
+
+def main(depths: range = range(4, 9)) -> None:
+    print(f"{'table MB':>8}{'depth':>6}{'nodes/move':>12}{'ms/move':>9}{'worst ms':>10}{'knodes/s':>10}{'hit rate':>10}")
+    worst_ms: dict[float, dict[int, float]] = {}
+    for megabytes in SIZES_MB:
+        worst_ms[megabytes] = {}
+        for depth in depths:
+            nodes, ms, worst, hit_rate = self_play(depth, megabytes)
+            worst_ms[megabytes][depth] = worst
+            print(
+                f"{megabytes:>8}{depth:>6}{nodes:>12.0f}{ms:>9.1f}{worst:>10.1f}"
+                f"{nodes / ms:>10.1f}{hit_rate:>10.1%}"
+            )
+    for budget in BUDGETS:
+        reached = {
+            megabytes: max((d for d, ms in times.items() if ms <= budget * 1e3), default=0)
+            for megabytes, times in worst_ms.items()
+        }
+        print(f"depth within {budget:.1f}s/move: " + ", ".join(f"{mb} MB {d}" for mb, d in reached.items()))
+
+
+if __name__ == "__main__":
+    main()
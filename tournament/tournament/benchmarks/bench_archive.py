@@ -0,0 +1,96 @@
+"""Load time of 10^5 games: columnar archive versus JSONL logs and legacy JSON.
+
+Games are random playouts from ``VecConnectState``. The legacy indented
+``Match`` JSON is timed on a 1000-game sample and scaled up, since a 10^5
+game dump takes gigabytes.
+
+Run from the project root with ``python -m benchmarks.bench_archive``.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_match_log import indented_json, jsonl
+from connect4.archive import MatchArchive, records_from_log, write_archive
+from connect4.vec_state import VecConnectState
+
+
+def random_records(n: int, seed: int = 911) -> list[dict]:
+    """``n`` random games as archive records, played in one batch."""
+    rng = np.random.default_rng(seed)
+    env = VecConnectState(n, auto_reset=False)
+    moves = np.full((n, env.ROWS * env.COLS), -1, dtype=np.int8)
+    result = np.zeros(n, dtype=np.int8)
+    for ply in range(env.ROWS * env.COLS):
+        live = ~env.done
+        if not live.any():
+            break
+        actions = env.random_actions(rng)
+        moves[live, ply] = actions[live]
+        winner, done = env.step(actions)
+        result[live & done] = winner[live & done]
+    names = ("A", "B", "C", "D")
+    return [
+        {
+            "player_a": names[i % 4],
+            "player_b": names[(i + 1) % 4],
+            "first": names[i % 4],
+            "result": int(result[i]),
+            "moves": row[row >= 0].tolist(),
+        }
+        for i, row in enumerate(moves)
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(n_games: int = 100_000) -> None:
+    records = random_records(n_games)
+    os.chdir(tempfile.mkdtemp())
+    write_archive(records, "games")
+    write_archive(records, "games.npz", compress=True)
+    games = [(r["moves"], r["result"]) for r in records]
+    jsonl(games, "games.jsonl")
+    indented_json(games[:1000], "sample.json")
+
+    def read_archive(path):
+        archive = MatchArchive(path)
+        total = sum(len(moves) for moves in archive)
+        assert total == sum(len(r["moves"]) for r in records)
+        return archive
+
+    archive = read_archive("games")
+    assert list(archive.records())[:100] == records[:100]
+    assert len(archive.games_of("A")) == n_games // 2
+
+    rows = {
+        "archive, open (mmap)": timed(lambda: MatchArchive("games")),
+        "archive, open + iterate": timed(lambda: read_archive("games")),
+        "archive .npz, open + iterate": timed(lambda: read_archive("games.npz")),
+        "archive, filter by player": timed(lambda: archive.games_of("C")),
+        "JSONL, parse": timed(lambda: list(records_from_log("games.jsonl"))),
+        "legacy JSON, parse (scaled)": timed(lambda: json.load(open("sample.json"))) * n_games / 1000,
+    }
+    print(f"{n_games} games, {archive.moves.size} moves")
+    for name, seconds in rows.items():
+        print(f"{name:>30}: {seconds * 1e3:10.1f} ms")
+    sizes = {
+        "archive": sum(os.path.getsize(os.path.join("games", f)) for f in os.listdir("games")),
+        "archive .npz": os.path.getsize("games.npz"),
+        "JSONL": os.path.getsize("games.jsonl"),
+        "legacy JSON (scaled)": os.path.getsize("sample.json") * n_games // 1000,
+    }
+    for name, size in sizes.items():
+        print(f"{name:>30}: {size / 2**20:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Startup time of policy discovery with many groups: import-all versus manifest.
+
+Builds a temporary ``groups/`` folder with ``n`` copies of GroupC's policy
+(plus a stray ``__pycache__/policy.py`` in each group) and times, each in a
+fresh interpreter:
+
+- the previous ``find_importable_classes``, which imported every file;
+- manifest discovery without a cache, then with the cache built;
+- cached discovery followed by constructing two of the policies.
+
+Run from the project root with ``python -m benchmarks.bench_discovery``.
+"""
+
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# The discovery before the manifest, kept as reference
+IMPORT_ALL = """
+import importlib, inspect, pathlib
+def find(folder_route, base_class):
+    candidates = {}
+    folder_path = pathlib.Path(folder_route).resolve()
+    project_root = folder_path.parents[0]
+    sys.path.insert(0, str(project_root))
+    for py_file in folder_path.rglob("*.py"):
+        rel_path = py_file.relative_to(project_root).with_suffix("")
+        module_name = ".".join(rel_path.parts)
+        try:
+            module = importlib.import_module(module_name)
+            for _, obj in inspect.getmembers(module, inspect.isclass):
+                if issubclass(obj, base_class) and obj is not base_class:
+                    candidates[obj.__module__.split(".")[1]] = obj
+        except Exception:
+            continue
+    return candidates
+found = find("groups", Policy)
+"""
+
+MANIFEST = """
+from connect4.utils import find_importable_classes
+found = find_importable_classes("groups", Policy)
+"""
+
+MANIFEST_AND_PLAY = MANIFEST + """
+found["Group0"]().mount()
+found["Group1"]().mount()
+"""
+
+
+def timed_run(body: str, cwd: str) -> float:
+    """Seconds from interpreter start to the end of ``body`` (after imports of connect4.policy)."""
+    script = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {str(PROJECT_ROOT)!r})\n"
+        "start = time.perf_counter()\n"
+        "from connect4.policy import Policy\n"
+        + body
+        + "print(len(found), time.perf_counter() - start)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True, check=True)
+    return float(out.stdout.split()[1])
+
+
+def make_groups(root: pathlib.Path, n: int) -> None:
+    source = (PROJECT_ROOT / "groups" / "GroupC" / "policy.py").read_text()
+    for i in range(n):
+        group = root / "groups" / f"Group{i}"
+        (group / "__pycache__").mkdir(parents=True)
+        (group / "policy.py").write_text(source)
+        (group / "__pycache__" / "policy.py").write_text(source)
+
+
+def main(n_groups: int = 100) -> None:
+    root = pathlib.Path(tempfile.mkdtemp())
+    try:
+        make_groups(root, n_groups)
+        print(f"{n_groups} groups")
+        rows = [
+            ("import every file", IMPORT_ALL),
+            ("manifest, cold", MANIFEST),
+            ("manifest, cached", MANIFEST),
+            ("cached + 2 policies", MANIFEST_AND_PLAY),
+        ]
+        for name, body in rows:
+            if name == "manifest, cold":
+                shutil.rmtree(root / "groups" / "__pycache__", ignore_errors=True)
+            print(f"{name:>22}: {timed_run(body, str(root)) * 1e3:9.1f} ms")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
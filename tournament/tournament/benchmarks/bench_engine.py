@@ -0,0 +1,38 @@
+"""Transitions per second of ``ConnectState`` versus ``BitboardState``.
+
+Run from the project root with ``python -m benchmarks.bench_engine``.
+"""
+
+import time
+
+from benchmarks.positions import random_positions
+from connect4.bitboard_state import BitboardState
+
+
+def transitions_per_second(states: list, repeat: int = 5) -> float:
+    """Apply every legal move of every state ``repeat`` times and time it."""
+    count = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for state in states:
+            for col in state.get_free_cols():
+                state.transition(col).is_final()
+                count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main(n_positions: int = 500) -> dict[str, float]:
+    positions = random_positions(n_positions)
+    engines = {
+        "ConnectState": positions,
+        "BitboardState": [BitboardState(s.board, s.player) for s in positions],
+    }
+    results = {name: transitions_per_second(states) for name, states in engines.items()}
+    for name, rate in results.items():
+        print(f"{name:>14}: {rate:12,.0f} transitions/s")
+    print(f"{'speedup':>14}: {results['BitboardState'] / results['ConnectState']:12.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Import-time regression guard based on ``python -X importtime``.
+
+Reports the cumulative import time of the modules headless workers load and
+fails (exit status 1) if any of them pulls in matplotlib.
+
+Run from the project root with ``python -m benchmarks.bench_import``.
+"""
+
+import subprocess
+import sys
+
+MODULES = ("connect4.connect_state", "connect4.vec_state", "tournament", "test_learning_curve_aha")
+FORBIDDEN = ("matplotlib",)
+
+
+def import_profile(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by ``module``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    profile = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def main() -> int:
+    failed = False
+    for module in MODULES:
+        profile = import_profile(module)
+        offenders = sorted(
+            name for name in profile if name.split(".")[0] in FORBIDDEN
+        )
+        status = "FAIL" if offenders else "ok"
+        print(f"{module:>26}: {profile[module] / 1000:8.1f} ms  {status}")
+        if offenders:
+            print(f"{'':>28}imports {', '.join(offenders[:5])}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Position-key lookup throughput: board tuples versus Zobrist keys.
+
+Run from the project root with ``python -m benchmarks.bench_keys``.
+"""
+
+import time
+
+from benchmarks.positions import random_positions
+from connect4.zobrist import board_key
+
+
+def lookups_per_second(make_key, items, repeat: int = 20) -> float:
+    table = {make_key(item): 0 for item in items}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            table[make_key(item)] += 1
+    return repeat * len(items) / (time.perf_counter() - start)
+
+
+def main(n_positions: int = 2_000) -> None:
+    states = random_positions(n_positions)
+    boards = [s.board for s in states]
+    results = {
+        "tuple(map(tuple, board))": lookups_per_second(lambda b: tuple(map(tuple, b)), boards),
+        "board_key(board)": lookups_per_second(board_key, boards),
+        "state.key": lookups_per_second(lambda s: s.key, states),
+    }
+    for name, rate in results.items():
+        print(f"{name:>26}: {rate:12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Microbenchmarks of the precomputed line table against the nested-loop scans.
+
+The nested-loop versions below are the implementations that ``get_winner``
+and ``Aha.contar_amenazas`` used before ``connect4.lines``; they are kept
+here as reference and checked against the new results.
+
+Run from the project root with ``python -m benchmarks.bench_lines``.
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.positions import random_positions
+from connect4 import lines
+from connect4.vec_state import VecConnectState
+from groups.GroupA.policy import Aha
+
+
+def nested_loop_winner(board: np.ndarray) -> int:
+    rows, cols = board.shape
+    for r in range(rows):
+        for c in range(cols):
+            player = board[r, c]
+            if player == 0:
+                continue
+            if c + 3 < cols and all(board[r, c + i] == player for i in range(4)):
+                return player
+            if r + 3 < rows and all(board[r + i, c] == player for i in range(4)):
+                return player
+            if r + 3 < rows and c + 3 < cols and all(board[r + i, c + i] == player for i in range(4)):
+                return player
+            if r + 3 < rows and c - 3 >= 0 and all(board[r + i, c - i] == player for i in range(4)):
+                return player
+    return 0
+
+
+def nested_loop_threats(board: np.ndarray, player: int) -> int:
+    threats = 0
+    rows, cols = board.shape
+    for r in range(rows):
+        for c in range(cols - 3):
+            window = board[r, c:c + 4]
+            if np.sum(window == player) == 3 and np.sum(window == 0) == 1:
+                threats += 1
+    for c in range(cols):
+        for r in range(rows - 3):
+            window = board[r:r + 4, c]
+            if np.sum(window == player) == 3 and np.sum(window == 0) == 1:
+                threats += 1
+    for r in range(3, rows):
+        for c in range(cols - 3):
+            window = [board[r - i, c + i] for i in range(4)]
+            if window.count(player) == 3 and window.count(0) == 1:
+                threats += 1
+    for r in range(rows - 3):
+        for c in range(cols - 3):
+            window = [board[r + i, c + i] for i in range(4)]
+            if window.count(player) == 3 and window.count(0) == 1:
+                threats += 1
+    return threats
+
+
+def per_call_us(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main(n_positions: int = 2_000) -> None:
+    states = random_positions(n_positions, max_moves=30)
+    boards = [s.board for s in states]
+    aha = Aha()
+
+    for board in boards:
+        assert lines.winner(board) == nested_loop_winner(board)
+        for player in (-1, 1):
+            assert lines.count_open_threes(board, player) == nested_loop_threats(board, player)
+
+    rows = {
+        "winner, nested loops": per_call_us(nested_loop_winner, boards),
+        "winner, line table": per_call_us(lines.winner, boards),
+        "threats, nested loops": per_call_us(lambda b: nested_loop_threats(b, -1), boards),
+        "threats, line table": per_call_us(lambda b: lines.count_open_threes(b, -1), boards),
+        "Aha.evaluate": per_call_us(aha.evaluate, states),
+    }
+    for name, us in rows.items():
+        print(f"{name:>24}: {us:9.1f} us/board")
+
+    stack = np.stack(boards)
+    start = time.perf_counter()
+    VecConnectState.scan_winners(stack)
+    lines.count_open_threes(stack, -1)
+    us = (time.perf_counter() - start) / len(boards) * 1e6
+    print(f"{'batch winner + threats':>24}: {us:9.1f} us/board")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Bytes written and logging time per game: indented ``Match`` JSON versus JSONL.
+
+The indented dump is what ``tournament.play`` wrote before
+``connect4.match_log``: every board snapshot kept in memory and the whole
+``Match`` serialized at the end. Games are random playouts.
+
+Run from the project root with ``python -m benchmarks.bench_match_log``.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4.dtos import Game, Match
+from connect4.match_log import MatchLogger, game_from_moves, read_match
+
+
+def random_games(n: int, seed: int = 911) -> list[tuple[list[int], int]]:
+    """Move sequences and winners (-1, 0, 1) of ``n`` random games."""
+    rng = np.random.default_rng(seed)
+    games = []
+    for _ in range(n):
+        state = ConnectState()
+        moves = []
+        while not state.is_final():
+            move = int(rng.choice(state.get_free_cols()))
+            moves.append(move)
+            state = state.transition(move)
+        games.append((moves, state.get_winner()))
+    return games
+
+
+def indented_json(games, path: str) -> None:
+    histories = []
+    wins = {-1: 0, 0: 0, 1: 0}
+    for moves, winner in games:
+        state = ConnectState()
+        history = Game()
+        for move in moves:
+            history.append((state.board.tolist(), move))
+            state = state.transition(move)
+        histories.append(history)
+        wins[winner] += 1
+    match = Match(
+        player_a="A",
+        player_b="B",
+        player_a_wins=wins[-1],
+        player_b_wins=wins[1],
+        draws=wins[0],
+        games=histories,
+    )
+    with open(path, "w") as f:
+        f.write(match.model_dump_json(indent=4))
+
+
+def jsonl(games, path: str) -> None:
+    names = {-1: "A", 0: None, 1: "B"}
+    with MatchLogger(path, "A", "B") as logger:
+        for moves, winner in games:
+            logger.log_game(moves, first="A", winner=names[winner])
+
+
+def main(n_games: int = 200) -> None:
+    games = random_games(n_games)
+    os.chdir(tempfile.mkdtemp())
+    # The engine replay inside indented_json is part of the old cost (the
+    # snapshots were taken during play), so both are timed end to end.
+    for name, write, path in (
+        ("indented Match JSON", indented_json, "match.json"),
+        ("JSONL moves", jsonl, "match.jsonl"),
+    ):
+        start = time.perf_counter()
+        write(games, path)
+        us = (time.perf_counter() - start) / n_games * 1e6
+        size = os.path.getsize(path) / n_games
+        print(f"{name:>20}: {size:9.0f} bytes/game {us:9.1f} us/game")
+
+    match = read_match("match.jsonl")
+    assert [g for g in match.games] == [game_from_moves(m) for m, _ in games]
+    assert match.player_a_wins == sum(w == -1 for _, w in games)
+
+
+if __name__ == "__main__":
+    main()
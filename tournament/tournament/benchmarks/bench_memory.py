@@ -0,0 +1,63 @@
+"""Memory footprint of ``ConnectState`` and of one 120-simulation ``Hello.mcts``.
+
+Run from the project root with ``python -m benchmarks.bench_memory``.
+"""
+
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+from benchmarks.positions import random_positions
+
+
+def bytes_per_state(n: int = 10_000) -> float:
+    """Traced bytes retained per state produced by ``transition``."""
+    parents = random_positions(64)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = []
+    for i in range(n):
+        parent = parents[i % len(parents)]
+        kept.append(parent.transition(parent.get_free_cols()[0]))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(kept)
+
+
+def mcts_peak_rss() -> tuple[int, int, int]:
+    """
+    Peak RSS in KiB before and after a 120-simulation ``Hello.mcts`` call,
+    and the traced peak (bytes) of a second, identical call.
+    """
+    from groups.GroupB.policy import Hello
+
+    state = random_positions(1)[0]
+    hello = Hello()
+    hello.mount()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    hello.mcts(state, simulaciones=120)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    hello.mcts(state, simulaciones=120)
+    traced = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return baseline, peak, traced
+
+
+def main() -> None:
+    print(f"bytes per state: {bytes_per_state():10.0f}")
+    # Peak RSS is per process, so measure the MCTS call in a fresh interpreter
+    out = subprocess.run(
+        [sys.executable, "-c", "from benchmarks.bench_memory import mcts_peak_rss; print(*mcts_peak_rss())"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    baseline, peak, traced = (int(v) for v in out)
+    print(f"Hello.mcts(120) peak RSS: {peak:10d} KiB ({peak - baseline:+d} KiB over imports)")
+    print(f"Hello.mcts(120) traced peak: {traced / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
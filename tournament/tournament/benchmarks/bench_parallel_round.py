@@ -0,0 +1,48 @@
+"""Wall-clock time of one tournament round versus the number of worker processes.
+
+Run from the project root with ``python -m benchmarks.bench_parallel_round``.
+Match logs go to a temporary ``versus/`` folder.
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from groups.GroupA.policy import Aha
+from groups.GroupB.policy import Hello
+from tournament import play, play_round
+
+
+class ShallowAha(Aha):
+    """Aha at depth 2, so that one round takes seconds rather than minutes."""
+
+    def __init__(self):
+        super().__init__(depth=2)
+
+
+def main(worker_counts: tuple[int, ...] = (1, 2, 4)) -> None:
+    players = [(f"P{i}", ShallowAha if i % 2 else Hello) for i in range(8)]
+    versus = [(players[i], players[i + 1]) for i in range(0, len(players), 2)]
+    run = partial(play_round, versus, play, 3, 0.5, 911)
+    os.chdir(tempfile.mkdtemp())
+    os.mkdir("versus")
+
+    start = time.perf_counter()
+    serial = run()
+    serial_time = time.perf_counter() - start
+    print(f"cores available: {os.cpu_count()}")
+    print(f"{'serial':>10}: {serial_time:7.2f}s")
+
+    for workers in worker_counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            winners = run(executor)
+            elapsed = time.perf_counter() - start
+        assert [name for name, _ in winners] == [name for name, _ in serial]
+        print(f"{f'{workers} workers':>10}: {elapsed:7.2f}s  speedup {serial_time / elapsed:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Per-game cost of constructing and mounting policies versus ``reset()``.
+
+``OhYes(modo_torneo=True)`` loads ``policyc_model.npz`` in ``mount``; here
+the model is a synthetic Q-table of random positions, written to a
+temporary folder. Matches are OhYes against a depth-2 Aha.
+
+Run from the project root with ``python -m benchmarks.bench_policy_lifecycle``.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from connect4.artifacts import clear_artifacts
+from groups.GroupA.policy import Aha
+from groups.GroupC.policy import OhYes
+from tournament import play_game
+
+
+class TorneoOhYes(OhYes):
+    def __init__(self):
+        super().__init__(modo_torneo=True)
+
+
+def write_model(n_states: int, seed: int = 911) -> None:
+    rng = np.random.default_rng(seed)
+    agent = OhYes()
+    for board in rng.integers(-1, 2, size=(n_states, 6, 7)):
+        agent.Q[tuple(map(tuple, board))] = rng.uniform(-0.1, 0.1, 7)
+    agent.guardar_modelo()
+
+
+def mount_per_game() -> TorneoOhYes:
+    # What every game paid before: a new instance and a fresh load
+    clear_artifacts()
+    agent = TorneoOhYes()
+    agent.mount()
+    return agent
+
+
+def per_game_ms(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def main(n_states: int = 50_000, games: int = 7) -> None:
+    os.chdir(tempfile.mkdtemp())
+    write_model(n_states)
+    print(f"model: {n_states} states, {os.path.getsize('policyc_model.npz') / 2**20:.1f} MiB")
+
+    mounted = mount_per_game()
+    print(f"{'construct + mount':>24}: {per_game_ms(mount_per_game, 5):9.2f} ms/game")
+    print(f"{'cached mount':>24}: {per_game_ms(lambda: TorneoOhYes().mount(), 5):9.2f} ms/game")
+    print(f"{'reset':>24}: {per_game_ms(mounted.reset, 5):9.2f} ms/game")
+
+    rival = Aha(depth=2)
+    rival.mount()
+
+    def game_fresh():
+        play_game(mount_per_game(), rival)
+
+    def game_reused():
+        mounted.reset()
+        play_game(mounted, rival)
+
+    print(f"{'game, fresh mount':>24}: {per_game_ms(game_fresh, games):9.2f} ms/game")
+    print(f"{'game, reused instance':>24}: {per_game_ms(game_reused, games):9.2f} ms/game")
+
+
+if __name__ == "__main__":
+    main()
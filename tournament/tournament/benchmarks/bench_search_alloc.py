@@ -0,0 +1,66 @@
+"""Allocations per move of the search agents, with and without push/pop search.
+
+Run from the project root with ``python -m benchmarks.bench_search_alloc``.
+"""
+
+import time
+import tracemalloc
+
+from benchmarks.positions import random_positions
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha
+from groups.GroupB.policy import Hello
+from groups.GroupC.policy import OhYes
+
+
+def count_transitions(agent, boards) -> tuple[float, float, float]:
+    """Mean transitions (new states), peak traced KiB and ms per ``act``."""
+    original = ConnectState.transition
+    calls = 0
+
+    def counting_transition(self, col):
+        nonlocal calls
+        calls += 1
+        return original(self, col)
+
+    ConnectState.transition = counting_transition
+    try:
+        peaks = []
+        start = time.perf_counter()
+        for board in boards:
+            tracemalloc.start()
+            agent.act(board)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        elapsed = time.perf_counter() - start
+    finally:
+        ConnectState.transition = original
+    n = len(boards)
+    return calls / n, sum(peaks) / n / 1024, elapsed / n * 1000
+
+
+def make_agents(in_place: bool) -> dict[str, object]:
+    hello = Hello(busqueda_en_sitio=in_place)
+    hello.mount()
+    ohyes = OhYes(busqueda_en_sitio=in_place)
+    ohyes.mount()
+    ohyes.nivel_actual = 2  # force the MCTS path
+    return {
+        "Aha(depth=4)": Aha(depth=4, busqueda_en_sitio=in_place),
+        "Hello": hello,
+        "OhYes": ohyes,
+    }
+
+
+def main(n_positions: int = 5) -> None:
+    boards = [s.board for s in random_positions(n_positions)]
+    print(f"{'agent':<14}{'mode':<10}{'states/act':>12}{'peak KiB':>10}{'ms/act':>10}")
+    for in_place in (False, True):
+        for name, agent in make_agents(in_place).items():
+            states, peak, ms = count_transitions(agent, boards)
+            mode = "push/pop" if in_place else "copy"
+            print(f"{name:<14}{mode:<10}{states:>12.0f}{peak:>10.1f}{ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
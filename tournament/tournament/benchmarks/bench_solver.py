@@ -0,0 +1,74 @@
+"""Solve times of ``connect4.solver`` by number of empty cells.
+
+Positions come from random play, keeping those where the side to move has
+no immediate win (those are solved at once and would flatter the times).
+Each is solved from an empty transposition table. As a check, the position
+after the chosen move is solved too: its score must be the opposite of the
+root's (the run exits with status 1 otherwise).
+
+Run from the project root with ``python -m benchmarks.bench_solver``.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.positions import random_positions
+from connect4.connect_state import ConnectState
+from connect4.solver import BOARD_MASK, BOTTOM_MASK, CELLS, Solver, encode, winning_cells
+
+EMPTY_CELLS = (12, 20, 28)
+
+
+def positions_with_empty(empty: int, n: int, seed: int = 911) -> list[ConnectState]:
+    """``n`` random positions with ``empty`` empty cells and no immediate win for the side to move."""
+    found: list[ConnectState] = []
+    while len(found) < n:
+        for state in random_positions(4 * n, min_moves=CELLS - empty, max_moves=CELLS - empty, seed=seed):
+            position, mask, _ = encode(state)
+            if int(np.count_nonzero(state.board)) != CELLS - empty:
+                continue
+            if winning_cells(position, mask) & (mask + BOTTOM_MASK) & BOARD_MASK:
+                continue
+            found.append(state)
+            if len(found) == n:
+                break
+        seed += 1
+    return found
+
+
+def check_move(state: ConnectState, move: int, score: int) -> bool:
+    child = state.transition(move)
+    if child.is_final():
+        return child.get_winner() != 0 or score == 0
+    return Solver().solve(child).score == -score
+
+
+def main(n_positions: int = 8) -> int:
+    print(f"{'empty':>5}{'mean ms':>10}{'median ms':>11}{'max ms':>10}{'mean nodes':>12}{'knodes/s':>10}{'W/D/L':>9}")
+    bad = 0
+    for empty in EMPTY_CELLS:
+        ms, nodes, values = [], [], []
+        for state in positions_with_empty(empty, n_positions):
+            solver = Solver()
+            start = time.perf_counter()
+            result = solver.solve(state)
+            ms.append((time.perf_counter() - start) * 1e3)
+            nodes.append(result.nodes)
+            values.append(result.value)
+            bad += not check_move(state, result.move, result.score)
+        ms, nodes = np.asarray(ms), np.asarray(nodes)
+        wdl = f"{values.count(1)}/{values.count(0)}/{values.count(-1)}"
+        print(
+            f"{empty:>5}{ms.mean():>10.1f}{np.median(ms):>11.1f}{ms.max():>10.1f}"
+            f"{nodes.mean():>12.0f}{nodes.sum() / ms.sum():>10.1f}{wdl:>9}"
+        )
+    if bad:
+        print(f"{bad} position(s) where the chosen move does not keep the solved score")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
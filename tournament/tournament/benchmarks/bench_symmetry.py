@@ -0,0 +1,67 @@
+"""Q-table and MCTS tree sizes with and without mirror-symmetry canonical keys.
+
+Run from the project root with ``python -m benchmarks.bench_symmetry``.
+"""
+
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4.symmetry import canonical_key
+from groups.GroupB.policy import Hello
+from groups.GroupC.policy import OhYes
+
+
+def train(agent, games: int, seed: int = 911) -> float:
+    """Play ``games`` as Red against a random player; return the final-quarter win rate."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for _ in range(games):
+        state = ConnectState()
+        while not state.is_final():
+            if state.player == -1:
+                col = agent.act(state.board)
+            else:
+                col = int(rng.choice(state.get_free_cols()))
+            state = state.transition(col)
+        winner = state.get_winner()
+        agent.finalizar_partida(-winner)
+        results.append(winner == -1)
+    return float(np.mean(results[-max(1, games // 4):]))
+
+
+def enumerate_keys(plies: int) -> tuple[int, int]:
+    """Distinct raw and canonical keys over every position up to ``plies`` moves."""
+    raw, canonical = set(), set()
+    frontier = [ConnectState()]
+    for _ in range(plies):
+        children = {}
+        for state in frontier:
+            for col in state.get_free_cols():
+                child = state.transition(col)
+                children.setdefault(child.key, child)
+        frontier = [s for s in children.values() if not s.is_final()]
+        raw.update(children)
+        canonical.update(canonical_key(s)[0] for s in children.values())
+    return len(raw), len(canonical)
+
+
+def main() -> None:
+    print(f"{'agent':<8}{'simetria':>9}{'games':>7}{'Q states':>10}{'win rate':>10}")
+    for cls, games in ((OhYes, 300), (Hello, 20)):
+        for simetria in (False, True):
+            agent = cls(simetria=simetria)
+            win_rate = train(agent, games)
+            print(f"{cls.__name__:<8}{str(simetria):>9}{games:>7}{len(agent.Q):>10}{win_rate:>10.2f}")
+
+    for plies in (4, 6):
+        raw, canonical = enumerate_keys(plies)
+        print(f"all positions up to {plies} plies: {raw} raw keys, {canonical} canonical ({raw / canonical:.2f}x)")
+
+    for simetria in (False, True):
+        agent = Hello(simetria=simetria)
+        agent.mcts(ConnectState(), simulaciones=2000)
+        print(f"Hello.mcts(2000) from the empty board, simetria={simetria}: {agent.nodos_mcts} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Random-rollout throughput of ``VecConnectState`` against ``ConnectState``.
+
+Run from the project root with ``python -m benchmarks.bench_vec_state``.
+"""
+
+import time
+
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4.vec_state import VecConnectState
+
+
+def vec_moves_per_second(n: int, steps: int = 200, seed: int = 911) -> float:
+    rng = np.random.default_rng(seed)
+    env = VecConnectState(n)
+    start = time.perf_counter()
+    for _ in range(steps):
+        env.step(env.random_actions(rng))
+    return n * steps / (time.perf_counter() - start)
+
+
+def scalar_moves_per_second(moves: int = 20_000, seed: int = 911) -> float:
+    rng = np.random.default_rng(seed)
+    state = ConnectState()
+    start = time.perf_counter()
+    for _ in range(moves):
+        state = state.transition(int(rng.choice(state.get_free_cols())))
+        if state.is_final():
+            state = ConnectState()
+    return moves / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'ConnectState':>22}: {scalar_moves_per_second():14,.0f} moves/s")
+    for n in (1_000, 10_000, 100_000):
+        steps = 200 if n < 100_000 else 50
+        rate = vec_moves_per_second(n, steps)
+        print(f"{f'VecConnectState n={n}':>22}: {rate:14,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import numpy as np
+
+from connect4.connect_state import ConnectState
+
+
+def random_positions(
+    n: int, min_moves: int = 6, max_moves: int = 24, seed: int = 911
+) -> list[ConnectState]:
+    """Generate ``n`` non-terminal mid-game positions by random play."""
+    rng = np.random.default_rng(seed)
+    positions: list[ConnectState] = []
+    while len(positions) < n:
+        state = ConnectState()
+        target = int(rng.integers(min_moves, max_moves + 1))
+        for _ in range(target):
+            state = state.transition(int(rng.choice(state.get_free_cols())))
+            if state.is_final():
+                break
+        if not state.is_final():
+            positions.append(state)
+    return positions
@@ -0,0 +1,231 @@
+"""Benchmark suite of the connect4 engine and every group policy.
+
+Every benchmark reports a time per unit of work (lower is better):
+
+- ``engine.*``: microseconds per call of the ``ConnectState`` primitives on
+  random mid-game positions. ``get_winner``, ``is_final`` and
+  ``get_heights`` run on states rebuilt from the raw boards, so they measure
+  the scans and not the caches.
+- ``act.*``: milliseconds per ``act`` call of each policy on a fixed corpus
+  of positions. OhYes plays as in the tournament, with MCTS on even when
+  its Q-table file is missing (it would only look up the table otherwise).
+- ``game.*``: milliseconds per full game between two policies.
+
+Results are compared with ``benchmarks/baseline.json``: a benchmark more
+than ``--tolerance`` slower than its baseline is a regression, and the run
+exits with status 1. ``--save`` writes the current results as the new
+baseline. Each timing is the best of ``--repeat`` runs of at least 0.2 s,
+and the whole suite runs ``--runs`` times: the median of each benchmark is
+reported and saved, so that one lucky or unlucky run does not set the
+baseline, and a regression must show in every run.
+The baseline is machine specific: save one on the machine that checks it.
+
+Run from the project root with ``python -m benchmarks`` (see ``--help``).
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.positions import random_positions
+from connect4.connect_state import ConnectState
+from connect4.policy import Policy
+from groups.GroupA.policy import Aha
+from groups.GroupB.policy import Hello
+from groups.GroupC.policy import OhYes
+from tournament import play_game
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def best_time(fn: Callable[[], None], repeat: int, min_seconds: float = 0.2) -> float:
+    """
+    Best wall-clock seconds per call of ``fn`` over ``repeat`` runs.
+
+    Each run calls ``fn`` enough times to last about ``min_seconds``, so that
+    fast benchmarks are not dominated by timer noise. The garbage collector
+    is paused while timing.
+    """
+    start = time.perf_counter()
+    fn()
+    calls = max(1, int(min_seconds / max(time.perf_counter() - start, 1e-9)))
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(calls):
+                fn()
+            best = min(best, (time.perf_counter() - start) / calls)
+    finally:
+        gc.enable()
+    return best
+
+
+def seed(*policies: Policy) -> None:
+    """Fix the random streams of the policies, so that every run does the same work."""
+    np.random.seed(0)  # OhYes initializes unseen Q-table rows with the global generator
+    for policy in policies:
+        if hasattr(policy, "rng"):
+            policy.rng = np.random.default_rng(0)
+
+
+def engine_benchmarks(repeat: int, n_positions: int = 500) -> dict[str, float]:
+    """Microseconds per call of the engine primitives."""
+    positions = random_positions(n_positions, max_moves=30)
+    boards = [(s.board, s.player) for s in positions]
+    moves = [(s, col) for s in positions for col in s.get_free_cols()]
+
+    results = {
+        "engine.transition": best_time(lambda: [s.transition(c) for s, c in moves], repeat) / len(moves),
+        "engine.get_free_cols": best_time(lambda: [s.get_free_cols() for s in positions], repeat) / len(positions),
+    }
+    for method in ("get_winner", "is_final", "get_heights"):
+        # New states for every call of the method, so that its cached result
+        # is never reused; the construction is timed apart and subtracted
+        def build():
+            return [ConnectState(board, player) for board, player in boards]
+
+        def call(method=method):
+            for state in build():
+                getattr(state, method)()
+
+        results[f"engine.{method}"] = (best_time(call, repeat) - best_time(build, repeat)) / len(boards)
+    return {name: seconds * 1e6 for name, seconds in results.items()}
+
+
+class OhYesMCTS(OhYes):
+    """OhYes in tournament mode with MCTS on (level 2), with or without its Q-table file."""
+
+    def __init__(self):
+        super().__init__(modo_torneo=True)
+
+    def mount(self, timeout=None):
+        super().mount(timeout)
+        self.nivel_actual = 2
+
+
+def policies() -> dict[str, Callable[[], Policy]]:
+    return {
+        "Aha(depth=1)": lambda: Aha(depth=1),
+        "Aha(depth=2)": lambda: Aha(depth=2),
+        "Aha(depth=3)": lambda: Aha(depth=3),
+        "Aha(depth=4)": lambda: Aha(depth=4),
+        "Hello": Hello,
+        "OhYes(MCTS)": OhYesMCTS,
+    }
+
+
+def act_benchmarks(repeat: int, n_positions: int = 12) -> dict[str, float]:
+    """Milliseconds per ``act`` call on a fixed corpus of positions."""
+    corpus = [s.board for s in random_positions(n_positions, seed=2024)]
+    results = {}
+    for name, make in policies().items():
+        policy = make()
+        policy.mount()
+
+        def run():
+            for board in corpus:
+                policy.reset()
+                seed(policy)
+                policy.act(board)
+
+        results[f"act.{name}"] = best_time(run, repeat) / len(corpus) * 1e3
+    return results
+
+
+def game_benchmarks(repeat: int, n_games: int = 4) -> dict[str, float]:
+    """Milliseconds per full game."""
+    pairings = {
+        "Aha(depth=2) vs Aha(depth=2)": (lambda: Aha(depth=2), lambda: Aha(depth=2)),
+        "Hello vs OhYes(MCTS)": (Hello, OhYesMCTS),
+        "Aha(depth=2) vs Hello": (lambda: Aha(depth=2), Hello),
+    }
+    results = {}
+    for name, (make_first, make_second) in pairings.items():
+        first, second = make_first(), make_second()
+        first.mount()
+        second.mount()
+
+        def run():
+            for _ in range(n_games):
+                first.reset()
+                second.reset()
+                seed(first, second)
+                play_game(first, second)
+
+        results[f"game.{name}"] = best_time(run, repeat) / n_games * 1e3
+    return results
+
+
+SUITES = {
+    "engine": engine_benchmarks,
+    "act": act_benchmarks,
+    "game": game_benchmarks,
+}
+
+
+def compare(runs: dict[str, list[float]], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """
+    Print the median of each benchmark's runs against the baseline and return
+    the regressed benchmarks: those whose every run (the fastest included) is
+    more than ``tolerance`` slower, so that one noisy run is not reported.
+    """
+    regressions = []
+    print(f"{'benchmark':<40}{'current':>12}{'baseline':>12}{'ratio':>8}")
+    for name, values in runs.items():
+        value = statistics.median(values)
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<40}{value:>12.3f}{'-':>12}{'-':>8}")
+            continue
+        ratio = value / base
+        flag = ""
+        if min(values) / base > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<40}{value:>12.3f}{base:>12.3f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--only", choices=sorted(SUITES), action="append", help="run only these suites")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark, the best is kept")
+    parser.add_argument("--runs", type=int, default=3, help="suite runs, the median of each benchmark is kept")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    runs: dict[str, list[float]] = {}
+    for _ in range(args.runs):
+        for name in args.only or SUITES:
+            for benchmark, value in SUITES[name](args.repeat).items():
+                runs.setdefault(benchmark, []).append(value)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(runs, baseline, args.tolerance)
+
+    if args.save:
+        results = {benchmark: statistics.median(values) for benchmark, values in runs.items()}
+        # Benchmarks not run this time keep their previous baseline
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=4) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Columnar binary archive of Connect Four games.
+
+An archive stores every game as its move sequence: all moves are
+concatenated in one ``uint8`` array, and ``offsets[i]:offsets[i + 1]``
+delimits game ``i``. Per-game metadata lives in parallel columns:
+
+- ``player_a``, ``player_b``: indices into the ``players`` name table.
+- ``first``: 0 if player_a moved first, 1 if player_b did, -1 if unknown
+  (the legacy ``Match`` JSON does not record it).
+- ``result``: -1 if the first player won, 1 if the second did, 0 for a draw.
+
+An uncompressed archive is a folder of ``.npy`` files, read through memory
+maps so that opening it costs nothing and games are paged in on access. A
+compressed archive is a single ``.npz`` file, decompressed when opened.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4.dtos import Game, Match
+from connect4.match_log import game_from_moves
+
+COLUMNS = ("moves", "offsets", "player_a", "player_b", "first", "result")
+
+
+def moves_from_game(game: Game) -> list[int]:
+    """Move sequence of a state-action pair list."""
+    return [int(action) for _, action in game]
+
+
+def replay_result(moves: list[int]) -> int:
+    """Result of a move sequence: -1 first player won, 1 second won, 0 draw."""
+    state = ConnectState()
+    for move in moves:
+        state = state.transition(int(move))
+    return state.get_winner()
+
+
+def write_archive(records: Iterable[dict], path: str | Path, compress: bool = False) -> Path:
+    """
+    Write game records to an archive.
+
+    Parameters
+    ----------
+    records : Iterable[dict]
+        Games as dicts with ``player_a``, ``player_b``, ``first`` (a player
+        name or None), ``result`` (-1, 0, 1) and ``moves``.
+    path : str | Path
+        Folder to create, or ``.npz`` file when ``compress`` is set.
+    compress : bool, optional
+        Store a single compressed ``.npz`` instead of memory-mappable
+        ``.npy`` files (default is False).
+
+    Returns
+    -------
+    Path
+        Location of the archive.
+    """
+    players: dict[str, int] = {}
+    moves: list[int] = []
+    offsets = [0]
+    columns: dict[str, list[int]] = {"player_a": [], "player_b": [], "first": [], "result": []}
+    for record in records:
+        a = players.setdefault(record["player_a"], len(players))
+        b = players.setdefault(record["player_b"], len(players))
+        columns["player_a"].append(a)
+        columns["player_b"].append(b)
+        first = record.get("first")
+        columns["first"].append(-1 if first is None else int(first == record["player_b"]))
+        columns["result"].append(record["result"])
+        moves.extend(record["moves"])
+        offsets.append(len(moves))
+
+    arrays = {
+        "moves": np.array(moves, dtype=np.uint8),
+        "offsets": np.array(offsets, dtype=np.int64),
+        "player_a": np.array(columns["player_a"], dtype=np.int32),
+        "player_b": np.array(columns["player_b"], dtype=np.int32),
+        "first": np.array(columns["first"], dtype=np.int8),
+        "result": np.array(columns["result"], dtype=np.int8),
+    }
+    names = json.dumps(list(players))
+
+    path = Path(path)
+    if compress:
+        if path.suffix != ".npz":
+            path = path.with_suffix(".npz")
+        np.savez_compressed(path, players=np.array(names), **arrays)
+    else:
+        path.mkdir(parents=True, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(path / f"{name}.npy", array)
+        (path / "players.json").write_text(names)
+    return path
+
+
+class MatchArchive:
+    """
+    Read-only view of an archive written by ``write_archive``.
+
+    Games are addressed by index; ``len(archive)`` is the number of games.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        if path.is_dir():
+            self.players: list[str] = json.loads((path / "players.json").read_text())
+            arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in COLUMNS}
+        else:
+            with np.load(path) as data:
+                self.players = json.loads(str(data["players"]))
+                arrays = {name: data[name] for name in COLUMNS}
+        self.moves: np.ndarray = arrays["moves"]
+        self.offsets: np.ndarray = arrays["offsets"]
+        self.player_a: np.ndarray = arrays["player_a"]
+        self.player_b: np.ndarray = arrays["player_b"]
+        self.first: np.ndarray = arrays["first"]
+        self.result: np.ndarray = arrays["result"]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def game_moves(self, i: int) -> np.ndarray:
+        """Move sequence of game ``i``."""
+        return self.moves[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        # Plain views of the (possibly memory-mapped) move column: slicing the
+        # memmap itself builds a new memmap object per game
+        moves = np.asarray(self.moves)
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield moves[start:end]
+
+    def position(self, i: int, ply: int | None = None) -> ConnectState:
+        """State of game ``i`` after its first ``ply`` moves (all of them if None)."""
+        state = ConnectState()
+        for move in self.game_moves(i)[:ply]:
+            state.push(int(move))
+        return state
+
+    def game(self, i: int) -> Game:
+        """State-action pairs of game ``i``."""
+        return game_from_moves(self.game_moves(i).tolist())
+
+    def winner(self, i: int) -> str | None:
+        """Name of the winner of game ``i``; None for draws and unknown first players."""
+        if self.result[i] == 0 or self.first[i] == -1:
+            return None
+        first_won = self.result[i] == -1
+        a_won = first_won == (self.first[i] == 0)
+        return self.players[self.player_a[i] if a_won else self.player_b[i]]
+
+    def games_of(self, player: str) -> np.ndarray:
+        """Indices of the games played by ``player``."""
+        if player not in self.players:
+            return np.zeros(0, dtype=np.intp)
+        p = self.players.index(player)
+        return np.flatnonzero((self.player_a == p) | (self.player_b == p))
+
+    def records(self) -> Iterator[dict]:
+        """Games as dicts, in the format accepted by ``write_archive``."""
+        for i in range(len(self)):
+            first = int(self.first[i])
+            first_index = self.player_a[i] if first == 0 else self.player_b[i]
+            yield {
+                "player_a": self.players[self.player_a[i]],
+                "player_b": self.players[self.player_b[i]],
+                "first": None if first == -1 else self.players[first_index],
+                "result": int(self.result[i]),
+                "moves": self.game_moves(i).tolist(),
+            }
+
+
+def records_from_match(match: Match) -> Iterator[dict]:
+    """Game records of a legacy ``Match``; the first player is not known."""
+    for game in match.games:
+        moves = moves_from_game(game)
+        yield {
+            "player_a": match.player_a,
+            "player_b": match.player_b,
+            "first": None,
+            "result": replay_result(moves),
+            "moves": moves,
+        }
+
+
+def records_from_match_json(path: str | Path) -> Iterator[dict]:
+    """
+    Game records of a legacy ``versus/match_*.json`` dump (none if it holds no ``games``).
+
+    The file is read as plain JSON: ``Match`` holds ``Game`` lists that
+    pydantic can only validate from Python objects.
+    """
+    data = json.loads(Path(path).read_text())
+    if not isinstance(data, dict) or "games" not in data:
+        return
+    for game in data["games"]:
+        moves = moves_from_game(game)
+        yield {
+            "player_a": data["player_a"],
+            "player_b": data["player_b"],
+            "first": None,
+            "result": replay_result(moves),
+            "moves": moves,
+        }
+
+
+def records_from_log(path: str | Path) -> Iterator[dict]:
+    """Game records of a JSONL match log (see ``connect4.match_log``)."""
+    with open(path) as f:
+        header = json.loads(next(f))
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["winner"] is None:
+                result = 0
+            else:
+                result = -1 if record["winner"] == record["first"] else 1
+            yield {
+                "player_a": header["player_a"],
+                "player_b": header["player_b"],
+                "first": record["first"],
+                "result": result,
+                "moves": record["moves"],
+            }
+
+
+def convert_versus(folder: str | Path, path: str | Path, compress: bool = False) -> Path:
+    """
+    Archive every match in ``folder``: legacy ``match_*.json`` dumps and
+    ``match_*.jsonl`` logs. Other files (statistics, notes) are ignored, as
+    are JSON files that hold no ``games``.
+    """
+    def records() -> Iterator[dict]:
+        for file in sorted(Path(folder).glob("match_*")):
+            if file.suffix == ".json":
+                yield from records_from_match_json(file)
+            elif file.suffix == ".jsonl":
+                yield from records_from_log(file)
+
+    return write_archive(records(), path, compress=compress)
@@ -0,0 +1,31 @@
+"""Process-wide cache of model artifacts loaded from disk by the policies."""
+
+from pathlib import Path
+from typing import Any, Callable
+
+# (resolved path, loader) -> (modification time, loaded object)
+_CACHE: dict[tuple[str, Callable], tuple[int, Any]] = {}
+
+
+def load_artifact(path: str | Path, loader: Callable[[str], Any]) -> Any:
+    """
+    Load ``path`` with ``loader`` once per process and return the cached result.
+
+    A model saved again (a new modification time) is reloaded and replaces
+    the stale copy, so at most one copy per file and loader is kept. The
+    returned object is shared by every caller: policies that modify their
+    model during play must copy what they change. Errors (e.g. a missing
+    file) are not cached.
+    """
+    resolved = Path(path).resolve()
+    key = (str(resolved), loader)
+    mtime = resolved.stat().st_mtime_ns
+    entry = _CACHE.get(key)
+    if entry is None or entry[0] != mtime:
+        entry = _CACHE[key] = (mtime, loader(str(resolved)))
+    return entry[1]
+
+
+def clear_artifacts() -> None:
+    """Forget every cached artifact."""
+    _CACHE.clear()
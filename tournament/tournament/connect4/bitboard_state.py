@@ -0,0 +1,139 @@
+# Abstract
+from connect4.environment_state import EnvironmentState
+
+# Types
+from typing import Any
+
+# Libraries
+import numpy as np
+
+
+class BitboardState(EnvironmentState):
+    """
+    Connect Four state backed by two integer bitboards.
+
+    Drop-in alternative to ``ConnectState``: it exposes the same public API
+    (``board``, ``player``, ``is_final``, ``get_winner``, ``get_free_cols``,
+    ``get_heights``, ``transition``...) but applies moves and detects wins
+    with a handful of integer operations.
+
+    Each column takes ``ROWS + 1`` bits (the extra one is a sentinel that keeps
+    shifts from wrapping between columns); bit ``col * 7 + h`` is the cell at
+    height ``h`` counted from the bottom. ``position`` holds the discs of the
+    player to move and ``mask`` all discs on the board. The ndarray ``board``
+    is only materialized when a caller asks for it.
+    """
+
+    ROWS = 6
+    COLS = 7
+    H1 = ROWS + 1
+
+    # Top cell of every column
+    TOP_MASK = sum(1 << (c * 7 + 5) for c in range(7))
+
+    __slots__ = ("player", "position", "mask", "_board", "_winner")
+
+    def __init__(self, board: np.ndarray | None = None, player: int = -1):
+        self.player = player  # -1 = Red, 1 = Yellow
+        self.position = 0
+        self.mask = 0
+        self._board: np.ndarray | None = None
+        self._winner: int | None = None
+
+        if board is not None:
+            red, yellow = self.encode(board)
+            self.mask = red | yellow
+            self.position = red if player == -1 else yellow
+
+    @classmethod
+    def encode(cls, board: np.ndarray) -> tuple[int, int]:
+        """Return the (red, yellow) bitboards of a ``(ROWS, COLS)`` array."""
+        red = 0
+        yellow = 0
+        for r, c in zip(*np.nonzero(board)):
+            bit = 1 << (int(c) * cls.H1 + cls.ROWS - 1 - int(r))
+            if board[r, c] == -1:
+                red |= bit
+            else:
+                yellow |= bit
+        return red, yellow
+
+    @staticmethod
+    def has_four(bits: int) -> bool:
+        """Whether ``bits`` contains four aligned discs (shift-and-AND test)."""
+        for shift in (1, BitboardState.H1, BitboardState.H1 - 1, BitboardState.H1 + 1):
+            pairs = bits & (bits >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
+        return False
+
+    def player_bits(self, player: int) -> int:
+        """Bitboard with the discs of ``player``."""
+        return self.position if player == self.player else self.position ^ self.mask
+
+    @property
+    def board(self) -> np.ndarray:
+        if self._board is None:
+            board = np.zeros((self.ROWS, self.COLS), dtype=np.int8)
+            red = self.player_bits(-1)
+            for c in range(self.COLS):
+                for h in range(self.ROWS):
+                    bit = 1 << (c * self.H1 + h)
+                    if self.mask & bit:
+                        board[self.ROWS - 1 - h, c] = -1 if red & bit else 1
+            self._board = board
+        return self._board
+
+    def is_final(self) -> bool:
+        return self.get_winner() != 0 or self.mask & self.TOP_MASK == self.TOP_MASK
+
+    def is_applicable(self, event: Any) -> bool:
+        return (
+            isinstance(event, int)
+            and 0 <= event < self.COLS
+            and self.is_col_free(event)
+            and not self.is_final()
+        )
+
+    def get_winner(self) -> int:
+        if self._winner is None:
+            if self.has_four(self.player_bits(-1)):
+                self._winner = -1
+            elif self.has_four(self.player_bits(1)):
+                self._winner = 1
+            else:
+                self._winner = 0
+        return self._winner
+
+    def is_col_free(self, col: int) -> bool:
+        return not self.mask & (1 << (col * self.H1 + self.ROWS - 1))
+
+    def get_heights(self) -> list[int]:
+        column = (1 << self.ROWS) - 1
+        return [
+            ((self.mask >> (c * self.H1)) & column).bit_length()
+            for c in range(self.COLS)
+        ]
+
+    def get_free_cols(self) -> list[int]:
+        return [c for c in range(self.COLS) if self.is_col_free(c)]
+
+    def transition(self, col: int) -> "BitboardState":
+        if not self.is_applicable(col):
+            raise ValueError(f"Move not allowed in column {col}.")
+
+        new_state = BitboardState.__new__(BitboardState)
+        new_state.player = -self.player
+        new_state.position = self.position ^ self.mask
+        new_state.mask = self.mask | (self.mask + (1 << (col * self.H1)))
+        new_state._board = None
+        # Only the player who just moved can have completed a line
+        new_state._winner = (
+            self.player if self.has_four(new_state.position ^ new_state.mask) else 0
+        )
+        return new_state
+
+    def show(self, size: int = 1500, ax: Any = None) -> None:
+        from connect4.render import show_board
+
+        show_board(self.board, size=size, ax=ax)
@@ -0,0 +1,95 @@
+"""Per-move and per-game clocks, measured and enforced by the tournament runner."""
+
+import inspect
+import time
+
+from connect4.connect_state import ConnectState
+from connect4.dtos import TimeControl
+from connect4.policy import Policy
+
+# Columns tried by the fallback move, centre first
+FALLBACK_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+
+def mount_policy(policy: Policy, time_control: TimeControl | None = None) -> None:
+    """
+    Mount ``policy``, passing the per-move budget as ``timeout`` when there
+    is one and the policy's ``mount`` accepts it.
+    """
+    if (
+        time_control is not None
+        and time_control.per_move is not None
+        and "timeout" in inspect.signature(policy.mount).parameters
+    ):
+        policy.mount(timeout=time_control.per_move)
+    else:
+        policy.mount()
+
+
+def fallback_move(state: ConnectState) -> int:
+    """Most central free column, played in place of a late move."""
+    return next(col for col in FALLBACK_ORDER if state.is_col_free(col))
+
+
+class GameClock:
+    """
+    Time the moves of one game under a ``TimeControl``.
+
+    The budget of a move is the per-move limit, capped by what is left of
+    the player's per-game time. It reaches the policy as ``policy.deadline``
+    while ``act`` runs. A policy cannot be interrupted, so an overrun is
+    detected when ``act`` returns: with ``on_overrun="forfeit"`` the player
+    loses the game, otherwise the move is replaced by ``fallback_move``. A
+    player whose game time is spent gets no more calls to ``act``.
+    """
+
+    def __init__(self, time_control: TimeControl):
+        self.time_control = time_control
+        self.used = {-1: 0.0, 1: 0.0}
+        # Seconds per move and plies of the moves that ran over, for the log
+        self.times: list[float] = []
+        self.overruns: list[int] = []
+        # Color of the player who lost on time, if any
+        self.forfeit: int | None = None
+
+    def budget(self, player: int) -> float | None:
+        """Seconds available for the next move of ``player`` (None if untimed)."""
+        limits = []
+        if self.time_control.per_move is not None:
+            limits.append(self.time_control.per_move)
+        if self.time_control.per_game is not None:
+            limits.append(self.time_control.per_game - self.used[player])
+        return min(limits) if limits else None
+
+    def timed_act(self, policy: Policy, state: ConnectState) -> int | None:
+        """
+        Ask ``policy`` for a move in ``state`` under the clock.
+
+        Returns the move to play, or None if the player forfeits the game.
+        """
+        budget = self.budget(state.player)
+        ply = len(self.times)
+        if budget is not None and budget <= 0:
+            self.times.append(0.0)
+            return self._overrun(ply, state)
+
+        start = time.perf_counter()
+        policy.deadline = None if budget is None else start + budget
+        try:
+            action = int(policy.act(state.board))
+        finally:
+            policy.deadline = None
+        elapsed = time.perf_counter() - start
+        self.used[state.player] += elapsed
+        self.times.append(elapsed)
+
+        if budget is not None and elapsed > budget:
+            return self._overrun(ply, state)
+        return action
+
+    def _overrun(self, ply: int, state: ConnectState) -> int | None:
+        self.overruns.append(ply)
+        if self.time_control.on_overrun == "forfeit":
+            self.forfeit = state.player
+            return None
+        return fallback_move(state)
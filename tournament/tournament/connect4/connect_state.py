@@ -1,27 +1,76 @@
 # Abstract
 from connect4.environment_state import EnvironmentState
+from connect4 import lines
+from connect4.lines import CELL_LINE_INDEX
+from connect4.zobrist import ZOBRIST, board_key
 
 # Types
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Libraries
 import numpy as np
-import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 class ConnectState(EnvironmentState):
     ROWS = 6
     COLS = 7
 
+    # Search trees and caches hold many states: no per-instance __dict__
+    __slots__ = (
+        "board",
+        "player",
+        "last_move",
+        "_winner",
+        "_final",
+        "_heights",
+        "_history",
+        "_key",
+        "_mirror_key",
+    )
+
     def __init__(self, board: np.ndarray | None = None, player: int = -1):
         if board is None:
-            self.board = np.zeros((self.ROWS, self.COLS), dtype=int)
+            self.board = np.zeros((self.ROWS, self.COLS), dtype=np.int8)
         else:
-            self.board = board.copy()
+            # Single copy-and-convert of foreign boards (int arrays, lists...)
+            self.board = np.array(board, dtype=np.int8)
         self.player = player  # -1 = Red, 1 = Yellow type: ignore
 
+        # (row, col) of the last disc dropped, None for boards built from arrays
+        self.last_move: tuple[int, int] | None = None
+        # Cached results; None until computed. The board must not be mutated
+        # in place other than through push/pop once they are set.
+        self._winner: int | None = None
+        self._final: bool | None = None
+        # Column heights, one byte per column
+        self._heights: bytearray | None = None
+        # Undo stack of (last_move, winner, final) for pop(), created on first push
+        self._history: list[tuple[tuple[int, int] | None, int | None, bool | None]] | None = None
+        # Zobrist key, kept up to date by transition/push/pop once computed
+        self._key: int | None = 0 if board is None else None
+        self._mirror_key: int | None = self._key
+
+    @property
+    def key(self) -> int:
+        """64-bit Zobrist key of the board (same value as ``board_key(board)``)."""
+        if self._key is None:
+            self._key = board_key(self.board)
+        return self._key
+
+    @property
+    def mirror_key(self) -> int:
+        """Zobrist key of the left/right mirror image of the board."""
+        if self._mirror_key is None:
+            self._mirror_key = board_key(self.board[:, ::-1])
+        return self._mirror_key
+
     def is_final(self) -> bool:
-        return self.get_winner() != 0 or not any(self.board[0] == 0)
+        if self._final is None:
+            self._final = self.get_winner() != 0 or not any(self.board[0] == 0)
+        return self._final
 
     def is_applicable(self, event: Any) -> bool:
         return (
@@ -32,44 +81,31 @@ class ConnectState(EnvironmentState):
         )
 
     def get_winner(self) -> int:
-        # Check all 4 directions
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                player = self.board[r, c]
-                if player == 0:
-                    continue
-
-                # Right
-                if c + 3 < self.COLS and all(
-                    self.board[r, c + i] == player for i in range(4)
-                ):
-                    return player
-                # Down
-                if r + 3 < self.ROWS and all(
-                    self.board[r + i, c] == player for i in range(4)
-                ):
-                    return player
-                # Diagonal right-down
-                if (
-                    r + 3 < self.ROWS
-                    and c + 3 < self.COLS
-                    and all(self.board[r + i, c + i] == player for i in range(4))
-                ):
-                    return player
-                # Diagonal left-down
-                if (
-                    r + 3 < self.ROWS
-                    and c - 3 >= 0
-                    and all(self.board[r + i, c - i] == player for i in range(4))
-                ):
-                    return player
-
-        return 0
+        if self._winner is None:
+            self._winner = self._scan_winner()
+        return self._winner
+
+    def _scan_winner(self) -> int:
+        """Full-board scan, only needed for states built from a raw array."""
+        return lines.winner(self.board)
+
+    def _wins_at(self, row: int, col: int) -> bool:
+        """Whether the disc at (row, col) completes one of the lines through it."""
+        windows = self.board.ravel()[CELL_LINE_INDEX[row * self.COLS + col]]
+        return bool((windows == self.board[row, col]).all(axis=1).any())
 
     def is_col_free(self, col: int) -> bool:
         return self.board[0, col] == 0
 
     def get_heights(self) -> list[int]:
+        return list(self._cached_heights())
+
+    def _cached_heights(self) -> bytearray:
+        if self._heights is None:
+            self._heights = bytearray(self._scan_heights())
+        return self._heights
+
+    def _scan_heights(self) -> list[int]:
         heights = []
         for c in range(self.COLS):
             col = self.board[:, c]
@@ -88,33 +124,86 @@ class ConnectState(EnvironmentState):
         if not self.is_applicable(col):
             raise ValueError(f"Move not allowed in column {col}.")
 
+        heights = self._cached_heights()
+        r = self.ROWS - 1 - heights[col]
         new_board = self.board.copy()
-        for r in reversed(range(self.ROWS)):
-            if new_board[r, col] == 0:
-                new_board[r, col] = self.player
-                break
-
-        return ConnectState(new_board, -self.player)
-
-    def show(self, size: int = 1500, ax: plt.Axes | None = None) -> None:
-        if ax is None:
-            fig, ax = plt.subplots()
-        else:
-            fig = None
-
-        pos_red = np.where(self.board == -1)
-        pos_yellow = np.where(self.board == 1)
+        new_board[r, col] = self.player
+
+        # Build the successor without a second board copy; the result is
+        # decided by the lines through the new disc only, since the game
+        # was not over before it.
+        new_state = ConnectState.__new__(ConnectState)
+        new_state.board = new_board
+        new_state.player = -self.player
+        new_state.last_move = (r, col)
+        new_state._winner = self.player if new_state._wins_at(r, col) else 0
+        new_state._final = None
+        new_state._heights = bytearray(heights)
+        new_state._heights[col] += 1
+        new_state._history = None
+        new_state._key = (
+            None
+            if self._key is None
+            else self._key ^ ZOBRIST[self.player][r * self.COLS + col]
+        )
+        new_state._mirror_key = (
+            None
+            if self._mirror_key is None
+            else self._mirror_key ^ ZOBRIST[self.player][(r + 1) * self.COLS - 1 - col]
+        )
+        return new_state
 
-        ax.scatter(pos_yellow[1] + 0.5, 5.5 - pos_yellow[0], color="yellow", s=size)
-        ax.scatter(pos_red[1] + 0.5, 5.5 - pos_red[0], color="red", s=size)
+    def push(self, col: int) -> None:
+        """
+        Drop a disc for the active player in place, without allocating a new state.
 
-        ax.set_ylim([0, self.board.shape[0]])
-        ax.set_xlim([0, self.board.shape[1]])
-        ax.set_xticks(np.arange(self.board.shape[1] + 1))
-        ax.set_yticks(np.arange(self.board.shape[0] + 1))
-        ax.grid(True)
+        Meant for tree searches, which undo the move with ``pop`` once the
+        subtree is explored. Use ``transition`` when the previous state must
+        be kept.
 
-        ax.set_title("Connect Four")
+        Raises
+        ------
+        ValueError
+            If the move is invalid (e.g., column is full or game is over).
+        """
+        if not self.is_applicable(col):
+            raise ValueError(f"Move not allowed in column {col}.")
 
-        if fig is not None:
-            plt.show()
+        heights = self._cached_heights()
+        r = self.ROWS - 1 - heights[col]
+        if self._history is None:
+            self._history = []
+        self._history.append((self.last_move, self._winner, self._final))
+        self.board[r, col] = self.player
+        heights[col] += 1
+        self.last_move = (r, col)
+        self._winner = self.player if self._wins_at(r, col) else 0
+        self._final = None
+        self._toggle_keys(r, col)
+        self.player = -self.player
+
+    def pop(self) -> int:
+        """Undo the last ``push`` and return its column."""
+        if not self._history:
+            raise ValueError("No pushed move to undo.")
+
+        r, col = self.last_move
+        self.last_move, self._winner, self._final = self._history.pop()
+        self.board[r, col] = 0
+        self._heights[col] -= 1
+        self.player = -self.player
+        self._toggle_keys(r, col)
+        return col
+
+    def _toggle_keys(self, row: int, col: int) -> None:
+        """XOR the active player's disc at (row, col) in or out of the known keys."""
+        if self._key is not None:
+            self._key ^= ZOBRIST[self.player][row * self.COLS + col]
+        if self._mirror_key is not None:
+            self._mirror_key ^= ZOBRIST[self.player][(row + 1) * self.COLS - 1 - col]
+
+    def show(self, size: int = 1500, ax: "Axes | None" = None) -> None:
+        # Imported here so that headless users of ConnectState never load matplotlib
+        from connect4.render import show_board
+
+        show_board(self.board, size=size, ax=ax)
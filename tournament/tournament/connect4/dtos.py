@@ -1,4 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal
 from connect4.policy import Policy
 import numpy as np
 
@@ -26,3 +27,36 @@ class Match(BaseModel):
         default=[],
         description="List of the history of each game, a state-action pair list produced by the alternating sequence of player actions.",
     )
+
+
+class TimeControl(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    per_move: float | None = Field(default=None, description="Seconds allowed for each move.")
+    per_game: float | None = Field(default=None, description="Seconds allowed to each player for a whole game.")
+    on_overrun: Literal["forfeit", "fallback"] = Field(
+        default="fallback",
+        description="Lose the game on an overrun, or replace the late move by a fallback move.",
+    )
+
+
+class GameResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    player_a: str = Field(description="First Player of the pairing")
+    player_b: str = Field(description="Second Player of the pairing")
+    a_first: bool = Field(description="Whether player_a moved first in this game.")
+    winner: str | None = Field(default=None, description="Name of the winner, None for a draw.")
+    moves: list[Action] = Field(
+        default_factory=list,
+        description="Moves of the game; the boards can be replayed from them.",
+    )
+    times: list[float] = Field(default_factory=list, description="Seconds spent on each move, under a time control.")
+    overruns: list[int] = Field(default_factory=list, description="Plies whose move exceeded the time control.")
+
+    @property
+    def score_a(self) -> float:
+        """Points of player_a: 1 for a win, 0.5 for a draw, 0 for a loss."""
+        if self.winner is None:
+            return 0.5
+        return 1.0 if self.winner == self.player_a else 0.0
@@ -0,0 +1,137 @@
+"""
+Latency and search-effort instrumentation of the policies in a tournament.
+
+``Instrumentation`` records one row per ``mount`` and per ``act`` call: the
+policy name, the event, the seconds it took and the counters the policy
+reports through ``Policy.search_stats`` (nodes searched, MCTS simulations,
+Q-table size...). Policies are measured by wrapping them in
+``InstrumentedPolicy``; nothing is wrapped, and nothing is paid, when the
+instrumentation is off.
+"""
+
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from connect4.clock import mount_policy
+from connect4.dtos import TimeControl
+from connect4.policy import Policy
+
+PERCENTILES = (50, 95, 99)
+
+
+class Instrumentation:
+    """Rows of measurements, aggregated into percentiles per policy."""
+
+    def __init__(self, rows: list[dict] | None = None):
+        self.rows: list[dict] = rows if rows is not None else []
+
+    def record(self, policy: str, event: str, seconds: float, counters: dict | None = None) -> None:
+        self.rows.append({"policy": policy, "event": event, "seconds": seconds, **(counters or {})})
+
+    def merge(self, other: "Instrumentation") -> None:
+        self.rows.extend(other.rows)
+
+    def summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        ``{policy: {metric: stats}}`` with count, mean, max and p50/p95/p99.
+
+        Metrics are ``mount_seconds``, ``act_seconds`` and every counter
+        reported on ``act``.
+        """
+        samples: dict[str, dict[str, list[float]]] = {}
+        for row in self.rows:
+            metrics = samples.setdefault(row["policy"], {})
+            metrics.setdefault(f"{row['event']}_seconds", []).append(row["seconds"])
+            for key, value in row.items():
+                if key not in ("policy", "event", "seconds") and value is not None:
+                    metrics.setdefault(key, []).append(value)
+
+        summary: dict[str, dict[str, dict[str, float]]] = {}
+        for policy, metrics in samples.items():
+            summary[policy] = {}
+            for metric, values in metrics.items():
+                values = np.asarray(values, dtype=float)
+                stats = {"count": int(values.size), "mean": float(values.mean()), "max": float(values.max())}
+                for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                    stats[f"p{q}"] = float(v)
+                summary[policy][metric] = stats
+        return summary
+
+    def __str__(self) -> str:
+        lines = [f"{'policy':<12}{'metric':<16}{'count':>7}{'mean':>11}{'p50':>11}{'p95':>11}{'p99':>11}"]
+        for policy, metrics in self.summary().items():
+            for metric, s in metrics.items():
+                lines.append(
+                    f"{policy:<12}{metric:<16}{s['count']:>7}{s['mean']:>11.4g}"
+                    f"{s['p50']:>11.4g}{s['p95']:>11.4g}{s['p99']:>11.4g}"
+                )
+        return "\n".join(lines)
+
+    def to_csv(self, path: str | Path) -> None:
+        """Write the raw rows, one column per counter seen."""
+        columns = ["policy", "event", "seconds"]
+        for row in self.rows:
+            columns += [key for key in row if key not in columns]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> "Instrumentation":
+        rows = []
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                rows.append(
+                    {
+                        key: value if key in ("policy", "event") else float(value)
+                        for key, value in row.items()
+                        if value != ""
+                    }
+                )
+        return cls(rows)
+
+    def to_json(self, path: str | Path) -> None:
+        """Write the summary."""
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=4)
+
+
+class InstrumentedPolicy(Policy):
+    """Forward to ``policy``, recording each ``mount`` and ``act`` under ``name``."""
+
+    def __init__(self, policy: Policy, name: str, instrumentation: Instrumentation):
+        self.policy = policy
+        self.name = name
+        self.instrumentation = instrumentation
+
+    # The clock sets the deadline on the wrapper; the wrapped policy reads it
+    @property
+    def deadline(self) -> float | None:
+        return self.policy.deadline
+
+    @deadline.setter
+    def deadline(self, value: float | None) -> None:
+        self.policy.deadline = value
+
+    def mount(self, timeout: float | None = None) -> None:
+        start = time.perf_counter()
+        mount_policy(self.policy, TimeControl(per_move=timeout) if timeout is not None else None)
+        self.instrumentation.record(self.name, "mount", time.perf_counter() - start)
+
+    def act(self, s: np.ndarray) -> int:
+        start = time.perf_counter()
+        action = self.policy.act(s)
+        elapsed = time.perf_counter() - start
+        self.instrumentation.record(self.name, "act", elapsed, self.policy.search_stats())
+        return action
+
+    def reset(self) -> None:
+        self.policy.reset()
+
+    def search_stats(self) -> dict[str, float]:
+        return self.policy.search_stats()
@@ -0,0 +1,94 @@
+"""
+Four-in-a-row lines of the Connect Four board, precomputed at import.
+
+The 69 lines are available as flat cell indices (``LINE_INDEX``). The
+vectorized primitives below accept one ``(ROWS, COLS)`` board or any stack
+of boards shaped ``(..., ROWS, COLS)``.
+"""
+
+import numpy as np
+
+ROWS = 6
+COLS = 7
+
+# Right, down, diagonal right-down, diagonal left-down
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def _build_lines() -> np.ndarray:
+    lines = []
+    for r in range(ROWS):
+        for c in range(COLS):
+            for dr, dc in DIRECTIONS:
+                if 0 <= r + 3 * dr < ROWS and 0 <= c + 3 * dc < COLS:
+                    lines.append([(r + i * dr) * COLS + c + i * dc for i in range(4)])
+    return np.array(lines, dtype=np.intp)
+
+
+# (69, 4) flat cell indices (row * COLS + col) of every line
+LINE_INDEX = _build_lines()
+
+# For each flat cell, the (k, 4) slice of LINE_INDEX with the lines through it
+# (k is at most 13, for the central cells)
+CELL_LINE_INDEX = tuple(
+    LINE_INDEX[np.any(LINE_INDEX == cell, axis=1)] for cell in range(ROWS * COLS)
+)
+
+
+# For each flat cell, the ids (rows of LINE_INDEX) of the lines through it,
+# as plain ints for incremental updates in pure Python
+CELL_LINES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(int(i) for i in np.flatnonzero(np.any(LINE_INDEX == cell, axis=1)))
+    for cell in range(ROWS * COLS)
+)
+
+
+def _windows(board: np.ndarray) -> np.ndarray:
+    board = np.asarray(board)
+    return board.reshape(*board.shape[:-2], ROWS * COLS)[..., LINE_INDEX]
+
+
+def line_counts(board: np.ndarray, player: int) -> np.ndarray:
+    """Discs of ``player`` on each line, shaped ``(..., 69)``."""
+    return np.count_nonzero(_windows(board) == player, axis=-1)
+
+
+def count_open_threes(board: np.ndarray, player: int) -> np.ndarray | int:
+    """
+    Lines holding three discs of ``player`` and one empty cell.
+
+    Returns an int for a single board and a ``(...)`` array for a stack.
+    """
+    windows = _windows(board)
+    threes = (np.count_nonzero(windows == player, axis=-1) == 3) & (
+        np.count_nonzero(windows == 0, axis=-1) == 1
+    )
+    counts = np.count_nonzero(threes, axis=-1)
+    return int(counts) if np.ndim(counts) == 0 else counts
+
+
+def open_three_counts(board: np.ndarray) -> tuple[np.ndarray | int, np.ndarray | int]:
+    """
+    Open threes of Red (-1) and of Yellow (1) in a single pass over the lines.
+
+    A line sums to -3 (3) exactly when it holds three red (yellow) discs and
+    an empty cell, so one sum per line gives both counts. Same results as
+    two calls to ``count_open_threes``.
+    """
+    sums = _windows(board).sum(axis=-1, dtype=np.int16)
+    red = np.count_nonzero(sums == -3, axis=-1)
+    yellow = np.count_nonzero(sums == 3, axis=-1)
+    if np.ndim(red) == 0:
+        return int(red), int(yellow)
+    return red, yellow
+
+
+def winner(board: np.ndarray) -> np.ndarray | int:
+    """
+    Owner of a complete line (-1, 1) or 0, by a full scan of every line.
+
+    Returns an int for a single board and a ``(...)`` array for a stack.
+    """
+    sums = _windows(board).sum(axis=-1, dtype=np.int16)
+    result = np.where((sums == -4).any(axis=-1), -1, np.where((sums == 4).any(axis=-1), 1, 0))
+    return int(result) if np.ndim(result) == 0 else result
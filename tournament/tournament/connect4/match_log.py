@@ -0,0 +1,113 @@
+"""
+Streaming match logs: one compact JSON record per line.
+
+The first line describes the match and every following line is one game,
+appended and flushed as soon as the game ends::
+
+    {"player_a": "GroupA", "player_b": "GroupB"}
+    {"first": "GroupA", "winner": "GroupB", "moves": [3, 3, 2, ...]}
+
+Games played under a time control also record the seconds spent on each
+move (``times``), the plies that ran over (``overruns``) and, if the game
+was lost on time, ``"forfeit": true``.
+
+Games are stored as their move sequence; the board snapshots of a ``Game``
+are rebuilt by replaying the moves from the empty board.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+from connect4.clock import GameClock
+from connect4.connect_state import ConnectState
+from connect4.dtos import Game, Match
+
+
+def game_from_moves(moves: list[int]) -> Game:
+    """State-action pairs of a game, replayed from its moves."""
+    state = ConnectState()
+    game = Game()
+    for move in moves:
+        game.append((state.board.tolist(), int(move)))
+        state = state.transition(int(move))
+    return game
+
+
+class MatchLogger:
+    """
+    Append the games of one match to a JSON Lines file as they are played.
+
+    Usable as a context manager; the file is opened (and truncated) on
+    construction and the header line is written right away.
+    """
+
+    def __init__(self, path: str | Path, player_a: str, player_b: str):
+        self.path = Path(path)
+        self.player_a = player_a
+        self.player_b = player_b
+        self._file = open(self.path, "w")
+        self._write({"player_a": player_a, "player_b": player_b})
+
+    def log_game(
+        self,
+        moves: list[int],
+        first: str,
+        winner: str | None,
+        clock: GameClock | None = None,
+    ) -> None:
+        """Append one game: its moves, the name of the first player and the winner."""
+        record = {"first": first, "winner": winner, "moves": [int(m) for m in moves]}
+        if clock is not None:
+            record["times"] = [round(t, 5) for t in clock.times]
+            record["overruns"] = clock.overruns
+            if clock.forfeit is not None:
+                record["forfeit"] = True
+        self._write(record)
+
+    def _write(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "MatchLogger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_games(path: str | Path) -> Iterator[dict]:
+    """Game records of a match log, read lazily one line at a time."""
+    with open(path) as f:
+        next(f)  # header
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_match(path: str | Path) -> Match:
+    """Rebuild the ``Match`` (counts and full game histories) of a match log."""
+    with open(path) as f:
+        header = json.loads(next(f))
+    a_name, b_name = header["player_a"], header["player_b"]
+    a_wins = b_wins = draws = 0
+    games: list[Game] = []
+    for record in iter_games(path):
+        if record["winner"] == a_name:
+            a_wins += 1
+        elif record["winner"] == b_name:
+            b_wins += 1
+        else:
+            draws += 1
+        games.append(game_from_moves(record["moves"]))
+    return Match(
+        player_a=a_name,
+        player_b=b_name,
+        player_a_wins=a_wins,
+        player_b_wins=b_wins,
+        draws=draws,
+        games=games,
+    )
@@ -1,13 +1,43 @@
 import numpy as np
+import time
 from abc import ABC, abstractmethod
 
 
 class Policy(ABC):
 
+    # time.perf_counter() value by which act must return, set by the tournament
+    # before each move under a time control; None when moves are not timed
+    deadline: float | None = None
+
     @abstractmethod
-    def mount(self) -> None:
+    def mount(self, timeout: float | None = None) -> None:
         pass
 
     @abstractmethod
     def act(self, s: np.ndarray) -> int:
         pass
+
+    def reset(self) -> None:
+        """
+        Get ready for a new game without mounting again.
+
+        The tournament constructs and mounts each policy once per match and
+        calls ``reset`` before every game, so a policy that keeps per-game
+        state must clear it here and play as if freshly mounted.
+        """
+        pass
+
+    def search_stats(self) -> dict[str, float]:
+        """
+        Counters about the last ``act`` call, for the tournament instrumentation.
+
+        Conventional keys are ``nodes`` (positions searched), ``simulations``
+        (MCTS playouts) and ``q_states`` (Q-table size). Empty by default.
+        """
+        return {}
+
+    def time_left(self) -> float | None:
+        """Seconds left until ``deadline``, or None if the move is not timed."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.perf_counter()
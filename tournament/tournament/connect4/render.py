@@ -0,0 +1,35 @@
+"""
+Matplotlib rendering of Connect Four boards.
+
+Kept apart from the engine so that importing ``connect4.connect_state`` only
+pulls in NumPy; this module is imported the first time a board is drawn.
+"""
+
+# Libraries
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def show_board(board: np.ndarray, size: int = 1500, ax: plt.Axes | None = None) -> None:
+    """Draw ``board`` on ``ax``, or on a new figure that is shown right away."""
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        fig = None
+
+    pos_red = np.where(board == -1)
+    pos_yellow = np.where(board == 1)
+
+    ax.scatter(pos_yellow[1] + 0.5, 5.5 - pos_yellow[0], color="yellow", s=size)
+    ax.scatter(pos_red[1] + 0.5, 5.5 - pos_red[0], color="red", s=size)
+
+    ax.set_ylim([0, board.shape[0]])
+    ax.set_xlim([0, board.shape[1]])
+    ax.set_xticks(np.arange(board.shape[1] + 1))
+    ax.set_yticks(np.arange(board.shape[0] + 1))
+    ax.grid(True)
+
+    ax.set_title("Connect Four")
+
+    if fig is not None:
+        plt.show()
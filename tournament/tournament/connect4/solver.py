@@ -0,0 +1,307 @@
+"""
+Perfect-play solver for Connect Four positions.
+
+A negamax search with alpha-beta pruning on two integer bitboards (the
+``BitboardState`` layout), following the classic strong solver: moves that
+hand the opponent an immediate win are never searched, columns are tried by
+the number of threats they create (center first on ties), a transposition
+table keeps upper bounds of the positions already searched, and the exact
+score is found by a sequence of null-window searches.
+
+Scores are those of the side to move: 0 for a draw, positive for a win and
+negative for a loss, larger the sooner the game ends (a win with the
+player's k-th disc scores ``22 - k``).
+
+Solving is exponential in the number of empty cells. ``solve`` accepts a
+node and a time limit; when one is reached it returns the best move of a
+cheap heuristic (non-losing moves first, then most threats created) with
+``exact=False`` and the bounds proven on the score so far.
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from connect4.bitboard_state import BitboardState
+from connect4.connect_state import ConnectState
+
+WIDTH = 7
+HEIGHT = 6
+H1 = HEIGHT + 1
+CELLS = WIDTH * HEIGHT
+MIN_SCORE = -(CELLS // 2) + 3
+MAX_SCORE = (CELLS + 1) // 2 - 3
+
+# Columns tried first: the center takes part in the most lines
+COLUMN_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+BOTTOM_MASK = sum(1 << (c * H1) for c in range(WIDTH))
+BOARD_MASK = BOTTOM_MASK * ((1 << HEIGHT) - 1)
+COLUMN_MASKS = tuple(((1 << HEIGHT) - 1) << (c * H1) for c in range(WIDTH))
+
+# Transposition table entries kept before it is cleared
+DEFAULT_TABLE_SIZE = 1 << 19
+
+
+class SolveResult(NamedTuple):
+    """Outcome of ``Solver.solve``."""
+
+    move: int  # column to play
+    score: int | None  # exact score, None when the search was cut short
+    exact: bool  # whether the score and the move are proven optimal
+    low: int  # proven bounds on the score (equal when exact)
+    high: int
+    nodes: int  # positions searched
+
+    @property
+    def value(self) -> int | None:
+        """Game-theoretic value for the side to move: 1 win, 0 draw, -1 loss (None if unknown)."""
+        return None if self.score is None else (self.score > 0) - (self.score < 0)
+
+
+class SearchLimit(Exception):
+    """Raised inside the search when the node or time limit is reached."""
+
+
+def winning_cells(position: int, mask: int) -> int:
+    """Empty cells (playable or not) that would complete a line of ``position``."""
+    # vertical
+    r = (position << 1) & (position << 2) & (position << 3)
+    for shift in (H1, H1 - 1, H1 + 1):  # horizontal and both diagonals
+        p = (position << shift) & (position << 2 * shift)
+        r |= p & (position << 3 * shift)
+        r |= p & (position >> shift)
+        p = (position >> shift) & (position >> 2 * shift)
+        r |= p & (position << shift)
+        r |= p & (position >> 3 * shift)
+    return r & (BOARD_MASK ^ mask)
+
+
+def encode(state: ConnectState) -> tuple[int, int, int]:
+    """``(position, mask, moves)`` bitboards of a state: discs of the side to move, all discs, disc count."""
+    red, yellow = BitboardState.encode(state.board)
+    mask = red | yellow
+    return (red if state.player == -1 else yellow), mask, mask.bit_count()
+
+
+def state_from_board(board: np.ndarray) -> ConnectState:
+    """State of a raw board, with the side to move inferred from the number of discs."""
+    return ConnectState(board, -1 if np.count_nonzero(board) % 2 == 0 else 1)
+
+
+class Solver:
+    """
+    Negamax solver with a transposition table shared by successive calls.
+
+    Parameters
+    ----------
+    table_size : int, optional
+        Transposition table entries kept; the table is cleared when it grows
+        past this size (default is 2**19, roughly 50 MB).
+    """
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE):
+        self.table_size = table_size
+        self.table: dict[int, int] = {}
+        self.nodes = 0
+        self._max_nodes: int | None = None
+        self._deadline: float | None = None
+        self._bounds = (0, 0)  # [low, high] proven so far on the score being solved
+
+    def reset(self) -> None:
+        self.table.clear()
+
+    def solve(
+        self,
+        state: ConnectState,
+        max_nodes: int | None = None,
+        deadline: float | None = None,
+    ) -> SolveResult:
+        """
+        Exact score and best move of a non-final position.
+
+        Parameters
+        ----------
+        state : ConnectState
+            Position to solve, with ``player`` to move.
+        max_nodes : int, optional
+            Positions searched before giving up (default is None, no limit).
+        deadline : float, optional
+            ``time.perf_counter()`` value at which to give up (default is
+            None, no limit).
+
+        Returns
+        -------
+        SolveResult
+            The best move and exact score, or a heuristic move with
+            ``exact=False`` if a limit was reached first.
+
+        Raises
+        ------
+        ValueError
+            If the game is already over.
+        """
+        if state.is_final():
+            raise ValueError("Cannot solve a finished game.")
+        position, mask, moves = encode(state)
+        self.nodes = 0
+        self._max_nodes = max_nodes
+        self._deadline = deadline
+        if len(self.table) > self.table_size:
+            self.table.clear()
+
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        wins = winning_cells(position, mask) & possible
+        if wins:
+            score = (CELLS + 1 - moves) // 2
+            return SolveResult(self._column(wins), score, True, score, score, 1)
+
+        self._bounds = (-((CELLS - moves) // 2), (CELLS + 1 - moves) // 2)
+        try:
+            score = self._narrow(position, mask, moves)
+            move = self._best_move(position, mask, moves, score)
+        except SearchLimit:
+            low, high = self._bounds
+            return SolveResult(self.heuristic_move(position, mask), None, False, low, high, self.nodes)
+        return SolveResult(move, score, True, score, score, self.nodes)
+
+    def _narrow(self, position: int, mask: int, moves: int) -> int:
+        """Null-window searches until the score is known, tightening ``self._bounds`` as they go."""
+        low, high = self._bounds
+        while low < high:
+            med = low + (high - low) // 2
+            # Probe close to 0 first: most positions are draws or short wins
+            if med <= 0 and -(-low // 2) < med:
+                med = -(-low // 2)
+            elif med >= 0 and high // 2 > med:
+                med = high // 2
+            r = self._negamax(position, mask, moves, med, med + 1)
+            if r <= med:
+                high = r
+            else:
+                low = r
+            self._bounds = (low, high)
+        return low
+
+    def _best_move(self, position: int, mask: int, moves: int, score: int) -> int:
+        """A column whose resulting position keeps ``score`` for the side to move."""
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        opponent_wins = winning_cells(position ^ mask, mask)
+        candidates = []
+        for col in COLUMN_ORDER:
+            move = possible & COLUMN_MASKS[col]
+            if move:
+                candidates.append((col, move))
+        for col, move in candidates:
+            child_position, child_mask = position ^ mask, mask | move
+            child_possible = (child_mask + BOTTOM_MASK) & BOARD_MASK
+            if winning_cells(child_position, child_mask) & child_possible:
+                continue  # the opponent wins at once: never optimal unless everything loses
+            if moves + 1 == CELLS:
+                return col
+            # The child scores at most -score exactly when this move keeps the score
+            if self._negamax(child_position, child_mask, moves + 1, -score, -score + 1) <= -score:
+                return col
+        # Every move loses at once (or only the forced ones were left): block if possible
+        forced = possible & opponent_wins
+        return self._column(forced) if forced else candidates[0][0]
+
+    def _negamax(self, position: int, mask: int, moves: int, alpha: int, beta: int) -> int:
+        """Score of the side to move within ``(alpha, beta)``; assumes it cannot win at once."""
+        self.nodes += 1
+        if self._max_nodes is not None and self.nodes > self._max_nodes:
+            raise SearchLimit()
+        if self._deadline is not None and self.nodes & 255 == 0 and time.perf_counter() >= self._deadline:
+            raise SearchLimit()
+
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        opponent_wins = winning_cells(position ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return -((CELLS - moves) // 2)  # two threats to block: lost
+            possible = forced
+        # Never play just below a cell that wins for the opponent
+        non_losing = possible & ~(opponent_wins >> 1)
+        if not non_losing:
+            return -((CELLS - moves) // 2)
+
+        if moves >= CELLS - 2:
+            return 0
+
+        lowest = -((CELLS - 2 - moves) // 2)
+        if alpha < lowest:
+            alpha = lowest
+            if alpha >= beta:
+                return alpha
+        highest = (CELLS - 1 - moves) // 2
+        key = position + mask
+        stored = self.table.get(key)
+        if stored is not None:
+            highest = stored + MIN_SCORE - 1
+        if beta > highest:
+            beta = highest
+            if alpha >= beta:
+                return beta
+
+        # Columns by threats created, center first on ties
+        ordered = []
+        for col in COLUMN_ORDER:
+            move = non_losing & COLUMN_MASKS[col]
+            if move:
+                ordered.append((winning_cells(position | move, mask).bit_count(), -len(ordered), move))
+        ordered.sort(reverse=True)
+
+        for _, _, move in ordered:
+            score = -self._negamax(position ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.table[key] = alpha - MIN_SCORE + 1
+        return alpha
+
+    @staticmethod
+    def heuristic_move(position: int, mask: int) -> int:
+        """
+        Move of a cheap heuristic: an immediate win, else a forced block, else
+        the non-losing move creating the most threats (center first on ties).
+        """
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        wins = winning_cells(position, mask) & possible
+        if wins:
+            return Solver._column(wins)
+        opponent_wins = winning_cells(position ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            return Solver._column(forced)
+        candidates = possible & ~(opponent_wins >> 1) or possible
+        best, best_threats = -1, -1
+        for col in COLUMN_ORDER:
+            move = candidates & COLUMN_MASKS[col]
+            if move:
+                threats = winning_cells(position | move, mask).bit_count()
+                if threats > best_threats:
+                    best, best_threats = col, threats
+        return best
+
+    @staticmethod
+    def _column(moves: int) -> int:
+        """Most central column holding one of the cells in ``moves``."""
+        return next(col for col in COLUMN_ORDER if moves & COLUMN_MASKS[col])
+
+
+# Shared by the module-level helpers, so repeated calls reuse the table
+_SOLVER = Solver()
+
+
+def solve(state: ConnectState, max_nodes: int | None = None, deadline: float | None = None) -> SolveResult:
+    """``Solver.solve`` with a solver shared by the whole process."""
+    return _SOLVER.solve(state, max_nodes, deadline)
+
+
+def solve_board(board: np.ndarray, max_nodes: int | None = None, deadline: float | None = None) -> SolveResult:
+    """``solve`` for a raw board as received by ``Policy.act``."""
+    return solve(state_from_board(board), max_nodes, deadline)
@@ -0,0 +1,64 @@
+"""
+Left/right mirror symmetry of Connect Four.
+
+A position and its mirror image have the same value, with column ``c``
+playing the role of ``COLS - 1 - c``. Tables keyed by the canonical
+orientation (the one with the smaller Zobrist key) store each pair once.
+Actions are translated to that orientation with ``orient_action`` before
+indexing and translated back the same way, since mirroring is an
+involution.
+"""
+
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4.zobrist import board_key
+
+
+def mirror_board(board: np.ndarray) -> np.ndarray:
+    """Left/right mirror image of a board (a view, not a copy)."""
+    return board[:, ::-1]
+
+
+def orient_action(action: int, mirrored: bool) -> int:
+    """Map a column between the actual and the canonical orientation."""
+    return ConnectState.COLS - 1 - action if mirrored else action
+
+
+def orient_values(values: np.ndarray, mirrored: bool) -> np.ndarray:
+    """Map a per-column array between the actual and the canonical orientation."""
+    return values[::-1] if mirrored else values
+
+
+def canonical_key(state: ConnectState) -> tuple[int, bool]:
+    """
+    Canonical Zobrist key of a state.
+
+    Returns
+    -------
+    tuple[int, bool]
+        The key and whether the canonical orientation is the mirror image.
+    """
+    key, mirror_key = state.key, state.mirror_key
+    return (mirror_key, True) if mirror_key < key else (key, False)
+
+
+def canonical_board_key(board: np.ndarray) -> tuple[int, bool]:
+    """``canonical_key`` for a raw ndarray board."""
+    key, mirror_key = board_key(board), board_key(mirror_board(board))
+    return (mirror_key, True) if mirror_key < key else (key, False)
+
+
+def canonical_board(board: np.ndarray) -> tuple[np.ndarray, bool]:
+    """
+    Canonical orientation of a raw board, for tables keyed by the board itself.
+
+    The lexicographically smaller of the board and its mirror image is
+    canonical.
+    """
+    mirrored = mirror_board(board)
+    flat, flat_mirror = np.asarray(board).ravel(), np.asarray(mirrored).ravel()
+    differ = np.flatnonzero(flat != flat_mirror)
+    if len(differ) and flat_mirror[differ[0]] < flat[differ[0]]:
+        return mirrored, True
+    return board, False
@@ -0,0 +1,113 @@
+"""
+Fixed-size transposition table for tree searches, keyed by Zobrist keys.
+
+The table is a set of numpy arrays of ``size`` buckets with two slots each
+(two-tier replacement):
+
+- slot 0 keeps the deepest search of the positions hashed to the bucket and
+  is only replaced by a search at least as deep, or by any search once its
+  entry is left over from an earlier ``new_search``;
+- slot 1 always takes the newest entry that slot 0 refused.
+
+Each entry stores the full 64-bit key (collisions on the bucket index are
+detected), the remaining depth, the value, whether that value is exact or
+a lower/upper bound, and the best move found. The memory used is fixed at
+construction: ``BYTES_PER_ENTRY`` bytes per slot.
+"""
+
+import numpy as np
+
+# Bound types of a stored value
+EXACT = 0
+LOWER = 1  # the value is a lower bound (the search failed high)
+UPPER = 2  # the value is an upper bound (the search failed low)
+
+# key (8) + value (8) + depth, bound, move and generation (1 each)
+BYTES_PER_ENTRY = 20
+
+
+class TranspositionTable:
+    """
+    Two-tier transposition table of ``size`` buckets (rounded up to a power of two).
+
+    Keys are Python ints in [0, 2**64), as given by ``ConnectState.key``.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        self.size = 1 << max(0, int(size) - 1).bit_length()
+        self.mask = self.size - 1
+        self.keys = np.zeros((self.size, 2), dtype=np.uint64)
+        self.values = np.zeros((self.size, 2), dtype=np.float64)
+        self.depths = np.full((self.size, 2), -1, dtype=np.int8)  # -1: empty slot
+        self.bounds = np.zeros((self.size, 2), dtype=np.int8)
+        self.moves = np.full((self.size, 2), -1, dtype=np.int8)
+        self.generations = np.zeros((self.size, 2), dtype=np.uint8)
+        self.generation = 0
+        self.probes = self.hits = self.stores = 0
+
+    @classmethod
+    def from_megabytes(cls, megabytes: float) -> "TranspositionTable":
+        """Largest table (in power-of-two buckets) that fits in ``megabytes``."""
+        buckets = max(1, int(megabytes * 2**20 / (2 * BYTES_PER_ENTRY)))
+        return cls(1 << (buckets.bit_length() - 1))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.keys, self.values, self.depths, self.bounds, self.moves, self.generations))
+
+    def probe(self, key: int) -> tuple[int, float, int, int] | None:
+        """``(depth, value, bound, move)`` stored for ``key``, or None."""
+        self.probes += 1
+        bucket = key & self.mask
+        for slot in (0, 1):
+            if self.depths[bucket, slot] >= 0 and int(self.keys[bucket, slot]) == key:
+                self.hits += 1
+                return (
+                    int(self.depths[bucket, slot]),
+                    float(self.values[bucket, slot]),
+                    int(self.bounds[bucket, slot]),
+                    int(self.moves[bucket, slot]),
+                )
+        return None
+
+    def store(self, key: int, depth: int, value: float, bound: int, move: int = -1) -> None:
+        """Record the result of searching ``key`` to ``depth``, replacing by the two-tier rule."""
+        self.stores += 1
+        bucket = key & self.mask
+        slot = 1
+        if (
+            self.depths[bucket, 0] < 0
+            or self.generations[bucket, 0] != self.generation
+            or depth >= self.depths[bucket, 0]
+            or int(self.keys[bucket, 0]) == key
+        ):
+            slot = 0
+        self.keys[bucket, slot] = key
+        self.values[bucket, slot] = value
+        self.depths[bucket, slot] = depth
+        self.bounds[bucket, slot] = bound
+        self.moves[bucket, slot] = move
+        self.generations[bucket, slot] = self.generation
+
+    def new_search(self) -> None:
+        """
+        Start a new search (e.g. a new move): entries are kept, but the deep
+        slots written before may now be replaced by shallower results.
+        Resets the probe and hit counters.
+        """
+        self.generation = (self.generation + 1) % 256
+        self.probes = self.hits = self.stores = 0
+
+    def clear(self) -> None:
+        self.depths.fill(-1)
+        self.moves.fill(-1)
+        self.generation = 0
+        self.probes = self.hits = self.stores = 0
+
+    def hit_rate(self) -> float:
+        """Hits per probe since the last ``new_search``."""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def fill(self) -> float:
+        """Fraction of the slots in use."""
+        return float(np.count_nonzero(self.depths >= 0)) / self.depths.size
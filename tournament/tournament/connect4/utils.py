@@ -1,27 +1,273 @@
 import sys
+import ast
+import json
+import hashlib
 import pathlib
-import inspect
 import importlib
-from typing import Type
+from typing import Any, Type
 
+# Directories that never hold policy sources
+SKIPPED_DIRS = {"__pycache__"}
 
-def find_importable_classes(folder_route: str, base_class: Type) -> dict[str, Type]:
-    candidates = {}
+# Manifest cache, next to the bytecode caches (ignored by git)
+MANIFEST_NAME = "policy_manifest.json"
+MANIFEST_VERSION = 3
+
+
+class PolicyRef:
+    """
+    Lazy reference to a policy class found by ``find_importable_classes``.
+
+    Calling it constructs the policy, as calling the class would; the module
+    is imported on the first call only. References pickle by module and
+    class name, so worker processes import the module themselves on first
+    use.
+    """
+
+    def __init__(self, module: str, name: str, root: str):
+        self.module = module
+        self.name = name
+        self.root = root
+        self._cls: Type | None = None
+
+    def load(self) -> Type:
+        """Import the module (once) and return the class."""
+        if self._cls is None:
+            if self.root not in sys.path:
+                sys.path.insert(0, self.root)
+            self._cls = getattr(importlib.import_module(self.module), self.name)
+        return self._cls
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __reduce__(self):
+        return PolicyRef, (self.module, self.name, self.root)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PolicyRef) and (self.module, self.name) == (other.module, other.name)
+
+    def __hash__(self) -> int:
+        return hash((self.module, self.name))
+
+    def __repr__(self) -> str:
+        return f"<policy {self.module}.{self.name}>"
+
+
+def module_of(rel: str) -> str:
+    """Dotted module name of a source path relative to the project root."""
+    return ".".join(pathlib.PurePosixPath(rel).with_suffix("").parts)
+
+
+def iter_sources(folder_path: pathlib.Path):
+    """Python source files under ``folder_path``, skipping caches and hidden folders."""
+    for path in sorted(folder_path.iterdir()):
+        if path.is_dir():
+            if path.name not in SKIPPED_DIRS and not path.name.startswith("."):
+                yield from iter_sources(path)
+        elif path.suffix == ".py":
+            yield path
+
+
+def dotted_name(node: ast.expr) -> str | None:
+    """``a.b.C`` for a ``Name`` or ``Attribute`` chain, None for anything else."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = dotted_name(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    return None
+
+
+def declared_classes(source: bytes, module_name: str) -> dict[str, list[str]]:
+    """
+    Top-level classes of a module and their bases, found without importing it.
+
+    Bases are dotted names resolved through the module's imports
+    (``from groups.GroupA.policy import Aha`` makes ``Aha`` read
+    ``groups.GroupA.policy.Aha``) and its own classes. A name bound by none
+    of them is read in every module star-imported (``from m import *``), or
+    left as written if there is none.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {}
+    package = module_name.split(".")[:-1]
+    aliases = {}
+    starred = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".")[0]
+                    aliases[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            parts = package[:len(package) - node.level + 1] if node.level else []
+            origin = ".".join(parts + ([node.module] if node.module else []))
+            for alias in node.names:
+                if alias.name == "*":
+                    starred.append(origin)
+                else:
+                    aliases[alias.asname or alias.name] = f"{origin}.{alias.name}"
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    for node in classes:
+        aliases[node.name] = f"{module_name}.{node.name}"
+
+    declared = {}
+    for node in classes:
+        bases = []
+        for base in node.bases:
+            name = dotted_name(base)
+            if name is None:
+                continue
+            head, _, rest = name.partition(".")
+            if head in aliases:
+                heads = [aliases[head]]
+            else:
+                heads = [f"{origin}.{head}" for origin in starred] or [head]
+            bases += [f"{head}.{rest}" if rest else head for head in heads]
+        declared[node.name] = bases
+    return declared
+
+
+def subclass_resolver(classes: dict[str, list[str]], base_class: Type, project_root: pathlib.Path):
+    """
+    Predicate telling whether a dotted class name is ``base_class`` or
+    derives from it.
+
+    ``base_class`` is recognized by its full name (``connect4.policy.Policy``),
+    never by its name alone. Names in ``classes`` (``{"module.Class": bases}``,
+    from ``declared_classes``) are followed through their bases. A name found
+    nowhere in ``classes`` (a class re-exported or defined outside the
+    scanned folder) is imported and checked with ``issubclass``, for project
+    modules only; one that cannot be imported does not derive.
+    """
+    target = f"{base_class.__module__}.{base_class.__qualname__}"
+    memo: dict[str, bool] = {target: True}
+
+    def imported_subclass(name: str) -> bool:
+        module, _, attr = name.rpartition(".")
+        top = module.split(".")[0]
+        if not module or not ((project_root / top).is_dir() or (project_root / f"{top}.py").is_file()):
+            return False
+        if str(project_root) not in sys.path:
+            sys.path.insert(0, str(project_root))
+        try:
+            obj = getattr(importlib.import_module(module), attr)
+        except (ImportError, AttributeError):
+            return False
+        return isinstance(obj, type) and issubclass(obj, base_class)
+
+    def derives(name: str) -> bool:
+        if name not in memo:
+            memo[name] = False  # guards against cyclic bases
+            if name in classes:
+                memo[name] = any(derives(base) for base in classes[name])
+            else:
+                memo[name] = imported_subclass(name)
+        return memo[name]
+
+    return derives
+
+
+def build_manifest(folder_route: str, base_class: Type) -> dict[str, dict]:
+    """
+    ``{group: {"module", "class", "file", "sha256"}}`` for every policy under
+    ``folder_route``.
+
+    Files are scanned with ``ast``, not imported: a class is a policy if its
+    bases lead to ``base_class`` through the scanned files' classes and
+    imports. Only a base that cannot be followed that way (see
+    ``subclass_resolver``) imports its module. The per-file scans are
+    cached in ``folder_route/__pycache__/policy_manifest.json`` and reused
+    while a file's size and modification time (or, failing that, its hash)
+    are unchanged.
+    """
     folder_path = pathlib.Path(folder_route).resolve()
     project_root = folder_path.parents[0]
+    cache_path = folder_path / "__pycache__" / MANIFEST_NAME
 
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    cached: dict[str, dict] = {}
+    try:
+        data = json.loads(cache_path.read_text())
+        if data.get("version") == MANIFEST_VERSION and data.get("base") == base_class.__name__:
+            cached = data["files"]
+    except (OSError, ValueError):
+        pass
 
-    for py_file in folder_path.rglob("*.py"):
-        rel_path = py_file.relative_to(project_root).with_suffix("")
-        module_name = ".".join(rel_path.parts)
+    files: dict[str, dict] = {}
+    for py_file in iter_sources(folder_path):
+        rel = py_file.relative_to(project_root).as_posix()
+        stat = py_file.stat()
+        entry = cached.get(rel)
+        if entry is None or (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            source = py_file.read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            if entry is None or entry["sha256"] != digest:
+                entry = {"sha256": digest, "classes": declared_classes(source, module_of(rel))}
+            entry = {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        files[rel] = entry
+
+    if files != cached:
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"version": MANIFEST_VERSION, "base": base_class.__name__, "files": files})
+            )
+        except OSError:
+            pass  # read-only checkout: rescan next time
+
+    classes = {
+        f"{module_of(rel)}.{class_name}": bases
+        for rel, entry in files.items()
+        for class_name, bases in entry["classes"].items()
+    }
+    derives = subclass_resolver(classes, base_class, project_root)
+
+    manifest = {}
+    for rel, entry in files.items():
+        module_name = module_of(rel)
+        for class_name in entry["classes"]:
+            if not derives(f"{module_name}.{class_name}"):
+                continue
+            manifest[module_name.split(".")[1]] = {
+                "module": module_name,
+                "class": class_name,
+                "file": rel,
+                "sha256": entry["sha256"],
+            }
+    return manifest
+
+
+def find_importable_classes(
+    folder_route: str, base_class: Type, lazy: bool = True
+) -> dict[str, PolicyRef | Type]:
+    """
+    Policies under ``folder_route``, one per group (first folder level).
+
+    With ``lazy`` (the default) the values are ``PolicyRef`` objects that
+    import their module when the policy is first constructed; otherwise the
+    modules are imported now and the classes returned, skipping groups whose
+    module fails to import.
+    """
+    folder_path = pathlib.Path(folder_route).resolve()
+    project_root = str(folder_path.parents[0])
+
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    candidates = {}
+    for group, entry in build_manifest(folder_route, base_class).items():
+        ref = PolicyRef(entry["module"], entry["class"], project_root)
+        if lazy:
+            candidates[group] = ref
+            continue
         try:
-            module = importlib.import_module(module_name)
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, base_class) and obj is not base_class:
-                    candidates[obj.__module__.split(".")[1]] = obj
-        except Exception as _:
+            candidates[group] = ref.load()
+        except (ImportError, AttributeError):
             continue
 
     return candidates
@@ -0,0 +1,145 @@
+import numpy as np
+
+from connect4.connect_state import ConnectState
+from connect4 import lines
+from connect4.lines import CELL_LINE_INDEX
+
+
+def _pad_cell_lines() -> tuple[np.ndarray, np.ndarray]:
+    """Stack CELL_LINE_INDEX into a (42, 13, 4) table plus a validity mask."""
+    width = max(len(cell_lines) for cell_lines in CELL_LINE_INDEX)
+    table = np.zeros((len(CELL_LINE_INDEX), width, 4), dtype=np.intp)
+    valid = np.zeros((len(CELL_LINE_INDEX), width), dtype=bool)
+    for cell, cell_lines in enumerate(CELL_LINE_INDEX):
+        table[cell, : len(cell_lines)] = cell_lines
+        valid[cell, : len(cell_lines)] = True
+    return table, valid
+
+
+_CELL_LINES, _CELL_LINES_VALID = _pad_cell_lines()
+
+
+class VecConnectState:
+    """
+    N independent Connect Four games stepped together.
+
+    Boards live in a single ``(N, ROWS, COLS)`` int8 array with the same
+    encoding as ``ConnectState`` (-1 = Red, 1 = Yellow, 0 = empty). Every
+    game starts with Red to move. Win detection only looks at the lines
+    through the disc just dropped in each game, gathered with one fancy
+    index over all boards.
+
+    Parameters
+    ----------
+    n : int
+        Number of concurrent games.
+    auto_reset : bool, optional
+        Whether finished games are cleared right after the step that ends
+        them (default is True). Otherwise they stay terminal and their
+        actions are ignored by later steps.
+    """
+
+    ROWS = ConnectState.ROWS
+    COLS = ConnectState.COLS
+
+    def __init__(self, n: int, auto_reset: bool = True):
+        self.n = n
+        self.auto_reset = auto_reset
+        self.boards = np.zeros((n, self.ROWS, self.COLS), dtype=np.int8)
+        self.heights = np.zeros((n, self.COLS), dtype=np.int8)
+        self.player = np.full(n, -1, dtype=np.int8)
+        self.moves = np.zeros(n, dtype=np.int8)
+        self.winner = np.zeros(n, dtype=np.int8)
+        self.done = np.zeros(n, dtype=bool)
+
+    def reset(self, mask: np.ndarray | None = None) -> None:
+        """Clear the games selected by the boolean ``mask`` (all by default)."""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.boards[mask] = 0
+        self.heights[mask] = 0
+        self.player[mask] = -1
+        self.moves[mask] = 0
+        self.winner[mask] = 0
+        self.done[mask] = False
+
+    def legal_mask(self) -> np.ndarray:
+        """``(N, COLS)`` boolean mask of the columns each game can play."""
+        return (self.heights < self.ROWS) & ~self.done[:, None]
+
+    def random_actions(self, rng: np.random.Generator) -> np.ndarray:
+        """Pick a uniformly random legal column for every game."""
+        scores = rng.random((self.n, self.COLS))
+        scores[~self.legal_mask()] = -1.0
+        return scores.argmax(axis=1)
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Drop one disc in every game.
+
+        Parameters
+        ----------
+        actions : np.ndarray
+            ``(N,)`` column played in each game by its active player.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            ``(winner, done)``: the winner of each game after this move
+            (0 if none or draw) and whether the move ended it. With
+            ``auto_reset`` the finished games are already cleared.
+
+        Raises
+        ------
+        ValueError
+            If any action is out of range or targets a full column.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (self.n,) or (actions < 0).any() or (actions >= self.COLS).any():
+            raise ValueError("Actions must be one column index per game.")
+
+        # Finished games (only kept when auto_reset is off) ignore their action
+        games = np.flatnonzero(~self.done)
+        if not len(games):
+            return np.zeros(self.n, dtype=np.int8), np.zeros(self.n, dtype=bool)
+        actions = actions[games]
+        if not (self.heights[games, actions] < self.ROWS).all():
+            raise ValueError("Move not allowed in at least one game.")
+
+        player = self.player[games]
+        rows = self.ROWS - 1 - self.heights[games, actions]
+        self.boards[games, rows, actions] = player
+        self.heights[games, actions] += 1
+        self.moves[games] += 1
+
+        # Gather the (at most 13) lines through each new disc
+        cells = rows * self.COLS + actions
+        cell_lines = _CELL_LINES[cells]
+        flat = self.boards.reshape(self.n, -1)[games]
+        windows = np.take_along_axis(
+            flat, cell_lines.reshape(len(games), -1), axis=1
+        ).reshape(cell_lines.shape)
+        complete = (windows == player[:, None, None]).all(axis=2)
+        won = (complete & _CELL_LINES_VALID[cells]).any(axis=1)
+        ended = won | (self.moves[games] == self.ROWS * self.COLS)
+
+        winner = np.zeros(self.n, dtype=np.int8)
+        winner[games] = np.where(won, player, 0)
+        done = np.zeros(self.n, dtype=bool)
+        done[games] = ended
+        self.winner[games] = winner[games]
+        self.done[games] = ended
+        self.player[games] *= -1
+
+        if self.auto_reset and ended.any():
+            self.reset(done)
+        return winner, done
+
+    @staticmethod
+    def scan_winners(boards: np.ndarray) -> np.ndarray:
+        """Winner of each of an ``(N, ROWS, COLS)`` stack of boards (full scan)."""
+        return lines.winner(boards)
+
+    def get_state(self, i: int) -> ConnectState:
+        """``ConnectState`` copy of game ``i``."""
+        return ConnectState(self.boards[i], int(self.player[i]))
@@ -0,0 +1,32 @@
+"""64-bit Zobrist keys for Connect Four positions."""
+
+import numpy as np
+
+from connect4.lines import COLS, ROWS
+
+# One random 64-bit number per (player, cell), drawn from a fixed seed so keys
+# are stable across processes and can be stored next to a model.
+_TABLE = np.random.default_rng(0x5EED).integers(
+    0, 2**64, size=(2, ROWS * COLS), dtype=np.uint64
+)
+
+# ZOBRIST[player][row * COLS + col] as Python ints, for incremental updates
+ZOBRIST: dict[int, tuple[int, ...]] = {
+    -1: tuple(int(v) for v in _TABLE[0]),
+    1: tuple(int(v) for v in _TABLE[1]),
+}
+
+
+def board_key(board: np.ndarray) -> int:
+    """
+    Zobrist key of a raw ``(ROWS, COLS)`` board.
+
+    Matches the key that ``ConnectState`` maintains incrementally, so it can
+    be used to look up positions received as plain arrays (e.g. in ``act``).
+    The side to move is not part of the key: in a legal game it follows from
+    the number of discs.
+    """
+    flat = np.asarray(board).ravel()
+    red = np.bitwise_xor.reduce(_TABLE[0][flat == -1])
+    yellow = np.bitwise_xor.reduce(_TABLE[1][flat == 1])
+    return int(red ^ yellow)
@@ -0,0 +1,163 @@
+from itertools import combinations
+from connect4.dtos import Participant, TimeControl
+from ratings import RatingTable
+from scheduler import GameScheduler
+import numpy as np
+import math
+import time
+
+
+def round_robin_games(
+    players: list[Participant], games_per_pair: int
+) -> list[tuple[Participant, Participant, bool]]:
+    """Every pairing ``games_per_pair`` times, alternating who moves first."""
+    return [
+        (a, b, g % 2 == 0)
+        for a, b in combinations(players, 2)
+        for g in range(games_per_pair)
+    ]
+
+
+def run_round_robin(
+    players: list[Participant],
+    games_per_pair: int = 2,
+    workers: int | None = None,
+    time_control: TimeControl | None = None,
+) -> RatingTable:
+    """
+    Play every participant against every other one and rate them.
+
+    Parameters
+    ----------
+    players : List[Participant]
+        List of participants (name, policy) tuples.
+    games_per_pair : int, optional
+        Games played by each pairing, half of them as first player
+        (default is 2).
+    workers : int, optional
+        Number of worker processes (default is None, which plays the games
+        one after another). All games are queued at once.
+    time_control : TimeControl, optional
+        Clock enforced on every move (default is None, untimed).
+
+    Returns
+    -------
+    RatingTable
+        Ratings of the participants, updated as each game completed.
+    """
+    ratings = RatingTable([name for name, _ in players])
+    games = round_robin_games(players, games_per_pair)
+    start = time.perf_counter()
+    with GameScheduler(workers, time_control) as scheduler:
+        for done, result in enumerate(scheduler.run(games), start=1):
+            ratings.update(result)
+            print(f"[{done}/{len(games)}] {result.player_a} vs {result.player_b}: {result.winner or 'draw'}")
+    print(f"Round robin time: {time.perf_counter() - start:.1f}s")
+    print(ratings)
+    return ratings
+
+
+def pair_swiss_round(
+    players: list[Participant],
+    points: dict[str, float],
+    played: set[frozenset[str]],
+    rng: np.random.Generator,
+) -> tuple[list[tuple[Participant, Participant]], Participant | None]:
+    """
+    Pair players with close scores, avoiding rematches where possible.
+
+    Returns the pairings and the player receiving a bye (odd counts only):
+    the lowest-scored player without a previous bye, which is recorded in
+    ``played`` as a pairing of the player with itself.
+    """
+    order = list(players)
+    rng.shuffle(order)  # random tie-break among equal scores
+    order.sort(key=lambda p: points[p[0]], reverse=True)
+
+    bye = None
+    if len(order) % 2:
+        for candidate in reversed(order):
+            if frozenset((candidate[0],)) not in played:
+                bye = candidate
+                break
+        else:
+            bye = order[-1]
+        order.remove(bye)
+
+    pairs = []
+    while order:
+        a = order.pop(0)
+        # Closest-scored opponent not met yet, else the closest one
+        b = next((p for p in order if frozenset((a[0], p[0])) not in played), order[0])
+        order.remove(b)
+        pairs.append((a, b))
+    return pairs, bye
+
+
+def run_swiss(
+    players: list[Participant],
+    rounds: int | None = None,
+    games_per_pair: int = 2,
+    workers: int | None = None,
+    seed: int = 911,
+    time_control: TimeControl | None = None,
+) -> RatingTable:
+    """
+    Run a Swiss-system tournament and rate the participants.
+
+    Each round pairs players with similar scores who have not met yet; every
+    game of the round is queued at once on the scheduler.
+
+    Parameters
+    ----------
+    players : List[Participant]
+        List of participants (name, policy) tuples.
+    rounds : int, optional
+        Number of rounds (default is None, which plays ceil(log2(n)) rounds).
+    games_per_pair : int, optional
+        Games played by each pairing per round, half of them as first player
+        (default is 2).
+    workers : int, optional
+        Number of worker processes (default is None, which plays the games
+        one after another).
+    seed : int, optional
+        Random seed for the tie-breaks of the pairings (default is 911).
+    time_control : TimeControl, optional
+        Clock enforced on every move (default is None, untimed).
+
+    Returns
+    -------
+    RatingTable
+        Ratings of the participants, updated as each game completed.
+    """
+    if rounds is None:
+        rounds = max(1, math.ceil(math.log2(max(len(players), 2))))
+    rng = np.random.default_rng(seed)
+    ratings = RatingTable([name for name, _ in players])
+    # Match points: the games' points plus one game-set of points per bye
+    points = {name: 0.0 for name, _ in players}
+    played: set[frozenset[str]] = set()
+
+    with GameScheduler(workers, time_control) as scheduler:
+        for round_number in range(1, rounds + 1):
+            start = time.perf_counter()
+            pairs, bye = pair_swiss_round(players, points, played, rng)
+            print(f"Round {round_number} Matches:", [(a[0], b[0]) for a, b in pairs])
+            if bye is not None:
+                print("Bye:", bye[0])
+                points[bye[0]] += games_per_pair
+                played.add(frozenset((bye[0],)))
+            played.update(frozenset((a[0], b[0])) for a, b in pairs)
+
+            games = [
+                (a, b, g % 2 == 0) for a, b in pairs for g in range(games_per_pair)
+            ]
+            for result in scheduler.run(games):
+                ratings.update(result)
+                points[result.player_a] += result.score_a
+                points[result.player_b] += 1 - result.score_a
+            print(f"Round time: {time.perf_counter() - start:.1f}s")
+            print("Standings:", sorted(points.items(), key=lambda kv: kv[1], reverse=True))
+
+    print(ratings)
+    return ratings
@@ -1,25 +1,137 @@
 import numpy as np
+import math
+import time
 from connect4.policy import Policy
 from connect4.connect_state import ConnectState
+from connect4 import lines
+from connect4.transposition import EXACT, LOWER, UPPER, TranspositionTable
+from connect4 import solver
+
+
+class SinTiempo(Exception):
+    #se lanza dentro de la busqueda cuando se acaba el tiempo de la jugada
+    pass
+
+
+#orden de las columnas en la poda alfa-beta: primero el centro, que participa en mas lineas
+ORDEN_CENTRO = (3, 2, 4, 1, 5, 0, 6)
+PRIORIDAD_CENTRO = tuple(ORDEN_CENTRO.index(columna) for columna in range(7))
+
+#se mezcla en la clave de los nodos min, para que una posicion guardada como nodo max (juega el agente)
+#no se confunda con la misma posicion vista como nodo min si el agente cambia de color sin reset
+CLAVE_MIN = 0x9E3779B97F4A7C15
+
+
+class EvaluadorIncremental:
+    #mantiene las partes de Aha.evaluate que dependen del tablero (amenazas de cada jugador y fichas
+    #en la columna central) mientras la busqueda pone y quita fichas en un mismo estado, en vez de
+    #recorrer las 69 lineas en cada hoja. Por linea guarda la suma de sus 4 casillas: una linea suma
+    #-3 (3) justo cuando tiene 3 fichas rojas (amarillas) y una casilla vacia, o sea cuando es amenaza
+
+    def __init__(self, state: ConnectState):
+        self.state = state #el estado que sigue; evaluate solo usa el evaluador con este estado
+        self.sumas = [int(suma) for suma in state.board.ravel()[lines.LINE_INDEX].sum(axis=1)]
+        self.amenazas = {-1: self.sumas.count(-3), 1: self.sumas.count(3)}
+        self.centro = {jugador: int(np.count_nonzero(state.board[:, 3] == jugador)) for jugador in (-1, 1)}
+
+    def poner(self, celda: int, jugador: int) -> None:
+        sumas, amenazas = self.sumas, self.amenazas
+        for linea in lines.CELL_LINES[celda]:
+            suma = sumas[linea]
+            if suma == -3 or suma == 3:
+                amenazas[suma // 3] -= 1 #la amenaza se completa o se bloquea
+            suma += jugador
+            sumas[linea] = suma
+            if suma == -3 or suma == 3:
+                amenazas[suma // 3] += 1
+        if celda % 7 == 3:
+            self.centro[jugador] += 1
+
+    def quitar(self, celda: int, jugador: int) -> None:
+        sumas, amenazas = self.sumas, self.amenazas
+        for linea in lines.CELL_LINES[celda]:
+            suma = sumas[linea]
+            if suma == -3 or suma == 3:
+                amenazas[suma // 3] -= 1
+            suma -= jugador
+            sumas[linea] = suma
+            if suma == -3 or suma == 3:
+                amenazas[suma // 3] += 1
+        if celda % 7 == 3:
+            self.centro[jugador] -= 1
+
+    def puntaje(self, jugador: int) -> int:
+        #el mismo puntaje posicional de Aha.evaluate, visto por jugador
+        return (self.amenazas[jugador] - self.amenazas[-jugador]) * 10 + self.centro[jugador] * 3
 
 
 class Aha(Policy):
 
-    def __init__(self, depth: int = 4):
+    RESERVA_TIEMPO = 0.01 #segundos antes del limite en que se corta la busqueda, para alcanzar a devolver la jugada
+    NODOS_RESOLVER = 200_000 #posiciones que el solver exacto puede visitar antes de rendirse y dejar buscar a minimax
+
+    def __init__(
+        self,
+        depth: int = 4,
+        busqueda_en_sitio: bool = False,
+        poda_alfa_beta: bool = False,
+        tabla_mb: float = 0.0,
+        tiempo_por_jugada: float | None = None,
+        evaluacion_incremental: bool = True,
+        casillas_para_resolver: int = 0,
+    ):
         #constructor del agente
         self.depth = depth #cuantas jugadas hacia adelante mira el agente
+        self.busqueda_en_sitio = busqueda_en_sitio #si es True la busqueda usa push/pop sobre un solo estado en vez de crear uno por jugada
+        self.poda_alfa_beta = poda_alfa_beta #si es True se busca con poda alfa-beta (misma jugada que minimax, muchos menos nodos)
+        self.nodos = 0 #estados visitados por la ultima llamada a act, para la instrumentación del torneo
+        #presupuesto propio de segundos por jugada: con el, act profundiza sin limite de depth hasta que se
+        #acaba el tiempo (o el tablero); None busca a profundidad fija salvo que el torneo ponga reloj
+        self.tiempo_por_jugada = tiempo_por_jugada
+        #en las busquedas con push/pop (busqueda_en_sitio o poda_alfa_beta) la evaluacion se actualiza con
+        #cada ficha puesta o quitada en vez de recalcularse en cada hoja; da exactamente los mismos valores
+        self.evaluacion_incremental = evaluacion_incremental
+        self.evaluador = None
+        #con esta cantidad de casillas vacias o menos se intenta primero resolver la posicion con el solver
+        #exacto (connect4.solver); si no termina a tiempo se busca como siempre. 0 = nunca
+        self.casillas_para_resolver = casillas_para_resolver
+        self.limite = None #perf_counter en que se corta la busqueda en curso (el menor entre reloj y presupuesto)
+        #jugador del agente en la jugada en curso: evaluate puntua desde su punto de vista a cualquier
+        #profundidad (None = desde el jugador al que le toca, para evaluar un estado suelto)
+        self.jugador = None
+        self.profundidad_alcanzada = 0 #profundidad de la ultima busqueda completada en la ultima llamada a act
+        #heuristicas de orden de la poda: jugadas asesinas (las dos ultimas que causaron un corte en
+        #cada nivel) e historia (cuanto ha cortado cada columna, por jugador); se reinician en cada act
+        self.asesinas = []
+        self.historia = {-1: [0] * 7, 1: [0] * 7}
+        #tabla de transposicion de la poda alfa-beta (tabla_mb megabytes, 0 = sin tabla): guarda el valor
+        #y la mejor jugada de cada posicion buscada y se conserva entre jugadas de la misma partida
+        self.tabla = TranspositionTable.from_megabytes(tabla_mb) if poda_alfa_beta and tabla_mb > 0 else None
 
-    def mount(self):
+    def mount(self, timeout=None):
         pass
+
+    def reset(self):
+        #partida nueva: la tabla de la partida anterior no sirve (ni el color del agente es el mismo)
+        if self.tabla is not None:
+            self.tabla.clear()
     
     def act(self, board: np.ndarray) -> int:
         #mi jugada real, por cada jugada mia, pregunto: si yo hago esto que haria el rival después?
 
         #determinar el jugador que está jugando 
-        num_piezas = np.count_nonzero(board)
+        num_piezas = int(np.count_nonzero(board))
         jugador_actual = -1 if num_piezas % 2 == 0 else 1 # si el número de piezas es par, juega -1 (rojo) y si es impar, juega +1 (amarillo)
 
         state = ConnectState(board=board, player=jugador_actual) #crea un estado a partir del tablero actual
+        self.jugador = jugador_actual
+        self.nodos = 0
+        self.evaluador = None
+        if self.evaluacion_incremental and (self.busqueda_en_sitio or self.poda_alfa_beta):
+            self.evaluador = EvaluadorIncremental(state)
+        self.historia = {-1: [0] * 7, 1: [0] * 7}
+        if self.tabla is not None:
+            self.tabla.new_search()
 
         free_columns = list(state.get_free_cols())
         
@@ -28,16 +140,71 @@ class Aha(Policy):
             # Si no hay columnas libres, devolver cualquier columna (esto no debería pasar)
             return 0
 
+        #el limite de la jugada es el del reloj del torneo o el presupuesto propio, el que llegue antes
+        self.limite = self.deadline
+        profundidad_maxima = self.depth
+        if self.tiempo_por_jugada is not None:
+            propio = time.perf_counter() + self.tiempo_por_jugada
+            self.limite = propio if self.limite is None else min(self.limite, propio)
+            profundidad_maxima = ConnectState.ROWS * ConnectState.COLS - num_piezas #hasta el final de la partida
+        self.asesinas = [[None, None] for _ in range(profundidad_maxima + 1)]
+
+        mejor_columna = free_columns[0] #jugada si no se completa ninguna busqueda a tiempo
+        casillas_vacias = ConnectState.ROWS * ConnectState.COLS - num_piezas
+        if casillas_vacias <= self.casillas_para_resolver and not state.is_final():
+            #con limite el solver usa como mucho la mitad del tiempo, la otra mitad queda para la busqueda
+            limite_solver = None
+            if self.limite is not None:
+                limite_solver = (time.perf_counter() + self.limite - self.RESERVA_TIEMPO) / 2
+            resultado = solver.solve(state, max_nodes=self.NODOS_RESOLVER, deadline=limite_solver)
+            self.nodos += resultado.nodes
+            if resultado.exact:
+                self.profundidad_alcanzada = casillas_vacias #juego perfecto hasta el final
+                return resultado.move
+            mejor_columna = resultado.move #la jugada heuristica del solver (ganar, bloquear, no perder)
+
+        if self.limite is None:
+            self.profundidad_alcanzada = self.depth
+            return self.buscar(state, free_columns, self.depth)
+
+        #con limite: profundización iterativa, se busca a profundidad 1, 2, ... y se devuelve la jugada
+        #de la ultima profundidad completada antes de que se acabe el tiempo. Cada iteracion empieza por
+        #la mejor jugada de la anterior, que es la que mas probablemente siga siendo la mejor
+        self.profundidad_alcanzada = 0
+        for profundidad in range(1, profundidad_maxima + 1):
+            try:
+                mejor_columna = self.buscar(state, free_columns, profundidad, mejor_columna)
+            except SinTiempo:
+                break
+            self.profundidad_alcanzada = profundidad
+        return mejor_columna
+
+    def buscar(self, state: ConnectState, free_columns: list, depth: int, primera: int = -1) -> int:
+        #busqueda minimax completa desde la raiz a la profundidad dada; primera es la columna que la poda
+        #explora antes que las demas (minimax las explora todas, el orden no le cambia nada)
+        if self.poda_alfa_beta:
+            return self.buscar_alfa_beta(state, free_columns, depth, primera)
+
         #inicializa variables para encontrar la mejor jugada
         mejor_valor = -np.inf 
         mejor_columna = free_columns[0]
 
+        if self.busqueda_en_sitio:
+            #un solo estado que se modifica con push y se restaura con pop
+            for columna in free_columns:
+                self.jugar(state, columna)
+                valor = self.min_value(state, depth - 1) #si se acaba el tiempo el estado queda a medias, pero act ya no lo usa
+                self.deshacer(state)
+                if valor > mejor_valor:
+                    mejor_valor = valor
+                    mejor_columna = columna
+            return mejor_columna
+
         for columna in free_columns:
             try:
-                #crear un nuevo estado para cada evaluación
-                state_para_evaluar = ConnectState(board=board, player=jugador_actual)
-                estado_simulado = state_para_evaluar.transition(columna)
-                valor = self.min_value(estado_simulado, self.depth - 1)
+                #transition no modifica state, asi que sirve como base para cada evaluación
+                estado_simulado = state.transition(columna)
+                valor = self.min_value(estado_simulado, depth - 1)
 
                 #actualizar con la mejor jugada encontrada
                 if valor > mejor_valor:
@@ -54,6 +221,9 @@ class Aha(Policy):
     def max_value(self, state: ConnectState, depth: int) -> float:
         #turno del agente (maximiza la utilidad) osea mi respuesta a la respuesta del rival
 
+        self.nodos += 1
+        self.revisar_tiempo()
+
         #Si el estado es final (gana, pierde o empate) devolvemos la utilidad del estado
         if state.is_final() or depth == 0: #si llegamos al limite de profundidad devolvemos también evaluate porque ya no exploramos más
             return self.evaluate(state)
@@ -65,6 +235,13 @@ class Aha(Policy):
         if len(free_columns) == 0:
             return 0
 
+        if self.busqueda_en_sitio:
+            for columna in free_columns:
+                self.jugar(state, columna) #jugamos en el mismo estado y deshacemos al volver
+                valor = max(valor, self.min_value(state, depth - 1))
+                self.deshacer(state)
+            return valor
+
         for columna in free_columns:
             try:
                 next_state = state.transition(columna) #simulamos la jugada sin alterar el estado original
@@ -78,6 +255,8 @@ class Aha(Policy):
 
     def min_value(self, state: ConnectState, depth: int) -> float:
         #turno del rival
+        self.nodos += 1
+        self.revisar_tiempo()
 
         if state.is_final() or depth == 0:
             return self.evaluate(state)
@@ -89,6 +268,13 @@ class Aha(Policy):
         if len(free_columns) == 0:
             return 0
 
+        if self.busqueda_en_sitio:
+            for columna in free_columns:
+                self.jugar(state, columna)
+                valor = min(valor, self.max_value(state, depth - 1))
+                self.deshacer(state)
+            return valor
+
         for columna in free_columns:
             try:
                 next_state = state.transition(columna)
@@ -99,62 +285,200 @@ class Aha(Policy):
         
         return valor 
     
+    #PODA ALFA-BETA
+    def buscar_alfa_beta(self, state: ConnectState, free_columns: list, depth: int, primera: int = -1) -> int:
+        #misma decision que buscar: la columna de mayor valor minimax y, en un empate, la que aparece
+        #primero en free_columns. Las columnas se exploran en el orden de la poda, asi que una columna
+        #anterior a la mejor actual se busca con alfa justo por debajo del mejor valor para que un
+        #empate se detecte como valor exacto y no como cota
+        mejor_valor = -np.inf
+        mejor_columna = free_columns[0]
+        if primera < 0:
+            primera = self.jugada_tabla(state.key)
+        for columna in self.ordenar(state, 0, primera):
+            if columna < mejor_columna:
+                alfa = math.nextafter(mejor_valor, -math.inf)
+            else:
+                alfa = mejor_valor
+            self.jugar(state, columna)
+            valor = self.min_alfa_beta(state, depth - 1, alfa, np.inf, 1)
+            self.deshacer(state)
+            if valor > mejor_valor or (valor == mejor_valor and columna < mejor_columna):
+                mejor_valor = valor
+                mejor_columna = columna
+        return mejor_columna
+
+    def max_alfa_beta(self, state: ConnectState, depth: int, alfa: float, beta: float, nivel: int) -> float:
+        #como max_value, pero deja de explorar en cuanto el valor llega a beta (el rival no dejaria llegar aqui)
+        self.nodos += 1
+        self.revisar_tiempo()
+
+        clave = state.key
+        valor, jugada = self.consultar_tabla(clave, depth, alfa, beta)
+        if valor is not None:
+            return valor
+
+        if state.is_final() or depth == 0:
+            valor = self.evaluate(state)
+            self.guardar_tabla(clave, depth, valor, EXACT, -1)
+            return valor
+
+        alfa_inicial = alfa
+        valor = -np.inf
+        mejor_columna = -1
+        for columna in self.ordenar(state, nivel, jugada):
+            self.jugar(state, columna)
+            hijo = self.min_alfa_beta(state, depth - 1, alfa, beta, nivel + 1)
+            self.deshacer(state)
+            if hijo > valor:
+                valor, mejor_columna = hijo, columna
+            if valor >= beta:
+                self.registrar_corte(state.player, columna, depth, nivel)
+                self.guardar_tabla(clave, depth, valor, LOWER, columna)
+                return valor
+            alfa = max(alfa, valor)
+        self.guardar_tabla(clave, depth, valor, UPPER if valor <= alfa_inicial else EXACT, mejor_columna)
+        return valor
+
+    def min_alfa_beta(self, state: ConnectState, depth: int, alfa: float, beta: float, nivel: int) -> float:
+        #turno del rival: corta en cuanto el valor baja a alfa (yo ya tengo algo mejor en otra rama)
+        self.nodos += 1
+        self.revisar_tiempo()
+
+        clave = state.key ^ CLAVE_MIN
+        valor, jugada = self.consultar_tabla(clave, depth, alfa, beta)
+        if valor is not None:
+            return valor
+
+        if state.is_final() or depth == 0:
+            valor = self.evaluate(state)
+            self.guardar_tabla(clave, depth, valor, EXACT, -1)
+            return valor
+
+        beta_inicial = beta
+        valor = np.inf
+        mejor_columna = -1
+        for columna in self.ordenar(state, nivel, jugada):
+            self.jugar(state, columna)
+            hijo = self.max_alfa_beta(state, depth - 1, alfa, beta, nivel + 1)
+            self.deshacer(state)
+            if hijo < valor:
+                valor, mejor_columna = hijo, columna
+            if valor <= alfa:
+                self.registrar_corte(state.player, columna, depth, nivel)
+                self.guardar_tabla(clave, depth, valor, UPPER, columna)
+                return valor
+            beta = min(beta, valor)
+        self.guardar_tabla(clave, depth, valor, LOWER if valor >= beta_inicial else EXACT, mejor_columna)
+        return valor
+
+    def ordenar(self, state: ConnectState, nivel: int, primera: int = -1) -> list:
+        #primero la mejor jugada guardada en la tabla, luego las jugadas asesinas del nivel, despues las de
+        #mas historia y, a igualdad, las del centro
+        asesinas = self.asesinas[nivel] if nivel < len(self.asesinas) else ()
+        historia = self.historia[state.player]
+        return sorted(
+            state.get_free_cols(),
+            key=lambda columna: (
+                columna != primera,
+                columna not in asesinas,
+                -historia[columna],
+                PRIORIDAD_CENTRO[columna],
+            ),
+        )
+
+    #TABLA DE TRANSPOSICION
+    def consultar_tabla(self, clave: int, depth: int, alfa: float, beta: float) -> tuple:
+        #devuelve (valor, jugada): el valor guardado si basta para resolver el nodo con esta ventana
+        #(si no, None) y la mejor jugada guardada para ordenar (-1 si no hay)
+        if self.tabla is None:
+            return None, -1
+        entrada = self.tabla.probe(clave)
+        if entrada is None:
+            return None, -1
+        profundidad, valor, cota, jugada = entrada
+        if profundidad >= depth and (
+            cota == EXACT or (cota == LOWER and valor >= beta) or (cota == UPPER and valor <= alfa)
+        ):
+            return valor, jugada
+        return None, jugada
+
+    def guardar_tabla(self, clave: int, depth: int, valor: float, cota: int, jugada: int) -> None:
+        if self.tabla is not None:
+            self.tabla.store(clave, depth, valor, cota, jugada)
+
+    def jugada_tabla(self, clave: int) -> int:
+        #mejor jugada guardada para la raiz (la de una busqueda anterior), o -1
+        if self.tabla is None:
+            return -1
+        entrada = self.tabla.probe(clave)
+        return -1 if entrada is None else entrada[3]
+
+    def registrar_corte(self, jugador: int, columna: int, depth: int, nivel: int) -> None:
+        #la columna que produjo un corte probablemente corte tambien en las posiciones hermanas
+        if nivel < len(self.asesinas) and self.asesinas[nivel][0] != columna:
+            self.asesinas[nivel] = [columna, self.asesinas[nivel][0]]
+        self.historia[jugador][columna] += depth * depth #los cortes cerca de la raiz ahorran mas
+
+    def search_stats(self):
+        stats = {"nodes": self.nodos, "depth": self.profundidad_alcanzada}
+        if self.tabla is not None:
+            stats.update(tt_hit_rate=self.tabla.hit_rate(), tt_fill=self.tabla.fill())
+        return stats
+
+    def revisar_tiempo(self):
+        #corta la busqueda en curso si la jugada tiene limite y ya se paso
+        if self.limite is not None and time.perf_counter() >= self.limite - self.RESERVA_TIEMPO:
+            raise SinTiempo()
+
+    def jugar(self, state: ConnectState, columna: int) -> None:
+        #push que ademas avisa al evaluador incremental de la ficha puesta
+        state.push(columna)
+        if self.evaluador is not None:
+            fila, col = state.last_move
+            self.evaluador.poner(fila * 7 + col, -state.player)
+
+    def deshacer(self, state: ConnectState) -> None:
+        if self.evaluador is not None:
+            fila, col = state.last_move
+            self.evaluador.quitar(fila * 7 + col, -state.player)
+        state.pop()
+
     #EVALUACIÓN
 
     def evaluate(self, state: ConnectState) -> float:
+        #utilidad para el agente (self.jugador), la que maximiza max_value. Antes se puntuaba desde el
+        #jugador al que le toca en la hoja: con profundidad impar era el rival, y en un estado final
+        #siempre es el perdedor, asi que toda victoria (tambien la propia) valia -100
+        jugador = state.player if self.jugador is None else self.jugador
         if state.is_final():
             ganador = state.get_winner()
-            if ganador == state.player:
+            if ganador == jugador:
                 return 100
-            elif ganador == -state.player:
+            elif ganador == -jugador:
                 return -100
             return 0
+
+        if self.evaluador is not None and self.evaluador.state is state:
+            return self.evaluador.puntaje(jugador)
         
         # NUEVO: Evaluación posicional
         score = 0
         
-        # Contar amenazas de 3 en línea
-        score += self.contar_amenazas(state, state.player) * 10
-        score -= self.contar_amenazas(state, -state.player) * 10
+        # Contar amenazas de 3 en línea: las de los dos jugadores salen de una sola pasada por las lineas
+        rojas, amarillas = lines.open_three_counts(state.board)
+        propias, rivales = (rojas, amarillas) if jugador == -1 else (amarillas, rojas)
+        score += propias * 10
+        score -= rivales * 10
         
         # Valorar centro
-        centro_control = np.sum(state.board[:, 3] == state.player)
+        centro_control = np.sum(state.board[:, 3] == jugador)
         score += centro_control * 3
         
         return score
     
     def contar_amenazas(self, state: ConnectState, jugador: int) -> int:
         """Cuenta líneas de 3 fichas consecutivas (amenazas de victoria)"""
-        amenazas = 0
-        board = state.board
-        filas, columnas = board.shape
-        
-        # Horizontal
-        for fila in range(filas):
-            for col in range(columnas - 3):
-                ventana = board[fila, col:col+4]
-                if np.sum(ventana == jugador) == 3 and np.sum(ventana == 0) == 1:
-                    amenazas += 1
-        
-        # Vertical
-        for col in range(columnas):
-            for fila in range(filas - 3):
-                ventana = board[fila:fila+4, col]
-                if np.sum(ventana == jugador) == 3 and np.sum(ventana == 0) == 1:
-                    amenazas += 1
-        
-        # Diagonal /
-        for fila in range(3, filas):
-            for col in range(columnas - 3):
-                ventana = [board[fila-i, col+i] for i in range(4)]
-                if ventana.count(jugador) == 3 and ventana.count(0) == 1:
-                    amenazas += 1
-        
-        # Diagonal \
-        for fila in range(filas - 3):
-            for col in range(columnas - 3):
-                ventana = [board[fila+i, col+i] for i in range(4)]
-                if ventana.count(jugador) == 3 and ventana.count(0) == 1:
-                    amenazas += 1
-        
-        return amenazas
\ No newline at end of file
+        #las 69 lineas de 4 casillas estan precalculadas en connect4.lines: una linea es amenaza
+        #si tiene 3 fichas del jugador y la casilla restante vacia
+        return lines.count_open_threes(state.board, jugador)
@@ -1,16 +1,27 @@
 import numpy as np
+import time
 from connect4.policy import Policy
 from connect4.connect_state import ConnectState
+from connect4.zobrist import board_key
+from connect4.symmetry import canonical_board, canonical_key, orient_action, orient_values
+from connect4 import solver
 
 
 class Hello(Policy):
 
+    RESERVA_TIEMPO = 0.01 #segundos antes del limite en que se para el MCTS, para alcanzar a devolver la jugada
+    NODOS_RESOLVER = 200_000 #posiciones que el solver exacto puede visitar antes de rendirse y dejar jugar al MCTS
+
     
     #////inicialización del agente////
     
     #----constructor----
-    def __init__(self, modo_torneo=False):
+    def __init__(self, modo_torneo=False, busqueda_en_sitio=False, claves_zobrist=False, simetria=False, casillas_para_resolver=0):
         self.modo_torneo = modo_torneo #cuando es True el agente no aprende
+        self.casillas_para_resolver = casillas_para_resolver #con estas casillas vacias o menos se juega la jugada perfecta del solver, si la encuentra a tiempo (0 = nunca)
+        self.busqueda_en_sitio = busqueda_en_sitio #MCTS con push/pop sobre un solo estado en vez de transition
+        self.claves_zobrist = claves_zobrist #Q-table con claves enteras de 64 bits en vez de tuplas del tablero
+        self.simetria = simetria #un tablero y su espejo comparten entrada en Q-table y en el arbol MCTS
 
         #----Q-learning----
         self.Q = {} #Q-table: guarda cuanto vale cada acción en cada estado
@@ -40,6 +51,10 @@ class Hello(Policy):
         #----generador aleatorio----
         self.rng = np.random.default_rng() #para elegir acciones aleatorias
 
+        #----contadores de la ultima jugada (instrumentación del torneo)----
+        self.simulaciones_hechas = 0
+        self.nodos_mcts = 0
+
 
 
 
@@ -60,6 +75,19 @@ class Hello(Policy):
             self.simulaciones_mcts = 120
 
     
+    def reset(self):
+        #nueva partida con la misma instancia: se olvida lo de la partida anterior, como si se acabara de crear
+        self.Q = {}
+        self.N = {}
+        self.estado_anterior = None
+        self.accion_anterior = None
+
+
+    def search_stats(self):
+        #esfuerzo de la ultima jugada: simulaciones de las dos busquedas MCTS, nodos del ultimo arbol y tamaño de la Q-table
+        return {"simulations": self.simulaciones_hechas, "nodes": self.nodos_mcts, "q_states": len(self.Q)}
+
+
     def actualizar_nivel(self):
         #el agente evoluciona por etapas según cuantas partidas haya jugado
         if self.partidas_jugadas >= self.umbral_mcts:
@@ -75,7 +103,16 @@ class Hello(Policy):
     #////funciones auxiliares////
 
     def clave_estado(self, tablero: np.ndarray):
-        return tuple(map(tuple, tablero)) #convierte el tablero en una tupla de tuplas para usarse como clave en el diccionario self.Q
+        return self.clave_y_orientacion(tablero)[0]
+
+    def clave_y_orientacion(self, tablero: np.ndarray):
+        espejo = False
+        if self.simetria:
+            #con simetria la clave es la del tablero canonico y espejo indica si hay que reflejar las columnas
+            tablero, espejo = canonical_board(tablero)
+        if self.claves_zobrist:
+            return board_key(tablero), espejo #entero de 64 bits, mucho más pequeño y rápido de comparar que la tupla
+        return tuple(map(tuple, tablero)), espejo #convierte el tablero en una tupla de tuplas para usarse como clave en el diccionario self.Q
 
     #----verificar si un estado ya existe en Q-table----
     def verificar_estado(self, estado):
@@ -115,10 +152,11 @@ class Hello(Policy):
         rival = -state.player
         libres = list(state.get_free_cols())
         
+        estado_rival = ConnectState(board=state.board, player=rival) #construimos un ConnectState (copia del tablero) donde el jugador activo es el rival
+
         #simular que el rival juega en cada columna restante
         for col in libres:
             try:
-                estado_rival = ConnectState(board=state.board.copy(), player=rival) #hacemos una copia del tablero y construimos un ConnectState donde el jugador activo es el rival
                 siguiente = estado_rival.transition(col) #simulamos que el rival pone una ficha en col
                 
                 #---si el rival gana jugando en col, bloqueamos----
@@ -130,14 +168,19 @@ class Hello(Policy):
 
 
     #////MCTS con UCT////
-    def mcts(self, estado_inicial: ConnectState, simulaciones=100, c=1.4):
+    def mcts(self, estado_inicial: ConnectState, simulaciones=100, c=1.4, limite=None):
+        #limite: instante (time.perf_counter) en que se dejan de lanzar simulaciones, para jugar con reloj
 
         Qm = {} #suma de todas las recompensas obtenidas tomando la acción a en el estado s
         Nm = {} #veces que se ha elegido cada (estado, acción)
         Ns = {} #veces que hemos visitado cada estado (visitas totales a un nodo)
 
         def clave_nodo(st):
-            return (tuple(map(tuple, st.board)), st.player) 
+            #clave Zobrist que ConnectState actualiza en cada jugada (el jugador se deduce del número de fichas)
+            #devuelve tambien si la clave es la del espejo, para reflejar las acciones
+            if self.simetria:
+                return canonical_key(st)
+            return st.key, False
 
         #----formula UCT----
         def valor_uct(estado, accion):
@@ -149,13 +192,22 @@ class Hello(Policy):
             #UCT = promedio de recompensa (explotación) + bono por explorar acciones poco probadas
             return (Qm[(estado, accion)] / Nm[(estado, accion)]) + c * np.sqrt(np.log(Ns[estado] + 1) / Nm[(estado, accion)])
 
+        #con busqueda en sitio todas las simulaciones juegan sobre una copia de trabajo y la restauran al final
+        trabajo = ConnectState(estado_inicial.board, estado_inicial.player) if self.busqueda_en_sitio else None
+
         for _ in range(simulaciones):
-            estado_actual = estado_inicial
+            #al llegar al limite se para con las simulaciones hechas, tambien antes de la primera:
+            #una simulacion lanzada despues del limite puede pasarse del reloj
+            if limite is not None and time.perf_counter() >= limite:
+                break
+            self.simulaciones_hechas += 1
+            estado_actual = trabajo if trabajo is not None else estado_inicial
             visitados = []
+            jugadas = 0 #cuantas fichas hay que deshacer con pop al terminar la simulación
 
             #----SELECCIÓN + EXPANSIÓN----
             while True:
-                clave_est = clave_nodo(estado_actual)
+                clave_est, espejo = clave_nodo(estado_actual)
                 libres = list(estado_actual.get_free_cols())
 
                 if estado_actual.is_final() or len(libres) == 0:
@@ -165,16 +217,20 @@ class Hello(Policy):
                 if clave_est not in Ns:
                     Ns[clave_est] = 0
                     for a in libres:
-                        Nm[(clave_est, a)] = 0
-                        Qm[(clave_est, a)] = 0.0
+                        Nm[(clave_est, orient_action(a, espejo))] = 0
+                        Qm[(clave_est, orient_action(a, espejo))] = 0.0
                     break #paramos la fase de selección porque solo se expande un nodo por simulación
 
                 #2. el nodo ya existe, selección
-                mejor_acc = max(libres, key=lambda a: valor_uct(clave_est, a)) #de todas las acciones posibles (columnas), elige la que tenga el mayor valor UCT
-                visitados.append((clave_est, mejor_acc))
+                mejor_acc = max(libres, key=lambda a: valor_uct(clave_est, orient_action(a, espejo))) #de todas las acciones posibles (columnas), elige la que tenga el mayor valor UCT
+                visitados.append((clave_est, orient_action(mejor_acc, espejo)))
 
                 try:
-                    estado_actual = estado_actual.transition(mejor_acc) #simula colocar una ficha en mejor_acc, devolviendo un nuevo objeto ConnectState
+                    if trabajo is not None:
+                        estado_actual.push(mejor_acc)
+                        jugadas += 1
+                    else:
+                        estado_actual = estado_actual.transition(mejor_acc) #simula colocar una ficha en mejor_acc, devolviendo un nuevo objeto ConnectState
                 except ValueError:
                     break
 
@@ -203,7 +259,11 @@ class Hello(Policy):
                     a = libres[0] #si ninguna columna del orden esta disponible se elige la primera columna legal
 
                 try:
-                    estado_sim = estado_sim.transition(a)#se coloca la ficha y se obtiene el nuevo estado
+                    if trabajo is not None:
+                        estado_sim.push(a)
+                        jugadas += 1
+                    else:
+                        estado_sim = estado_sim.transition(a)#se coloca la ficha y se obtiene el nuevo estado
                 except ValueError:
                     break
 
@@ -216,6 +276,10 @@ class Hello(Policy):
             else:
                 recompensa = 0
 
+            #deshacer las jugadas de esta simulación
+            for _ in range(jugadas):
+                trabajo.pop()
+
             
             #----BACKPROPAGATION----
             #le avisamos a todos los nodos del arbol que visitamos durante la simulación como nos fue
@@ -225,14 +289,17 @@ class Hello(Policy):
                 Qm[(est, a)] += recompensa #suma la recompensa total acumulada de esa acción en ese estado
                 Ns[est] += 1 #aumenta el numero de veces que visitamos ese estado
 
+        self.nodos_mcts = len(Ns) #tamaño del arbol construido, útil para medir memoria
+
         #----valores finales----
-        clave_raiz = clave_nodo(estado_inicial)
+        clave_raiz, espejo_raiz = clave_nodo(estado_inicial)
         libres = list(estado_inicial.get_free_cols())
         valores = np.zeros(7) #valores[0] = valor estimado de jugar en la columna 0...y así
 
         for a in libres:
-            if (clave_raiz, a) in Nm and Nm[(clave_raiz, a)] > 0: #se probó esta columna a desde la raíz?
-                valores[a] = Qm[(clave_raiz, a)] / Nm[(clave_raiz, a)] #promedio de recompensas obtenidas cuando MCTS eligió esa columna
+            nodo = (clave_raiz, orient_action(a, espejo_raiz))
+            if nodo in Nm and Nm[nodo] > 0: #se probó esta columna a desde la raíz?
+                valores[a] = Qm[nodo] / Nm[nodo] #promedio de recompensas obtenidas cuando MCTS eligió esa columna
             else:
                 valores[a] = 0.0
 
@@ -243,7 +310,10 @@ class Hello(Policy):
     
     def act(self, board: np.ndarray) -> int:
 
-        estado = self.clave_estado(board)
+        self.simulaciones_hechas = 0
+        self.nodos_mcts = 0
+
+        estado, espejo = self.clave_y_orientacion(board) #con simetria las acciones se guardan en la orientacion canonica
         self.verificar_estado(estado)
 
         #jugador actual
@@ -281,7 +351,7 @@ class Hello(Policy):
             acc = self.accion_ganadora(state)
             if acc is not None:
                 self.estado_anterior = estado
-                self.accion_anterior = acc
+                self.accion_anterior = orient_action(acc, espejo)
                 return acc
 
         # 4.bloqueo inmediato
@@ -289,21 +359,42 @@ class Hello(Policy):
             acc = self.accion_bloqueo(state)
             if acc is not None:
                 self.estado_anterior = estado
-                self.accion_anterior = acc
+                self.accion_anterior = orient_action(acc, espejo)
                 return acc
 
-        # 5.MCTS
-        valores_mcts = self.mcts(state, simulaciones=100)
+        # 5.final de partida: con pocas casillas vacias se intenta resolver la posicion de forma exacta
+        if np.count_nonzero(board == 0) <= self.casillas_para_resolver:
+            limite_solver = None if self.deadline is None else self.deadline - self.RESERVA_TIEMPO
+            resultado = solver.solve(state, max_nodes=self.NODOS_RESOLVER, deadline=limite_solver)
+            if resultado.exact:
+                self.estado_anterior = estado
+                self.accion_anterior = orient_action(resultado.move, espejo)
+                return resultado.move
+
+        # 6.MCTS
+        #con reloj la primera busqueda usa como mucho la mitad del tiempo, la otra mitad queda para la segunda
+        limite = None #instante en que debe terminar la segunda busqueda
+        limite_primera = None
+        if self.deadline is not None:
+            limite = self.deadline - self.RESERVA_TIEMPO
+            limite_primera = (time.perf_counter() + limite) / 2 #punto medio entre ahora y el limite
+        valores_mcts = self.mcts(state, simulaciones=100, limite=limite_primera)
         
 
-        # 6.política epsilon-greedy
+        # 7.política epsilon-greedy
         if self.modo_torneo or self.nivel_actual < 3:
-            valores = self.Q[estado].copy()
+            valores = orient_values(self.Q[estado], espejo).copy()
             for col in range(7):
                 if col not in libres:
                     valores[col] = -999
         else:
-            valores = self.mcts(state, simulaciones=120)
+            hechas = self.simulaciones_hechas
+            valores = self.mcts(state, simulaciones=120, limite=limite)
+            if self.simulaciones_hechas == hechas:
+                valores = valores_mcts #sin tiempo para la segunda busqueda: se usan los valores de la primera
+            if self.simulaciones_hechas == 0:
+                #sin ninguna simulacion los valores son todos 0: se juega la columna libre mas central
+                valores = -np.abs(np.arange(7) - 3).astype(float)
 
         # epsilon-greedy
         if (not self.modo_torneo) and self.rng.random() < self.epsilon:
@@ -312,7 +403,7 @@ class Hello(Policy):
             accion = int(max(libres, key=lambda a: valores[a]))
 
         self.estado_anterior = estado
-        self.accion_anterior = accion
+        self.accion_anterior = orient_action(accion, espejo)
         return accion
 
     
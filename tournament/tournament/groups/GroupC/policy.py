@@ -1,20 +1,38 @@
 from connect4.policy import Policy
 from connect4.connect_state import ConnectState
+from connect4.zobrist import board_key
+from connect4.symmetry import canonical_board, canonical_key, orient_action
+from connect4.artifacts import load_artifact
+from connect4 import solver
 import numpy as np
+import time
 
 
 
+def cargar_q(ruta):
+    # Lee la Q-table guardada por guardar_modelo
+    return np.load(ruta, allow_pickle=True)["Q"].item()
+
+
 class OhYes(Policy):
 
+    RESERVA_TIEMPO = 0.01 # Segundos antes del limite en que se para el MCTS, para alcanzar a devolver la jugada
+    NODOS_RESOLVER = 200_000 # Posiciones que el solver exacto puede visitar antes de rendirse
+
     # ---- constructor ----
-    def __init__(self, modo_torneo=False):
+    def __init__(self, modo_torneo=False, busqueda_en_sitio=False, claves_zobrist=False, simetria=False, casillas_para_resolver=0):
         super().__init__()
         self.modo_torneo = modo_torneo 
+        self.casillas_para_resolver = casillas_para_resolver # Con estas casillas vacias o menos se prueba el solver exacto (0 = nunca)
+        self.busqueda_en_sitio = busqueda_en_sitio # MCTS con push/pop en vez de transition
+        self.claves_zobrist = claves_zobrist # Q-table con claves Zobrist (int) en vez de tuplas
+        self.simetria = simetria # Tablero y espejo comparten entrada en Q-table y MCTS
         self.player = -1 
         
         # ---- Q-learning y Contadores ----
         self.Q = {} 
         self.N = {} 
+        self.modelo = None # Q-table cargada del archivo, compartida con las demas instancias del proceso
 
         # ---- Parámetros de Aprendizaje ----
         self.alpha = 0.2 
@@ -43,13 +61,18 @@ class OhYes(Policy):
         # ---- Generador Aleatorio ----
         self.rng = np.random.default_rng(911)
 
+        # ---- Contadores de la ultima jugada (instrumentación del torneo) ----
+        self.simulaciones_hechas = 0
+        self.nodos_mcts = 0
+
     # ---- Montaje para Torneo ----
-    def mount(self):
+    def mount(self, timeout=None):
         # En el torneo, siempre se cargará el MCTS más alto (si existe).
         if self.modo_torneo:
             try:
-                data = np.load("policyc_model.npz", allow_pickle=True)
-                self.Q = data["Q"].item()
+                # El archivo se lee una sola vez por proceso; cada instancia parte de una copia del diccionario
+                self.modelo = load_artifact("policyc_model.npz", cargar_q)
+                self.Q = dict(self.modelo)
                 self.nivel_actual = 2 # Nivel más alto
                 self.epsilon = 0.0
             except:
@@ -60,6 +83,19 @@ class OhYes(Policy):
         self.estado_anterior = None
         self.accion_anterior = None
 
+    # ---- Nueva partida con la misma instancia ----
+    def reset(self):
+        # Deja el agente como recien montado: sin lo aprendido en la partida anterior
+        self.Q = dict(self.modelo) if self.modelo is not None else {}
+        self.N = {}
+        self.estado_anterior = None
+        self.accion_anterior = None
+        self.rng = np.random.default_rng(911)
+
+    # ---- Esfuerzo de la ultima jugada ----
+    def search_stats(self):
+        return {"simulations": self.simulaciones_hechas, "nodes": self.nodos_mcts, "q_states": len(self.Q)}
+
     # ---- Actualización del Nivel (para la curva de aprendizaje) ----
     def actualizar_nivel(self):
         if self.partidas_jugadas >= self.umbral_mcts:
@@ -72,7 +108,16 @@ class OhYes(Policy):
     #//// funciones auxiliares ////
 
     def clave_estado(self, tablero: np.ndarray):
-        return tuple(map(tuple, tablero)) 
+        return self.clave_y_orientacion(tablero)[0]
+
+    def clave_y_orientacion(self, tablero: np.ndarray):
+        # Con simetria se usa el tablero canonico; espejo indica si hay que reflejar las columnas
+        espejo = False
+        if self.simetria:
+            tablero, espejo = canonical_board(tablero)
+        if self.claves_zobrist:
+            return board_key(tablero), espejo
+        return tuple(map(tuple, tablero)), espejo
 
     def verificar_estado(self, estado_clave):
         if estado_clave not in self.Q:
@@ -92,6 +137,8 @@ class OhYes(Policy):
                 max_Q_futuro = q_val
                 
         Q_obj = recompensa + self.gamma * max_Q_futuro 
+        # Los arreglos del modelo cargado son compartidos: se copia la fila antes de modificarla
+        self.Q[estado_ant] = self.Q[estado_ant].copy()
         self.Q[estado_ant][accion_ant] += self.alpha * (Q_obj - Q_ant) 
         self.N[estado_ant][accion_ant] += 1
 
@@ -110,17 +157,21 @@ class OhYes(Policy):
 
     #//// MCTS con UCT ////
     
-    def mcts(self, estado_inicial: ConnectState, simulaciones: int, c: float):
+    def mcts(self, estado_inicial: ConnectState, simulaciones: int, c: float, limite=None):
         # Implementación simple de MCTS 
         # Se cambia la distribucion en el numero de simulaciones para que el aprendizaje sea mayor
+        # limite: instante (time.perf_counter) en que se dejan de lanzar simulaciones aunque no se hayan hecho todas
 
         Qm = {} 
         Nm = {} 
         Ns = {} 
 
         def clave_nodo(st):
-            # Clave única (tablero, jugador)
-            return (tuple(map(tuple, st.board)), st.player) 
+            # Clave Zobrist del tablero (el jugador queda implícito en el número de fichas)
+            # y si corresponde al espejo, para reflejar las acciones
+            if self.simetria:
+                return canonical_key(st)
+            return st.key, False
 
         #Formula del UCT 
         def valor_uct(estado, accion):
@@ -130,13 +181,22 @@ class OhYes(Policy):
             #Formula UCT: Explotacion (Q/N) + Exploracion (c*sqrt(log(Ns) / N))
             return (Qm[(estado, accion)] / Nm[(estado, accion)]) + c * np.sqrt(np.log(Ns[estado] + 1) / Nm[(estado, accion)])
 
+        # Copia de trabajo que se modifica con push y se restaura con pop
+        trabajo = ConnectState(estado_inicial.board, estado_inicial.player) if self.busqueda_en_sitio else None
+
         for _ in range(simulaciones):
-            estado_actual = estado_inicial
+            # Con reloj se para al llegar al limite, también antes de la primera simulación
+            # (una simulación lanzada después del limite puede pasarse del reloj)
+            if limite is not None and time.perf_counter() >= limite:
+                break
+            self.simulaciones_hechas += 1
+            estado_actual = trabajo if trabajo is not None else estado_inicial
             visitados = []
+            jugadas = 0
             
             # SELECCIÓN + EXPANSIÓN
             while True:
-                clave_est = clave_nodo(estado_actual)
+                clave_est, espejo = clave_nodo(estado_actual)
                 libres = list(estado_actual.get_free_cols())
 
                 if estado_actual.is_final() or not libres:
@@ -145,15 +205,19 @@ class OhYes(Policy):
                 if clave_est not in Ns:
                     Ns[clave_est] = 0
                     for a in libres:
-                        Nm[(clave_est, a)] = 0
-                        Qm[(clave_est, a)] = 0.0
+                        Nm[(clave_est, orient_action(a, espejo))] = 0
+                        Qm[(clave_est, orient_action(a, espejo))] = 0.0
                     break 
                 # Selección si el nodo ya existe
-                mejor_acc = max(libres, key=lambda a: valor_uct(clave_est, a))
-                visitados.append((clave_est, mejor_acc))
+                mejor_acc = max(libres, key=lambda a: valor_uct(clave_est, orient_action(a, espejo)))
+                visitados.append((clave_est, orient_action(mejor_acc, espejo)))
                 
                 try:
-                    estado_actual = estado_actual.transition(mejor_acc)
+                    if trabajo is not None:
+                        estado_actual.push(mejor_acc)
+                        jugadas += 1
+                    else:
+                        estado_actual = estado_actual.transition(mejor_acc)
                 except ValueError:
                     break
             
@@ -167,7 +231,11 @@ class OhYes(Policy):
                 # Politica del rollout: Eficiencia minima (elección aleatoria)
                 a = libres[self.rng.choice(len(libres))] # Rollout aleatorio simple
                 try:
-                    estado_sim = estado_sim.transition(a)
+                    if trabajo is not None:
+                        estado_sim.push(a)
+                        jugadas += 1
+                    else:
+                        estado_sim = estado_sim.transition(a)
                 except ValueError:
                     break
 
@@ -176,21 +244,28 @@ class OhYes(Policy):
             #La recompensa en este caso llega a ser relativa al jugador que inició el MCTS
             recompensa = 1 if ganador == estado_inicial.player else -1 if ganador == -estado_inicial.player else 0
 
+            # Deshacer las jugadas de la simulación
+            for _ in range(jugadas):
+                trabajo.pop()
+
             # BACKPROPAGATION
             for (est, a) in visitados:
                 Nm[(est, a)] += 1
                 Qm[(est, a)] += recompensa
                 Ns[est] += 1
 
+        self.nodos_mcts = len(Ns) # Tamaño del arbol construido
+
         # RESULTADO (Explotación Pura)
-        clave_raiz = clave_nodo(estado_inicial)
+        clave_raiz, espejo_raiz = clave_nodo(estado_inicial)
         libres = list(estado_inicial.get_free_cols())
         valores = np.full(7, -float('inf')) 
         
         for a in libres:
-            if (clave_raiz, a) in Nm and Nm[(clave_raiz, a)] > 0: 
+            nodo = (clave_raiz, orient_action(a, espejo_raiz))
+            if nodo in Nm and Nm[nodo] > 0: 
                 #Promedio de recompensas (mejor estimación Q(s,a))
-                valores[a] = Qm[(clave_raiz, a)] / Nm[(clave_raiz, a)] 
+                valores[a] = Qm[nodo] / Nm[nodo] 
             else:
                 valores[a] = 0.0 #Valor constante para acciones sin probar
 
@@ -201,15 +276,18 @@ class OhYes(Policy):
     
     def act(self, board: np.ndarray) -> int:
 
-        estado = self.clave_estado(board)
+        self.simulaciones_hechas = 0
+        self.nodos_mcts = 0
+
+        estado, espejo = self.clave_y_orientacion(board) # Con simetria las acciones se guardan en orientacion canonica
         self.verificar_estado(estado)
-        libres = list(ConnectState(board=board, player=self.player).get_free_cols())
+        state = ConnectState(board=board, player=self.player) # Una sola conversión del tablero recibido
+        libres = list(state.get_free_cols())
 
         # 1. Actualización de Q-learning del turno anterior
         if self.estado_anterior is not None:
             # Lógica de recompensa 
-            current_state = ConnectState(board=board, player=self.player)
-            w = current_state.get_winner()
+            w = state.get_winner()
             recompensa = -1 if w == self.player else 1 if w == -self.player else 0
             self.actualizar_Q(self.estado_anterior, self.accion_anterior, recompensa, estado)
 
@@ -218,21 +296,37 @@ class OhYes(Policy):
 
         # 2. HEURÍSTICA DE VICTORIA INMEDIATA 
         if self.nivel_actual >= 1:
-            acc_ganadora = self.accion_ganadora(ConnectState(board=board, player=self.player))
+            acc_ganadora = self.accion_ganadora(state)
             if acc_ganadora is not None:
                 accion = acc_ganadora
                 self.estado_anterior = estado
-                self.accion_anterior = accion
+                self.accion_anterior = orient_action(accion, espejo)
                 return accion
 
-        # 3. MCTS o Q-learning
+        # 3. Final de partida: jugada perfecta del solver, si la encuentra a tiempo
+        # (el solver deduce el turno del numero de fichas, no de self.player)
+        if np.count_nonzero(board == 0) <= self.casillas_para_resolver and not state.is_final():
+            resultado = solver.solve_board(
+                board,
+                max_nodes=self.NODOS_RESOLVER,
+                deadline=None if self.deadline is None else self.deadline - self.RESERVA_TIEMPO,
+            )
+            if resultado.exact:
+                self.estado_anterior = estado
+                self.accion_anterior = orient_action(resultado.move, espejo)
+                return resultado.move
+
+        # 4. MCTS o Q-learning
         
         if self.nivel_actual == 2:
             # MCTS (Nivel 2)
-            state = ConnectState(board=board, player=self.player)
             valores_mcts = self.mcts(state, 
                                      simulaciones=self.simulaciones_mcts, 
-                                     c=self.uct_c) 
+                                     c=self.uct_c,
+                                     limite=None if self.deadline is None else self.deadline - self.RESERVA_TIEMPO) 
+            if self.simulaciones_hechas == 0:
+                # Sin tiempo para ninguna simulación los valores son todos 0: se juega la columna libre más central
+                valores_mcts = -np.abs(np.arange(7) - 3).astype(float)
             # Selecciona la mejor acción MCTS
             accion = int(max(libres, key=lambda a: valores_mcts[a]))
             
@@ -251,15 +345,15 @@ class OhYes(Policy):
                 mejor_valor = -float('inf')
                 mejor_accion = libres[0]
                 for a in libres:
-                    if q_valores[a] > mejor_valor:
-                        mejor_valor = q_valores[a]
+                    if q_valores[orient_action(a, espejo)] > mejor_valor:
+                        mejor_valor = q_valores[orient_action(a, espejo)]
                         mejor_accion = a
                 accion = mejor_accion
 
 
-        # 4. Guardar estado y retornar
+        # 5. Guardar estado y retornar
         self.estado_anterior = estado
-        self.accion_anterior = accion
+        self.accion_anterior = orient_action(accion, espejo)
         return accion
 
     
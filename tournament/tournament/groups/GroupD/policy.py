@@ -0,0 +1,44 @@
+import numpy as np
+import time
+from connect4.policy import Policy
+from connect4 import solver
+
+
+class Perfecto(Policy):
+    #agente que juega la jugada perfecta del solver exacto (connect4.solver) cuando logra resolver la
+    #posicion dentro del tiempo de la jugada; si no, juega la jugada heuristica que devuelve el solver
+    #(ganar ya, bloquear, o la jugada que no pierde y deja mas amenazas). Al principio de la partida
+    #casi nunca alcanza a resolver; desde unas 28 casillas vacias resuelve en pocos segundos
+
+    RESERVA_TIEMPO = 0.01 #segundos antes del limite en que se corta el solver, para alcanzar a devolver la jugada
+
+    def __init__(self, tiempo_por_jugada: float | None = 1.0, max_nodos: int | None = None):
+        self.tiempo_por_jugada = tiempo_por_jugada #presupuesto propio por jugada (None = sin limite de tiempo)
+        self.max_nodos = max_nodos #posiciones que puede visitar el solver por jugada (None = sin limite)
+        self.solver = solver.Solver() #su tabla de transposicion se conserva entre jugadas y partidas
+        self.nodos = 0
+        self.resuelta = False #si la ultima jugada fue exacta
+
+    def mount(self, timeout=None):
+        if timeout is not None:
+            #con reloj del torneo, el presupuesto propio no puede pasarse del tiempo por jugada
+            self.tiempo_por_jugada = timeout if self.tiempo_por_jugada is None else min(self.tiempo_por_jugada, timeout)
+
+    def act(self, board: np.ndarray) -> int:
+        state = solver.state_from_board(board)
+
+        #el limite es el del reloj del torneo o el presupuesto propio, el que llegue antes
+        limites = []
+        if self.deadline is not None:
+            limites.append(self.deadline)
+        if self.tiempo_por_jugada is not None:
+            limites.append(time.perf_counter() + self.tiempo_por_jugada)
+        limite = min(limites) - self.RESERVA_TIEMPO if limites else None
+
+        resultado = self.solver.solve(state, max_nodes=self.max_nodos, deadline=limite)
+        self.nodos = resultado.nodes
+        self.resuelta = resultado.exact
+        return resultado.move
+
+    def search_stats(self):
+        return {"nodes": self.nodos, "solved": float(self.resuelta)}
@@ -0,0 +1,66 @@
+import json
+import os
+from pathlib import Path
+
+
+class TournamentJournal:
+    """
+    Durable progress journal of a bracket, one JSON record per line.
+
+    The first line holds the tournament configuration (participant names,
+    seeds, match settings); every following line is one finished match,
+    appended and synced to disk as soon as its winner is known::
+
+        {"config": {"players": ["GroupA", "GroupB"], "seed": 911, ...}}
+        {"round": 1, "player_a": "GroupA", "player_b": "GroupB", "winner": "GroupB"}
+
+    The bracket itself is not stored: it follows from the configuration and
+    the winners, so reopening a journal and replaying the rounds with the
+    recorded results rebuilds it exactly.
+    """
+
+    def __init__(self, path: str | Path, config: dict):
+        self.path = Path(path)
+        self.config = config
+        self.results: dict[tuple[int, str, str], str] = {}
+
+        if self.path.exists() and self.path.stat().st_size > 0:
+            lines = self.path.read_bytes().splitlines(keepends=True)
+            header = json.loads(lines[0])
+            if header["config"] != config:
+                raise ValueError(
+                    f"Journal {self.path} was written for a different tournament "
+                    "configuration; remove it or use another path."
+                )
+            valid = len(lines[0])
+            for line in lines[1:]:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    record = json.loads(line)
+                except ValueError:
+                    # Partial line from an interrupted write: drop it
+                    with open(self.path, "r+b") as f:
+                        f.truncate(valid)
+                    break
+                valid += len(line)
+                key = (record["round"], record["player_a"], record["player_b"])
+                self.results[key] = record["winner"]
+        else:
+            self._append({"config": config})
+
+    def winner(self, round_number: int, a_name: str, b_name: str) -> str | None:
+        """Recorded winner of a match, or None if it has not finished."""
+        return self.results.get((round_number, a_name, b_name))
+
+    def record(self, round_number: int, a_name: str, b_name: str, winner: str) -> None:
+        self.results[(round_number, a_name, b_name)] = winner
+        self._append(
+            {"round": round_number, "player_a": a_name, "player_b": b_name, "winner": winner}
+        )
+
+    def _append(self, record: dict) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,169 @@
+import math
+from connect4.dtos import GameResult
+import numpy as np
+
+# Elo points per natural-log unit of Bradley-Terry strength
+ELO_SCALE = 400 / np.log(10)
+
+
+class RatingTable:
+    """
+    Ratings of a fixed set of players, updated one game at a time.
+
+    Two estimates are kept: a running Elo rating (order dependent, cheap) and
+    a Bradley-Terry fit of all the games played so far, reported on the Elo
+    scale with a 95% confidence interval. Draws count as half a win for each
+    side.
+    """
+
+    def __init__(self, names: list[str], initial: float = 1500.0, k: float = 16.0):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.initial = initial
+        self.k = k
+        self.elo = np.full(len(self.names), initial)
+        # wins[i, j]: points scored by i against j; games[i, j]: games between them
+        self.wins = np.zeros((len(self.names), len(self.names)))
+        self.games = np.zeros((len(self.names), len(self.names)))
+
+    def update(self, result: GameResult) -> None:
+        """Add the result of one game."""
+        i, j = self.index[result.player_a], self.index[result.player_b]
+        score = result.score_a
+        expected = 1 / (1 + 10 ** ((self.elo[j] - self.elo[i]) / 400))
+        self.elo[i] += self.k * (score - expected)
+        self.elo[j] -= self.k * (score - expected)
+        self.wins[i, j] += score
+        self.wins[j, i] += 1 - score
+        self.games[i, j] += 1
+        self.games[j, i] += 1
+
+    def scores(self) -> np.ndarray:
+        """Total points of each player."""
+        return self.wins.sum(axis=1)
+
+    def bradley_terry(self, iterations: int = 200, tol: float = 1e-9) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Bradley-Terry ratings and their standard errors, on the Elo scale.
+
+        Fitted by minorization-maximization with one virtual draw added to
+        every pairing that was played, which keeps the estimate finite for
+        unbeaten or winless players. Ratings are centered on ``initial``.
+        """
+        played = self.games > 0
+        wins = self.wins + 0.5 * played
+        games = self.games + played
+        strength = np.ones(len(self.names))
+        total_wins = wins.sum(axis=1)
+        for _ in range(iterations):
+            denom = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+            new = np.where(denom > 0, total_wins / np.where(denom > 0, denom, 1), 1.0)
+            new /= np.exp(np.log(new).mean())
+            converged = np.abs(new - strength).max() < tol
+            strength = new
+            if converged:
+                break
+
+        theta = np.log(strength)
+        # Fisher information of the log-strengths; its pseudo-inverse is the
+        # covariance under the zero-mean constraint
+        p = strength[:, None] * strength[None, :] / (strength[:, None] + strength[None, :]) ** 2
+        info = -games * p
+        np.fill_diagonal(info, 0)
+        np.fill_diagonal(info, -info.sum(axis=1))
+        covariance = np.linalg.pinv(info)
+        stderr = np.sqrt(np.clip(np.diag(covariance), 0, None))
+        return self.initial + ELO_SCALE * (theta - theta.mean()), ELO_SCALE * stderr
+
+    def table(self) -> list[dict]:
+        """Rows sorted by Bradley-Terry rating, with a 95% interval."""
+        bt, stderr = self.bradley_terry()
+        rows = [
+            {
+                "player": name,
+                "games": int(self.games[i].sum()),
+                "score": float(self.scores()[i]),
+                "elo": round(float(self.elo[i]), 1),
+                "bt": round(float(bt[i]), 1),
+                "ci_low": round(float(bt[i] - 1.96 * stderr[i]), 1),
+                "ci_high": round(float(bt[i] + 1.96 * stderr[i]), 1),
+            }
+            for i, name in enumerate(self.names)
+        ]
+        return sorted(rows, key=lambda row: row["bt"], reverse=True)
+
+    def __str__(self) -> str:
+        lines = [f"{'player':<12}{'games':>6}{'score':>7}{'elo':>8}{'bt':>8}   95% CI"]
+        for row in self.table():
+            lines.append(
+                f"{row['player']:<12}{row['games']:>6}{row['score']:>7.1f}{row['elo']:>8.1f}"
+                f"{row['bt']:>8.1f}   [{row['ci_low']:.1f}, {row['ci_high']:.1f}]"
+            )
+        return "\n".join(lines)
+
+
+def elo_from_score(score: float) -> float:
+    """Elo difference that predicts an expected ``score`` (0 to 1)."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+def score_from_elo(elo: float) -> float:
+    """Expected score of a player ``elo`` points stronger than its opponent."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def score_interval(wins: int, draws: int, losses: int, z: float = 1.96) -> tuple[float, float, float]:
+    """
+    Mean score of a series of games and its confidence interval.
+
+    The interval is the normal approximation of the trinomial (win, draw,
+    loss) distribution, ``z`` standard errors around the mean (1.96 for 95%),
+    clipped to [0, 1].
+    """
+    n = wins + draws + losses
+    if n == 0:
+        return 0.5, 0.0, 1.0
+    score = (wins + 0.5 * draws) / n
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score**2) / n
+    half = z * math.sqrt(variance / n)
+    return score, max(score - half, 0.0), min(score + half, 1.0)
+
+
+class SPRT:
+    """
+    Sequential probability ratio test between two Elo differences.
+
+    Tests H0: the difference is ``elo0`` against H1: it is ``elo1``, with
+    false positive rate ``alpha`` and false negative rate ``beta``. The
+    log-likelihood ratio uses the normal approximation of the trinomial
+    game outcomes (generalized SPRT), so draws are accounted for without a
+    draw model. One virtual game, half a win and half a loss, keeps the
+    variance positive after a run of identical results.
+    """
+
+    def __init__(self, elo0: float = 0.0, elo1: float = 50.0, alpha: float = 0.05, beta: float = 0.05):
+        if elo1 <= elo0:
+            raise ValueError(f"elo1 ({elo1}) must be greater than elo0 ({elo0})")
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    def llr(self, wins: int, draws: int, losses: int) -> float:
+        """Log-likelihood ratio of H1 against H0 after the given results."""
+        w, d, l = wins + 0.5, draws, losses + 0.5
+        n = w + d + l
+        score = (w + 0.5 * d) / n
+        variance = (w * (1 - score) ** 2 + d * (0.5 - score) ** 2 + l * score**2) / n
+        s0, s1 = score_from_elo(self.elo0), score_from_elo(self.elo1)
+        return n * (s1 - s0) * (2 * score - s0 - s1) / (2 * variance)
+
+    def verdict(self, wins: int, draws: int, losses: int) -> str | None:
+        """``"H1"`` or ``"H0"`` once the ratio crosses a bound, None while undecided."""
+        llr = self.llr(wins, draws, losses)
+        if llr >= self.upper:
+            return "H1"
+        if llr <= self.lower:
+            return "H0"
+        return None
@@ -0,0 +1,112 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator
+from connect4.clock import GameClock, mount_policy
+from connect4.dtos import GameResult, Participant, TimeControl
+from connect4.policy import Policy
+from tournament import play_game
+
+
+# Mounted policies of this process, reused by every game it plays
+_INSTANCES: dict[tuple[str, type, TimeControl | None], Policy] = {}
+
+
+def mounted_policy(participant: Participant, time_control: TimeControl | None = None) -> Policy:
+    """
+    The participant's policy, constructed and mounted on first use in this
+    process and reset for a new game on every call.
+    """
+    name, policy = participant
+    key = (name, policy, time_control)
+    if key not in _INSTANCES:
+        _INSTANCES[key] = policy()
+        mount_policy(_INSTANCES[key], time_control)
+    instance = _INSTANCES[key]
+    instance.reset()
+    return instance
+
+
+def play_scheduled_game(
+    a: Participant,
+    b: Participant,
+    a_first: bool,
+    time_control: TimeControl | None = None,
+) -> GameResult:
+    """Play one game between ``a`` and ``b`` with this process's mounted policies."""
+    a_name, b_name = a[0], b[0]
+    a_instance = mounted_policy(a, time_control)
+    b_instance = mounted_policy(b, time_control)
+    if a_first:
+        first_name, first_policy, second_policy = a_name, a_instance, b_instance
+    else:
+        first_name, first_policy, second_policy = b_name, b_instance, a_instance
+
+    clock = GameClock(time_control) if time_control is not None else None
+    winner, moves = play_game(first_policy, second_policy, clock)
+    if winner == 0:
+        winner_name = None
+    elif (winner == -1) == (first_name == a_name):
+        winner_name = a_name
+    else:
+        winner_name = b_name
+    return GameResult(
+        player_a=a_name,
+        player_b=b_name,
+        a_first=a_first,
+        winner=winner_name,
+        moves=moves,
+        times=clock.times if clock is not None else [],
+        overruns=clock.overruns if clock is not None else [],
+    )
+
+
+class GameScheduler:
+    """
+    Play individual games, the unit of work, on a pool of worker processes.
+
+    Every game of every pairing is queued at once, so the pool stays busy
+    until the last game instead of waiting for the slowest match of a round.
+    Without ``workers`` the games are played inline, in submission order.
+    Every game is played under ``time_control``, if given.
+    """
+
+    def __init__(self, workers: int | None = None, time_control: TimeControl | None = None):
+        self.workers = workers
+        self.time_control = time_control
+        self._executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+
+    def run(
+        self, games: Iterable[tuple[Participant, Participant, bool]]
+    ) -> Iterator[GameResult]:
+        """
+        Yield the result of each ``(a, b, a_first)`` game as soon as it completes.
+
+        Closing the generator early (e.g. ``break`` out of the loop) cancels
+        the games that have not started yet.
+        """
+        if self._executor is None:
+            for a, b, a_first in games:
+                yield play_scheduled_game(a, b, a_first, self.time_control)
+            return
+
+        pending: set[Future] = {
+            self._executor.submit(play_scheduled_game, a, b, a_first, self.time_control)
+            for a, b, a_first in games
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "GameScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
@@ -0,0 +1,205 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from connect4.dtos import GameResult, Participant, TimeControl
+from connect4.policy import Policy
+from connect4.utils import find_importable_classes
+from ratings import SPRT, elo_from_score, score_interval
+from scheduler import GameScheduler
+import numpy as np
+
+
+class HeadToHead:
+    """
+    Running totals of a head-to-head series, seen from player ``a``.
+
+    Counts wins, draws and losses (overall and by color) and the seconds of
+    every move of each player, taken from the games' clocks.
+    """
+
+    def __init__(self, a: str, b: str):
+        self.a = a
+        self.b = b
+        self.wins = self.draws = self.losses = 0
+        # (wins, draws, losses) of a as first and as second player
+        self.by_color = {True: [0, 0, 0], False: [0, 0, 0]}
+        self.move_times: dict[str, list[float]] = {a: [], b: []}
+        self.overruns: dict[str, int] = {a: 0, b: 0}
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    def update(self, result: GameResult) -> None:
+        outcome = 1 if result.winner is None else (0 if result.winner == self.a else 2)
+        if outcome == 0:
+            self.wins += 1
+        elif outcome == 1:
+            self.draws += 1
+        else:
+            self.losses += 1
+        self.by_color[result.a_first][outcome] += 1
+
+        first, second = (self.a, self.b) if result.a_first else (self.b, self.a)
+        self.move_times[first].extend(result.times[0::2])
+        self.move_times[second].extend(result.times[1::2])
+        for ply in result.overruns:
+            self.overruns[first if ply % 2 == 0 else second] += 1
+
+    def progress(self, elapsed: float) -> str:
+        score, low, high = score_interval(self.wins, self.draws, self.losses)
+        return (
+            f"+{self.wins} ={self.draws} -{self.losses}  "
+            f"score {score:.3f} [{low:.3f}, {high:.3f}]  "
+            f"Elo {elo_from_score(score):+.0f}  "
+            f"{self.games / elapsed:.2f} games/s"
+        )
+
+    def report(self, elapsed: float) -> str:
+        score, low, high = score_interval(self.wins, self.draws, self.losses)
+        lines = [
+            f"{self.a} vs {self.b}: {self.games} games in {elapsed:.1f}s ({self.games / elapsed:.2f} games/s)",
+            f"  W/D/L   {self.wins}/{self.draws}/{self.losses}",
+            f"  as first  {'/'.join(map(str, self.by_color[True]))}"
+            f"   as second  {'/'.join(map(str, self.by_color[False]))}",
+            f"  score   {score:.3f}  95% CI [{low:.3f}, {high:.3f}]",
+            f"  Elo     {elo_from_score(score):+.1f}  95% CI "
+            f"[{elo_from_score(low):+.1f}, {elo_from_score(high):+.1f}]",
+            f"  {'move latency (ms)':<18}{'moves':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'overruns':>10}",
+        ]
+        for name, times in self.move_times.items():
+            if not times:
+                continue
+            ms = np.asarray(times) * 1e3
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            lines.append(
+                f"  {name:<18}{ms.size:>7}{ms.mean():>9.2f}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}"
+                f"{ms.max():>9.2f}{self.overruns[name]:>10}"
+            )
+        return "\n".join(lines)
+
+
+def simulate(
+    a: Participant,
+    b: Participant,
+    games: int = 100,
+    workers: int | None = None,
+    time_control: TimeControl | None = None,
+    sprt: SPRT | None = None,
+    every: int = 10,
+    log: str | Path | None = None,
+) -> HeadToHead:
+    """
+    Play a head-to-head series between two participants.
+
+    Colors alternate from one game to the next, and all the games are queued
+    at once on a ``GameScheduler``. Results are counted as they complete.
+
+    Parameters
+    ----------
+    a, b : Participant
+        The (name, policy) tuples; results are reported from ``a``'s side.
+    games : int, optional
+        Maximum number of games (default is 100).
+    workers : int, optional
+        Number of worker processes (default is None, which plays the games
+        one after another).
+    time_control : TimeControl, optional
+        Clock enforced on every move (default is None, untimed). Moves are
+        timed either way.
+    sprt : SPRT, optional
+        Sequential test checked after every game; the series stops, and the
+        games not started yet are cancelled, once it reaches a verdict
+        (default is None, which plays every game).
+    every : int, optional
+        Print a progress line every ``every`` games (default is 10; 0 for
+        none).
+    log : str or Path, optional
+        JSONL file that receives every ``GameResult`` as it completes.
+
+    Returns
+    -------
+    HeadToHead
+        Totals of the games played.
+    """
+    totals = HeadToHead(a[0], b[0])
+    schedule = [(a, b, g % 2 == 0) for g in range(games)]
+    # An untimed clock still measures every move
+    time_control = time_control or TimeControl()
+    log_file = open(log, "w") if log is not None else None
+    verdict = None
+    start = time.perf_counter()
+    try:
+        with GameScheduler(workers, time_control) as scheduler:
+            for result in scheduler.run(schedule):
+                totals.update(result)
+                if log_file is not None:
+                    log_file.write(result.model_dump_json() + "\n")
+                    log_file.flush()
+                if sprt is not None:
+                    verdict = sprt.verdict(totals.wins, totals.draws, totals.losses)
+                if every and (totals.games % every == 0 or verdict is not None):
+                    line = f"[{totals.games}/{games}] {totals.progress(time.perf_counter() - start)}"
+                    if sprt is not None:
+                        line += f"  LLR {sprt.llr(totals.wins, totals.draws, totals.losses):.2f}"
+                        line += f" [{sprt.lower:.2f}, {sprt.upper:.2f}]"
+                    print(line, flush=True)
+                if verdict is not None:
+                    break
+            # Before the scheduler waits for the games still running
+            elapsed = time.perf_counter() - start
+    finally:
+        if log_file is not None:
+            log_file.close()
+
+    print(totals.report(elapsed))
+    if sprt is not None:
+        held = {"H1": sprt.elo1, "H0": sprt.elo0}
+        if verdict is None:
+            print(f"  SPRT    no verdict after {totals.games} games")
+        else:
+            print(f"  SPRT    {verdict} accepted (Elo {held[verdict]:+g}) after {totals.games} games")
+    return totals
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python simulate.py",
+        description="Play many games between two policies of groups/ and compare their strength.",
+    )
+    parser.add_argument("a", help="group of the first policy, e.g. GroupA")
+    parser.add_argument("b", help="group of the second policy")
+    parser.add_argument("-n", "--games", type=int, default=100, help="maximum number of games")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: inline)")
+    parser.add_argument("--per-move", type=float, default=None, help="seconds per move")
+    parser.add_argument("--per-game", type=float, default=None, help="seconds per game and player")
+    parser.add_argument("--on-overrun", choices=("fallback", "forfeit"), default="fallback")
+    parser.add_argument("--sprt", action="store_true", help="stop once the SPRT reaches a verdict")
+    parser.add_argument("--elo0", type=float, default=0.0, help="SPRT null hypothesis, Elo of a over b")
+    parser.add_argument("--elo1", type=float, default=50.0, help="SPRT alternative hypothesis")
+    parser.add_argument("--alpha", type=float, default=0.05, help="SPRT false positive rate")
+    parser.add_argument("--beta", type=float, default=0.05, help="SPRT false negative rate")
+    parser.add_argument("--every", type=int, default=10, help="games between progress lines (0: none)")
+    parser.add_argument("--log", type=Path, default=None, help="JSONL file of the game results")
+    args = parser.parse_args(argv)
+
+    participants = find_importable_classes("groups", Policy)
+    for group in (args.a, args.b):
+        if group not in participants:
+            parser.error(f"unknown policy {group!r}; found: {', '.join(sorted(participants))}")
+    a = (args.a, participants[args.a])
+    # Self-play: a second name, so that each side gets its own instance
+    b = (args.b if args.b != args.a else f"{args.b}'", participants[args.b])
+
+    time_control = None
+    if args.per_move is not None or args.per_game is not None:
+        time_control = TimeControl(per_move=args.per_move, per_game=args.per_game, on_overrun=args.on_overrun)
+    sprt = SPRT(args.elo0, args.elo1, args.alpha, args.beta) if args.sprt else None
+
+    simulate(a, b, args.games, args.workers, time_control, sprt, args.every, args.log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 import importlib.util
 
@@ -183,6 +182,9 @@ def medir_curva(n_partidas=200, batch=5):
     print("="*60)
     
     # ===== GRAFICAR =====
+    # matplotlib se importa solo aqui para que importar este modulo no lo cargue
+    import matplotlib.pyplot as plt
+
     fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))  # CAMBIADO: 3 gráficas
     
     # ----- Gráfica 1: Win Rate -----
@@ -0,0 +1,47 @@
+import numpy as np
+
+from connect4 import lines
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha, EvaluadorIncremental
+
+
+def full_score(state: ConnectState, player: int) -> int:
+    """The evaluation before the incremental one: two scans of the lines, seen by ``player``."""
+    score = lines.count_open_threes(state.board, player) * 10
+    score -= lines.count_open_threes(state.board, -player) * 10
+    return score + int(np.sum(state.board[:, 3] == player)) * 3
+
+
+def assert_matches(state: ConnectState, evaluator: EvaluadorIncremental) -> None:
+    red, yellow = lines.open_three_counts(state.board)
+    assert (red, yellow) == (lines.count_open_threes(state.board, -1), lines.count_open_threes(state.board, 1))
+    agent = Aha()
+    for player in (-1, 1):
+        assert evaluator.puntaje(player) == full_score(state, player)
+        # Aha.evaluate reads the incremental evaluator when it follows the state
+        agent.jugador = player
+        agent.evaluador = evaluator
+        incremental = agent.evaluate(state)
+        agent.evaluador = None
+        assert incremental == agent.evaluate(state)
+
+
+def test_incremental_score_matches_full_evaluation():
+    rng = np.random.default_rng(911)
+    for _ in range(60):
+        state = ConnectState()
+        evaluator = EvaluadorIncremental(state)
+        played = 0
+        while not state.is_final():
+            # Mostly forward, sometimes back, so that pops of every depth are exercised
+            if played and rng.random() < 0.3:
+                row, col = state.last_move
+                evaluator.quitar(row * 7 + col, -state.player)
+                state.pop()
+                played -= 1
+            else:
+                state.push(int(rng.choice(state.get_free_cols())))
+                row, col = state.last_move
+                evaluator.poner(row * 7 + col, -state.player)
+                played += 1
+            assert_matches(state, evaluator)
@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from benchmarks.positions import random_positions
+from connect4.connect_state import ConnectState
+from groups.GroupA.policy import Aha
+
+POSITIONS = [ConnectState()] + random_positions(11, max_moves=24, seed=7)
+
+
+def minimax_value(state: ConnectState, depth: int) -> float:
+    agent = Aha(depth=depth)
+    agent.jugador = state.player
+    return max(agent.min_value(state.transition(col), depth - 1) for col in state.get_free_cols())
+
+
+def pruned_value(agent: Aha, state: ConnectState, depth: int) -> float:
+    # Full window after act, so the table (if any) holds the entries of the search just done
+    agent.evaluador = None
+    return agent.max_alfa_beta(ConnectState(state.board, state.player), depth, -math.inf, math.inf, 0)
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3, 4])
+@pytest.mark.parametrize("tabla_mb", [0, 4])
+def test_alpha_beta_matches_minimax(depth, tabla_mb):
+    pruned = Aha(depth=depth, poda_alfa_beta=True, tabla_mb=tabla_mb)  # one table for every position
+    for state in POSITIONS:
+        assert pruned.act(state.board) == Aha(depth=depth).act(state.board)
+        assert pruned_value(pruned, state, depth) == minimax_value(state, depth)
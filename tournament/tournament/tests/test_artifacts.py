@@ -0,0 +1,24 @@
+import os
+
+from connect4 import artifacts
+from connect4.artifacts import clear_artifacts, load_artifact
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_saved_again_replaces_the_stale_copy(tmp_path):
+    clear_artifacts()
+    path = tmp_path / "model.txt"
+    path.write_text("old")
+    assert load_artifact(path, read) == "old"
+    assert load_artifact(path, read) is load_artifact(path, read)
+
+    path.write_text("new")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_artifact(path, read) == "new"
+    assert len(artifacts._CACHE) == 1
+    clear_artifacts()
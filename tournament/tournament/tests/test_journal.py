@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from groups.GroupA.policy import Aha
+from tournament import run_tournament
+
+PLAYERS = [(f"Group{i}", Aha) for i in range(8)]
+
+
+class Interrupted(Exception):
+    pass
+
+
+class ScriptedPlay:
+    """Deterministic play function that records the matches it plays and can stop after a few."""
+
+    def __init__(self, stop_after=None):
+        self.played = []
+        self.stop_after = stop_after
+
+    def __call__(self, a, b, best_of, first_player_distribution, seed):
+        if self.stop_after is not None and len(self.played) == self.stop_after:
+            raise Interrupted()
+        self.played.append((a[0], b[0]))
+        return a if (int(a[0][-1]) * 5 + int(b[0][-1]) * 3 + seed) % 2 else b
+
+
+def recorded(path):
+    """``{(round, player_a, player_b): winner}`` of a journal file."""
+    records = [json.loads(line) for line in path.read_text().splitlines()[1:]]
+    return {(r["round"], r["player_a"], r["player_b"]): r["winner"] for r in records}
+
+
+def test_resumed_tournament_matches_uninterrupted_run(tmp_path):
+    reference_play = ScriptedPlay()
+    champion = run_tournament(PLAYERS, reference_play, journal=str(tmp_path / "reference.jsonl"))
+
+    path = tmp_path / "journal.jsonl"
+    interrupted = ScriptedPlay(stop_after=5)  # the four first-round matches and one of the second
+    with pytest.raises(Interrupted):
+        run_tournament(PLAYERS, interrupted, journal=str(path))
+
+    resumed = ScriptedPlay()
+    assert run_tournament(PLAYERS, resumed, journal=str(path)) == champion
+    assert len(resumed.played) == 2 and not set(interrupted.played) & set(resumed.played)
+    assert interrupted.played + resumed.played == reference_play.played
+    assert recorded(path) == recorded(tmp_path / "reference.jsonl")
@@ -0,0 +1,25 @@
+from functools import partial
+
+from connect4.archive import MatchArchive, convert_versus
+from connect4.match_log import read_match
+from groups.GroupA.policy import Aha
+from tournament import play
+
+
+def test_instrumented_play_then_convert_versus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "versus").mkdir()
+    a = ("Shallow", partial(Aha, depth=1))
+    b = ("Deeper", partial(Aha, depth=2))
+
+    play(a, b, best_of=3, first_player_distribution=0.5, instrument=True)
+
+    stats = tmp_path / "versus" / "stats"
+    assert (stats / "stats_Shallow_vs_Deeper.csv").exists()
+    assert (stats / "stats_Shallow_vs_Deeper.json").exists()
+    assert not list((tmp_path / "versus").glob("stats_*"))
+
+    match = read_match(tmp_path / "versus" / "match_Shallow_vs_Deeper.jsonl")
+    archive = MatchArchive(convert_versus("versus", tmp_path / "archive"))
+    assert len(archive) == len(match.games)
+    assert sorted(archive.players) == ["Deeper", "Shallow"]
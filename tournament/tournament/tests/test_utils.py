@@ -0,0 +1,88 @@
+import sys
+
+from connect4.policy import Policy
+from connect4.utils import find_importable_classes
+
+BASE = """
+from connect4.policy import Policy
+
+class Base(Policy):
+    def act(self, board):
+        return 3
+"""
+
+
+def write(path, source):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source)
+
+
+def found(root):
+    return {group: (ref.module, ref.name) for group, ref in find_importable_classes(str(root / "groups"), Policy).items()}
+
+
+def test_policy_inheriting_from_another_group(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", sys.path[:])
+    write(tmp_path / "groups" / "GroupA" / "policy.py", BASE)
+    write(tmp_path / "groups" / "GroupX" / "policy.py", (
+        "from groups.GroupA.policy import Base\n"
+        "from groups.GroupA import policy\n"
+        "\n"
+        "class Sub(Base):\n"
+        "    pass\n"
+        "\n"
+        "class Helper:\n"
+        "    pass\n"
+    ))
+    write(tmp_path / "groups" / "GroupY" / "policy.py", (
+        "from ..GroupX import policy as x\n"
+        "\n"
+        "class SubSub(x.Sub):\n"
+        "    pass\n"
+    ))
+
+    assert found(tmp_path) == {
+        "GroupA": ("groups.GroupA.policy", "Base"),
+        "GroupX": ("groups.GroupX.policy", "Sub"),
+        "GroupY": ("groups.GroupY.policy", "SubSub"),
+    }
+    # Same answer from the cached manifest
+    assert found(tmp_path)["GroupX"] == ("groups.GroupX.policy", "Sub")
+
+
+def test_policy_inheriting_from_a_module_outside_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", sys.path[:])
+    write(tmp_path / "shared_policies.py", BASE)
+    write(tmp_path / "groups" / "GroupZ" / "policy.py", (
+        "from shared_policies import Base\n"
+        "\n"
+        "class Mine(Base):\n"
+        "    pass\n"
+    ))
+
+    assert found(tmp_path) == {"GroupZ": ("groups.GroupZ.policy", "Mine")}
+
+
+def test_classes_only_named_like_a_policy_are_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", sys.path[:])
+    write(tmp_path / "groups" / "GroupW" / "policy.py", (
+        "from connect4.policy import *\n"
+        "\n"
+        "class RandomPolicy:\n"
+        "    pass\n"
+        "\n"
+        "class Exploration(RandomPolicy):\n"
+        "    pass\n"
+        "\n"
+        "class Real(Policy):\n"
+        "    pass\n"
+    ))
+    write(tmp_path / "groups" / "GroupV" / "policy.py", (
+        "class Policy:\n"
+        "    pass\n"
+        "\n"
+        "class Fake(Policy):\n"
+        "    pass\n"
+    ))
+
+    assert found(tmp_path) == {"GroupW": ("groups.GroupW.policy", "Real")}
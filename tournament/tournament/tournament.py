@@ -1,7 +1,20 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
 from typing import Callable
-from connect4.dtos import Game, Match, Participant, Versus
+from connect4.clock import GameClock, mount_policy
+from connect4.dtos import Participant, TimeControl, Versus
+from connect4.instrumentation import Instrumentation, InstrumentedPolicy
+from connect4.match_log import MatchLogger
+from connect4.policy import Policy
+from journal import TournamentJournal
 from connect4.connect_state import ConnectState
 import numpy as np
+import time
+
+# Instrumentation statistics live apart from the match logs, which
+# connect4.archive.convert_versus reads as a whole folder
+STATS_FOLDER = Path("versus/stats")
 
 
 def next_power_of_two(n: int) -> int:
@@ -27,9 +40,22 @@ def play_round(
     best_of: int,
     first_player_distribution: float,
     seed: int,
+    executor: Executor | None = None,
+    journal: TournamentJournal | None = None,
+    round_number: int = 1,
 ) -> list[Participant]:
-    """Run a round and return the list of winners (handles BYEs)."""
-    winners: list[Participant] = []
+    """
+    Run a round and return the list of winners (handles BYEs).
+
+    With an ``executor`` every match is submitted at once and the winners are
+    collected in bracket order, so the result matches the serial run. The
+    ``play`` function and the participants must then be picklable (e.g.
+    module-level policy classes, as returned by ``find_importable_classes``).
+
+    With a ``journal`` matches already recorded for ``round_number`` are not
+    played again, and every new result is recorded as soon as it is known.
+    """
+    winners: list[Participant | Future] = []
     for a, b in versus:
         if a is None and b is None:
             raise ValueError("Invalid match: two BYEs")
@@ -37,9 +63,33 @@ def play_round(
             winners.append(b)
         elif b is None:  # a advances
             winners.append(a)
+        elif journal is not None and journal.winner(round_number, a[0], b[0]) is not None:
+            winners.append(a if journal.winner(round_number, a[0], b[0]) == a[0] else b)
+        elif executor is not None:
+            winners.append(
+                executor.submit(play, a, b, best_of, first_player_distribution, seed)
+            )
         else:
-            winners.append(play(a, b, best_of, first_player_distribution, seed))
-    return winners
+            winner = play(a, b, best_of, first_player_distribution, seed)
+            if journal is not None:
+                journal.record(round_number, a[0], b[0], winner[0])
+            winners.append(winner)
+
+    # Journal the parallel matches in the order they finish
+    if journal is not None:
+        pending = {w: pair for w, pair in zip(winners, versus) if isinstance(w, Future)}
+        for future in as_completed(pending):
+            a, b = pending[future]
+            journal.record(round_number, a[0], b[0], future.result()[0])
+
+    # Map results coming back from worker processes to the original participants
+    versus_winners: list[Participant] = []
+    for (a, b), winner in zip(versus, winners):
+        if isinstance(winner, Future):
+            winner = winner.result()
+            winner = a if winner == a else b
+        versus_winners.append(winner)
+    return versus_winners
 
 
 def pair_next_round(winners: list[Participant]) -> Versus:
@@ -47,14 +97,58 @@ def pair_next_round(winners: list[Participant]) -> Versus:
     return [(winners[i], winners[i + 1]) for i in range(0, len(winners), 2)]
 
 
+def play_game(
+    first_policy: Policy, second_policy: Policy, clock: GameClock | None = None
+) -> tuple[int, list[int]]:
+    """
+    Play one game between two mounted policies.
+
+    With a ``clock`` every move is timed and the clock enforces its time
+    control; a player who forfeits on time loses the game.
+
+    Returns
+    -------
+    tuple[int, list[int]]
+        The winner (-1 for the first policy, 1 for the second, 0 for a draw)
+        and the moves of the game, from which every board can be replayed
+        (see ``connect4.match_log.game_from_moves``).
+    """
+    state = ConnectState()
+    moves: list[int] = []
+
+    while not state.is_final():
+        current_policy = first_policy if state.player == -1 else second_policy
+        if clock is None:
+            action = int(current_policy.act(state.board))
+        else:
+            action = clock.timed_act(current_policy, state)
+            if action is None:  # lost on time
+                return -state.player, moves
+        moves.append(action)
+        state = state.transition(action)
+
+    return state.get_winner(), moves
+
+
 def play(
     a: Participant,
     b: Participant,
     best_of: int,
     first_player_distribution: float,
     seed: int = 911,
+    time_control: TimeControl | None = None,
+    instrument: bool = False,
 ) -> Participant:
-    """Play a match between two participants and return the winner."""
+    """
+    Play a match between two participants and return the winner.
+
+    Each game is appended to ``versus/match_{a}_vs_{b}.jsonl`` as soon as it
+    ends; ``connect4.match_log.read_match`` rebuilds the ``Match``. With a
+    ``time_control`` the moves are timed and their times, overruns and
+    forfeits are logged too. With ``instrument`` every ``mount`` and ``act``
+    is measured, with the policies' search counters, and written to
+    ``versus/stats/stats_{a}_vs_{b}.csv`` (raw) and ``.json`` (percentiles).
+    """
     # Variables
     a_name, a_policy = a
     b_name, b_policy = b
@@ -67,66 +161,62 @@ def play(
     # Random Generator
     rng = np.random.default_rng(seed)
 
-    games: list[Game] = []
+    logger = MatchLogger(f"versus/match_{a_name}_vs_{b_name}.jsonl", a_name, b_name)
+
+    # Construct and mount agents once per match; reset() starts each game
+    a_instance, b_instance = a_policy(), b_policy()
+    if instrument:
+        instrumentation = Instrumentation()
+        a_instance = InstrumentedPolicy(a_instance, a_name, instrumentation)
+        b_instance = InstrumentedPolicy(b_instance, b_name, instrumentation)
+    mount_policy(a_instance, time_control)
+    mount_policy(b_instance, time_control)
 
     while a_wins < games_to_win and b_wins < games_to_win:
         total_games += 1
         # Decide who goes first based on the distribution
         if rng.random() < first_player_distribution:
             first_participant, second_participant = a, b
-            first_policy, second_policy = a_policy(), b_policy()
+            first_policy, second_policy = a_instance, b_instance
         else:
             first_participant, second_participant = b, a
-            first_policy, second_policy = b_policy(), a_policy()
+            first_policy, second_policy = b_instance, a_instance
 
-        # Mount agents
-        first_policy.mount()
-        second_policy.mount()
+        first_policy.reset()
+        second_policy.reset()
 
-        state = ConnectState()
-        game_history: Game = Game()
-
-        while not state.is_final():
-            current_policy = first_policy if state.player == -1 else second_policy
-            action = current_policy.act(state.board)
-            game_history.append((state.board.copy().tolist(), int(action)))
-            state = state.transition(int(action))
-
-        games.append(game_history)
+        clock = GameClock(time_control) if time_control is not None else None
+        winner, moves = play_game(first_policy, second_policy, clock)
 
         # Determine winner
-        winner = state.get_winner()
         if winner == -1:
-            if first_participant == a:
-                a_wins += 1
-            else:
-                b_wins += 1
+            winner_participant = first_participant
         elif winner == 1:
-            if second_participant == a:
-                a_wins += 1
-            else:
-                b_wins += 1
+            winner_participant = second_participant
         else:
+            winner_participant = None
+        if winner_participant is None:
             draws += 1
+        elif winner_participant == a:
+            a_wins += 1
+        else:
+            b_wins += 1
+        logger.log_game(
+            moves,
+            first=first_participant[0],
+            winner=None if winner_participant is None else winner_participant[0],
+            clock=clock,
+        )
 
         # Early stopping in case of too many draws
         if draws >= games_to_win + 5:
             break
 
-    # Save match result
-    match = Match(
-        player_a=a_name,
-        player_b=b_name,
-        player_a_wins=a_wins,
-        player_b_wins=b_wins,
-        draws=draws,
-        games=games,
-    )
-
-    # Save to file
-    match_filename = f"match_{a_name}_vs_{b_name}.json"
-    with open("versus/" + match_filename, "w") as f:
-        f.write(match.model_dump_json(indent=4))
+    logger.close()
+    if instrument:
+        STATS_FOLDER.mkdir(parents=True, exist_ok=True)
+        instrumentation.to_csv(STATS_FOLDER / f"stats_{a_name}_vs_{b_name}.csv")
+        instrumentation.to_json(STATS_FOLDER / f"stats_{a_name}_vs_{b_name}.json")
 
     if a_wins > 0 or b_wins > 0:
         return a if a_wins > b_wins else b
@@ -134,6 +224,17 @@ def play(
     return a if rng.random() < 0.5 else b
 
 
+def report_instrumentation(played: Versus) -> Instrumentation:
+    """Merge the statistics of the matches played, save and print them."""
+    instrumentation = Instrumentation()
+    for (a_name, _), (b_name, _) in played:
+        instrumentation.merge(Instrumentation.from_csv(STATS_FOLDER / f"stats_{a_name}_vs_{b_name}.csv"))
+    instrumentation.to_csv(STATS_FOLDER / "stats_tournament.csv")
+    instrumentation.to_json(STATS_FOLDER / "stats_tournament.json")
+    print(instrumentation)
+    return instrumentation
+
+
 def run_tournament(
     players: list[Participant],
     play: Callable[[Participant, Participant], Participant],
@@ -141,6 +242,10 @@ def run_tournament(
     first_player_distribution: float = 0.5,
     shuffle: bool = True,
     seed: int = 911,
+    workers: int | None = None,
+    time_control: TimeControl | None = None,
+    instrument: bool = False,
+    journal: str | None = None,
 ):
     """
     Run a tournament among the given players using the provided play function.
@@ -159,14 +264,70 @@ def run_tournament(
         Whether to shuffle initial pairings (default is True).
     seed : int, optional
         Random seed for reproducibility (default is 911).
+    workers : int, optional
+        Number of worker processes playing the matches of each round in
+        parallel (default is None, which plays them one after another).
+        Results are identical to the serial run.
+    time_control : TimeControl, optional
+        Per-move and/or per-game clock passed on to ``play`` (default is
+        None, untimed). The play function must accept a ``time_control``
+        keyword argument, as ``tournament.play`` does.
+    instrument : bool, optional
+        Measure every ``mount`` and ``act`` (default is False). Per-match
+        statistics go to ``versus/stats/`` and the whole tournament's to
+        ``versus/stats/stats_tournament.csv`` and ``.json``; the play function must
+        accept an ``instrument`` keyword argument.
+    journal : str, optional
+        Path of a progress journal (default is None, no journal). Finished
+        matches are recorded there; running again with the same players and
+        settings skips them and continues from the first unfinished match,
+        with the same results as an uninterrupted run.
 
     """
-    versus = make_initial_matches(players, shuffle=shuffle, seed=seed)
-    print("Initial Matches:", versus)
-    while True:
-        winners = play_round(versus, play, best_of, first_player_distribution, seed)
-        print("Winners this round:", winners)
-        if len(winners) == 1:  # champion decided
-            return winners[0]
-        versus = pair_next_round(winners)
-        print("Next Matches:", versus)
+    tournament_journal = None
+    if journal is not None:
+        config = {
+            "players": [name for name, _ in players],
+            "best_of": best_of,
+            "first_player_distribution": first_player_distribution,
+            "shuffle": shuffle,
+            "seed": seed,
+            "time_control": time_control.model_dump() if time_control is not None else None,
+        }
+        tournament_journal = TournamentJournal(journal, config)
+
+    if time_control is not None:
+        play = partial(play, time_control=time_control)
+    if instrument:
+        play = partial(play, instrument=True)
+    played: Versus = []
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        versus = make_initial_matches(players, shuffle=shuffle, seed=seed)
+        print("Initial Matches:", versus)
+        round_number = 1
+        while True:
+            start = time.perf_counter()
+            winners = play_round(
+                versus,
+                play,
+                best_of,
+                first_player_distribution,
+                seed,
+                executor,
+                tournament_journal,
+                round_number,
+            )
+            print(f"Round time: {time.perf_counter() - start:.1f}s")
+            print("Winners this round:", winners)
+            played += [(a, b) for a, b in versus if a is not None and b is not None]
+            if len(winners) == 1:  # champion decided
+                if instrument:
+                    report_instrumentation(played)
+                return winners[0]
+            versus = pair_next_round(winners)
+            round_number += 1
+            print("Next Matches:", versus)
+    finally:
+        if executor is not None:
+            executor.shutdown()